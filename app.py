@@ -13,18 +13,31 @@ import atexit
 import shutil
 import signal
 import subprocess
+import tempfile
+import sys
 import threading
 import mimetypes
 import webbrowser
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from functools import partial
 from io import BytesIO
 from pathlib import Path
 from werkzeug.utils import secure_filename
-from flask import Flask, render_template, request, jsonify, send_file, redirect, url_for
+from flask import Flask, Request, render_template, request, jsonify, send_file, redirect, url_for
+from flask.json.provider import DefaultJSONProvider
 from videomasa.config import int_from_env, read_app_version
-from videomasa.runtime import check_health, find_ffmpeg, prepend_executable_directory
-from videomasa.job_state import format_duration, has_active_jobs
+from videomasa.runtime import (
+    check_health,
+    find_ffmpeg,
+    find_ggml_model,
+    find_whisper_cpp,
+    prepend_executable_directory,
+)
+from videomasa import jsonio
+from videomasa.job_state import TERMINAL_JOB_STATUSES, JobStore, format_duration, has_active_jobs
+from videomasa.processes import run_with_tail
 from videomasa.security import (
     constant_time_token_match,
     cookie_path,
@@ -33,18 +46,56 @@ from videomasa.security import (
     validated_url,
 )
 from videomasa.subtitles import build_srt, parse_whisper_result
+from videomasa.transcript_cache import TranscriptCache, media_cache_key
 from videomasa.transcription import (
     LongFormTranscriptionFailure,
     TranscriptionTimeout,
     checkpoint_directory,
     cleanup_checkpoint,
+    faster_whisper_available,
+    load_whisper_model,
+    probe_audio_codec,
     probe_media_duration,
+    resolve_whisper_model,
+    transcribe_chunk_in_process,
+    transcribe_in_process,
     transcribe_long_form,
     transcribe_with_whisper,
+    transcribe_with_whisper_cpp,
+    whisper_model_loaded,
 )
 
 os.umask(0o077)
+
+
+class _JSONProvider(DefaultJSONProvider):
+    """Route jsonify and request JSON through orjson when it is installed."""
+
+    def dumps(self, obj, **kwargs):
+        return jsonio.dumps(obj, default=self.default)
+
+    def loads(self, s, **kwargs):
+        return jsonio.loads(s)
+
+
+class _UploadRequest(Request):
+    """Spool multipart file parts straight into WORK_DIR.
+
+    Werkzeug's default spools large parts to the system temp directory, so
+    saving an upload copied every byte a second time. Spooling beside the
+    job files lets /upload publish the part with a rename instead; any
+    spool left over is removed when the request ends.
+    """
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        spool = tempfile.NamedTemporaryFile("wb+", dir=WORK_DIR, prefix=".upload-", delete=False)
+        self.__dict__.setdefault("_upload_spools", []).append(spool.name)
+        return spool
+
+
 app = Flask(__name__)
+app.json = _JSONProvider(app)
+app.request_class = _UploadRequest
 
 
 def _read_app_version():
@@ -60,8 +111,13 @@ MAX_UPLOAD_BYTES = int_from_env("VIDEOMASA_MAX_UPLOAD_BYTES", 4 * 1024 * 1024 *
 MAX_COOKIE_BYTES = int_from_env("VIDEOMASA_MAX_COOKIE_BYTES", 10 * 1024 * 1024)
 MAX_URL_LENGTH = int_from_env("VIDEOMASA_MAX_URL_LENGTH", 4096)
 MAX_WORKERS = int_from_env("VIDEOMASA_MAX_WORKERS", 2)
+# Extra job workers that download queued URLs while MAX_WORKERS transcribe.
+MAX_DOWNLOAD_AHEAD = max(0, int_from_env("VIDEOMASA_MAX_DOWNLOAD_AHEAD", 2))
+JOB_WORKERS = MAX_WORKERS + MAX_DOWNLOAD_AHEAD
 MAX_PENDING_JOBS = int_from_env("VIDEOMASA_MAX_PENDING_JOBS", 8)
 MAX_RETAINED_JOBS = int_from_env("VIDEOMASA_MAX_RETAINED_JOBS", 100)
+# Jobs are dropped with their files this long after they finish; 0 keeps them.
+JOB_TTL_SECONDS = max(0, int_from_env("VIDEOMASA_JOB_TTL_SECONDS", 86_400))
 DOWNLOAD_TIMEOUT_SECONDS = max(60, int_from_env("VIDEOMASA_DOWNLOAD_TIMEOUT_SECONDS", 1800))
 TRANSCRIPTION_TIMEOUT_SECONDS = max(60, int_from_env("VIDEOMASA_TRANSCRIPTION_TIMEOUT_SECONDS", 14_400))
 LONG_FORM_THRESHOLD_SECONDS = max(60, int_from_env("VIDEOMASA_LONG_FORM_THRESHOLD_SECONDS", 1200))
@@ -70,7 +126,47 @@ LONG_FORM_PREPARATION_TIMEOUT_SECONDS = max(
     60,
     int_from_env("VIDEOMASA_LONG_FORM_PREPARATION_TIMEOUT_SECONDS", 1800),
 )
+THUMBNAIL_TIMEOUT_SECONDS = 15
+THUMBNAIL_MAX_AGE_SECONDS = 3600
+AUDIO_EXPORT_FORMATS = ("mp3", "m4a")
+WHISPER_MODELS = ("tiny", "base", "small", "medium", "large-v3")
+VALID_MODELS = frozenset(WHISPER_MODELS)
+TRUE_VALUES = frozenset({"1", "true", "yes"})
+SERVER_THREADS = max(2, int_from_env("VIDEOMASA_SERVER_THREADS", 8))
+# Event streams hold a server thread each; leave the rest for ordinary requests.
+MAX_EVENT_STREAMS = max(1, SERVER_THREADS // 2)
+EVENT_POLL_SECONDS = 1.0
+# A WSGI server only notices a closed stream when it next writes, so idle
+# streams send a comment often enough to free a departed client's thread.
+EVENT_KEEPALIVE_SECONDS = 3.0
+# "auto" transcribes in-process with faster-whisper when installed; "cli" forces the whisper CLI.
+WHISPER_BACKEND = os.environ.get("VIDEOMASA_WHISPER_BACKEND", "auto").strip().lower()
+USE_IN_PROCESS_WHISPER = WHISPER_BACKEND != "cli" and faster_whisper_available()
+WHISPER_GPU_BATCH_SIZE = max(0, int_from_env("VIDEOMASA_WHISPER_GPU_BATCH_SIZE", 16))
+WHISPER_DISTIL = os.environ.get("VIDEOMASA_WHISPER_DISTIL", "").lower() in TRUE_VALUES
+WHISPER_COMPUTE_TYPE = os.environ.get("VIDEOMASA_WHISPER_COMPUTE_TYPE", "").strip() or None
+# One in-process model per size serves every worker that might pick it concurrently.
+_load_shared_whisper_model = partial(
+    load_whisper_model,
+    num_workers=MAX_WORKERS,
+    compute_type=WHISPER_COMPUTE_TYPE,
+)
+# Model sizes loaded in the background at startup so the first job skips the load.
+WHISPER_PRELOAD_MODELS = tuple(
+    name for name in (
+        part.strip() for part in os.environ.get("VIDEOMASA_WHISPER_PRELOAD", "base").split(",")
+    ) if name in VALID_MODELS
+)
+# The whisper CLI's JSON is read once and discarded; write it to tmpfs on Linux.
+WHISPER_SCRATCH_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+# Optional hand-off of file bodies to a fronting web server: X-Sendfile
+# (Apache, lighttpd) or nginx's X-Accel-Redirect to an internal location
+# aliased to WORK_DIR. Off by default; the desktop app serves files itself.
+XACCEL_PREFIX = os.environ.get("VIDEOMASA_XACCEL_PREFIX", "").rstrip("/")
 app.config["MAX_CONTENT_LENGTH"] = MAX_UPLOAD_BYTES
+app.config["USE_X_SENDFILE"] = (
+    os.environ.get("VIDEOMASA_X_SENDFILE", "").lower() in TRUE_VALUES or bool(XACCEL_PREFIX)
+)
 
 
 class _RedactLaunchToken(logging.Filter):
@@ -88,6 +184,8 @@ logging.getLogger("werkzeug").addFilter(_RedactLaunchToken())
 
 
 FFMPEG_BIN = find_ffmpeg(__file__)
+# macOS .app builds may ship whisper.cpp (CoreML/Metal) beside ffmpeg in Resources/.
+WHISPER_CPP_BIN = find_whisper_cpp(__file__) if sys.platform == "darwin" else None
 prepend_executable_directory(FFMPEG_BIN)
 
 # ─── Startup health checks ────────────────────────────────────
@@ -124,15 +222,37 @@ for _cookie_file in COOKIES_DIR.glob("*.txt"):
     if _cookie_file.is_file() and not _cookie_file.is_symlink():
         _cookie_file.chmod(0o600)
 
+# Finished transcripts survive restarts here, keyed by media hash and model,
+# so re-running an identical file skips Whisper. 0 bytes disables the cache.
+TRANSCRIPT_CACHE_BYTES = max(0, int_from_env("VIDEOMASA_TRANSCRIPT_CACHE_BYTES", 64 * 1024 * 1024))
+CACHE_DIR = Path(os.environ.get("VIDEOMASA_CACHE_DIR", COOKIES_DIR.parent / "cache"))
+TRANSCRIPT_CACHE = (
+    TranscriptCache(CACHE_DIR / "transcripts.sqlite3", TRANSCRIPT_CACHE_BYTES)
+    if TRANSCRIPT_CACHE_BYTES
+    else None
+)
+
 # Job store: { job_id: { status, message, transcript, timestamped, download_ready, download_path, filename, ... } }
-jobs = {}
-jobs_lock = threading.RLock()
-job_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="videomasa")
+jobs = JobStore()
+jobs_lock = jobs.lock
+_audio_export_locks = {}
+job_executor = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix="videomasa")
 job_task_slots = threading.BoundedSemaphore(MAX_PENDING_JOBS)
+transcription_slots = threading.BoundedSemaphore(MAX_WORKERS)
+_event_stream_slots = threading.BoundedSemaphore(MAX_EVENT_STREAMS)
+# Side tasks a running job overlaps with its main work (thumbnail, format
+# probe, video download). Each job has at most three in flight, so this
+# bounds them at the same ceiling without spawning a thread per task.
+io_executor = ThreadPoolExecutor(max_workers=JOB_WORKERS * 3, thread_name_prefix="videomasa-io")
+# Model warm-ups queue on their own single thread: a load can take minutes
+# and must not hold an I/O slot a job's download is waiting for.
+model_loader_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="videomasa-model")
 
 
 def _shutdown_executor():
     job_executor.shutdown(wait=False, cancel_futures=True)
+    io_executor.shutdown(wait=False, cancel_futures=True)
+    model_loader_executor.shutdown(wait=False, cancel_futures=True)
 
 
 atexit.register(_shutdown_executor)
@@ -179,11 +299,12 @@ def _prune_terminal_jobs_locked():
         return
     for job_id, job in list(jobs.items()):
         if (
-            job.get("status") in {"done", "error"}
+            job.get("status") in TERMINAL_JOB_STATUSES
             and not has_active_jobs([job])
             and not job.get("retryable")
         ):
             jobs.pop(job_id, None)
+            _audio_export_locks.pop(job_id, None)
         if len(jobs) < MAX_RETAINED_JOBS:
             break
 
@@ -191,7 +312,7 @@ def _prune_terminal_jobs_locked():
 def _add_job(job_id, job):
     with jobs_lock:
         _prune_terminal_jobs_locked()
-        pending = sum(item.get("status") not in {"done", "error"} for item in jobs.values())
+        pending = sum(item.get("status") not in TERMINAL_JOB_STATUSES for item in jobs.values())
         if pending >= MAX_PENDING_JOBS:
             return False, f"Too many jobs are queued or running (limit: {MAX_PENDING_JOBS})"
         if len(jobs) >= MAX_RETAINED_JOBS:
@@ -200,6 +321,17 @@ def _add_job(job_id, job):
     return True, ""
 
 
+def _queue_position():
+    """Return how many active jobs must finish before the newest one starts."""
+    with jobs_lock:
+        active = sum(has_active_jobs([job]) for job in jobs.values())
+    return max(0, active - JOB_WORKERS)
+
+
+def _queued_message(position):
+    return f"Queued ({position} ahead)..." if position else "Queued..."
+
+
 def _submit_job(function, *args):
     if not job_task_slots.acquire(blocking=False):
         return False
@@ -218,34 +350,50 @@ def _submit_job(function, *args):
     return True
 
 # Heartbeat tracking — browser pings every 30s, server shuts down if no ping for 5 min
-_last_heartbeat = time.time()
+_last_heartbeat = time.monotonic()
+_heartbeat_event = threading.Event()
 _HEARTBEAT_TIMEOUT = 300  # seconds (5 minutes)
+_WATCHDOG_RECHECK_SECONDS = 30  # while jobs keep the server alive past the timeout
 
 
-def _find_whisper_json(source_path, job_id):
+def _find_whisper_json(source_path, output_dir):
     """Find whisper JSON output file, handling different naming conventions.
     Some whisper versions create 'input.json', others 'input.mp4.json'."""
     source = Path(source_path)
-    # 1. Standard: same stem with .json suffix (e.g. video.mp4 → video.json)
-    candidate = source.with_suffix(".json")
-    if candidate.exists():
-        return candidate
-    # 2. Appended: full filename + .json (e.g. video.mp4 → video.mp4.json)
-    candidate = source.parent / (source.name + ".json")
-    if candidate.exists():
-        return candidate
-    # 3. Fallback: search WORK_DIR for any .json starting with job_id
-    for f in WORK_DIR.iterdir():
-        if f.suffix == ".json" and f.name.startswith(job_id):
-            return f
-    # 4. Broader fallback: any .json containing the source stem
-    stem = source.stem
-    for f in WORK_DIR.iterdir():
-        if f.suffix == ".json" and stem in f.name:
-            return f
+    for name in (f"{source.stem}.json", f"{source.name}.json"):
+        candidate = Path(output_dir) / name
+        if candidate.exists():
+            return candidate
     return None
 
 
+def _downloaded_media(result):
+    """Return ``(path, title)`` from yt-dlp's ``--print after_move:`` lines.
+
+    The download commands print the JSON-quoted title and then the final
+    ``{job_id}.<ext>`` path, so no directory scan is needed to find the file.
+    """
+    lines = [line.strip() for line in (result.stdout or "").splitlines() if line.strip()]
+    if not lines:
+        return None, ""
+    downloaded = Path(lines[-1])
+    if downloaded.parent.resolve() != WORK_DIR.resolve() or not downloaded.is_file():
+        return None, ""
+    title = ""
+    if len(lines) > 1:
+        try:
+            title = json.loads(lines[-2])
+        except ValueError:
+            title = lines[-2]
+    return downloaded, title if isinstance(title, str) else ""
+
+
+def _media_filename(title, downloaded):
+    """Return the user-facing download name for a ``{job_id}.<ext>`` file."""
+    name = (title or "").replace("/", "_").replace("\\", "_").strip()
+    return f"{name or 'video-masa'}{downloaded.suffix}"
+
+
 def _store_completed_transcript(job, model, whisper_data, make_primary=True):
     """Store one model's public transcript and private subtitle timing track."""
     transcript, timestamped, segments = parse_whisper_result(whisper_data)
@@ -259,6 +407,8 @@ def _store_completed_transcript(job, model, whisper_data, make_primary=True):
     if make_primary:
         job["transcript"] = transcript
         job["timestamped"] = timestamped
+        for key in ("_seg_start", "_seg_end", "_seg_text"):
+            job.pop(key, None)
     return transcript, timestamped
 
 
@@ -269,34 +419,91 @@ def _clear_job_failure(job):
     job["resume_available"] = False
 
 
-def _begin_transcription(job, model, affect_job_status=True):
-    job.setdefault("transcripts", {})[model] = {
-        "transcript": "",
-        "timestamped": "",
-        "status": "transcribing",
-    }
-    job.setdefault("_subtitle_tracks", {}).pop(model, None)
-    if affect_job_status:
-        _clear_job_failure(job)
-        job["status"] = "transcribing"
-        job["stage"] = "transcription"
-        job["stage_started_at"] = int(time.time())
-        job["timeout_seconds"] = TRANSCRIPTION_TIMEOUT_SECONDS
-        job["message"] = (
-            "Transcribing audio... Long recordings may take time "
-            f"(limit: {format_duration(TRANSCRIPTION_TIMEOUT_SECONDS)})."
-        )
+def _begin_transcription(job_id, model, affect_job_status=True, live_segments=None):
+    job = jobs[job_id]
+    if live_segments is None:
+        live_segments = affect_job_status
+    with jobs.job_lock(job_id):
+        job.setdefault("transcripts", {})[model] = {
+            "transcript": "",
+            "timestamped": "",
+            "status": "transcribing",
+        }
+        job.setdefault("_subtitle_tracks", {}).pop(model, None)
+        if live_segments:
+            job["_seg_start"] = []
+            job["_seg_end"] = []
+            job["_seg_text"] = []
+            job["seg_version"] = 0
+        if affect_job_status:
+            _clear_job_failure(job)
+            job["status"] = "transcribing"
+            job["stage"] = "transcription"
+            job["stage_started_at"] = int(time.time())
+            job["timeout_seconds"] = TRANSCRIPTION_TIMEOUT_SECONDS
+            job["message"] = _transcribing_message()
+    jobs.touch(job_id)
+
+
+def _transcribing_message():
+    return (
+        "Transcribing audio... Long recordings may take time "
+        f"(limit: {format_duration(TRANSCRIPTION_TIMEOUT_SECONDS)})."
+    )
+
+
+@contextmanager
+def _transcription_slot(job_id, affect_job_status=True):
+    """Hold one of the MAX_WORKERS transcription slots for the enclosed decode.
+
+    Job workers outnumber the slots, so while every slot is busy the spare
+    workers keep downloading queued jobs; a finished download then waits
+    here for the next free slot.
+    """
+    if not transcription_slots.acquire(blocking=False):
+        if affect_job_status:
+            jobs.update_job(job_id, message="Waiting for a free transcription worker...")
+        transcription_slots.acquire()
+        if affect_job_status:
+            jobs.update_job(job_id, stage_started_at=int(time.time()), message=_transcribing_message())
+    try:
+        yield
+    finally:
+        transcription_slots.release()
+
+
+def _append_live_segment(job_id, segment):
+    """Publish one decoded segment so /status?since=N can stream it early.
+
+    Live segments are kept as parallel start/end/text arrays so a delta is
+    three list slices rather than a walk over per-segment dicts.
+    """
+    text = str(segment.get("text") or "").strip()
+    if not text:
+        return
+    job = jobs[job_id]
+    with jobs.job_lock(job_id):
+        job.setdefault("_seg_start", []).append(segment["start"])
+        job.setdefault("_seg_end", []).append(segment["end"])
+        job.setdefault("_seg_text", []).append(text)
+        job["seg_version"] = len(job["_seg_text"])
+    jobs.touch(job_id)
 
 
-def _update_long_form_progress(job, model, progress, affect_job_status=True):
+def _update_long_form_progress(job_id, model, progress, affect_job_status=True):
     """Expose checkpoint progress without changing the existing polling contract."""
+    job = jobs[job_id]
     progress = dict(progress)
-    job.setdefault("transcripts", {}).setdefault(model, {})["progress"] = progress
-    if not affect_job_status:
-        return
+    with jobs.job_lock(job_id):
+        job.setdefault("transcripts", {}).setdefault(model, {})["progress"] = progress
+        if affect_job_status:
+            job["progress"] = progress
+            job["resume_available"] = progress.get("completed", 0) > 0
+            job["message"] = _long_form_message(progress) or job.get("message", "")
+    jobs.touch(job_id)
 
-    job["progress"] = progress
-    job["resume_available"] = progress.get("completed", 0) > 0
+
+def _long_form_message(progress):
     phase = progress.get("phase")
     completed = progress.get("completed", 0)
     total = progress.get("total", 0)
@@ -304,75 +511,187 @@ def _update_long_form_progress(job, model, progress, affect_job_status=True):
     current = progress.get("current")
     resumed = progress.get("resumed", 0)
     if phase == "preparing":
-        job["message"] = "Preparing long recording for checkpointed transcription..."
-    elif phase == "transcribing" and total:
+        return "Preparing long recording for checkpointed transcription..."
+    if phase == "transcribing" and total:
         resume_note = f" Resumed with {resumed} saved." if resumed else ""
-        job["message"] = (
+        return (
             f"Transcribing chunk {current or completed + 1} of {total} "
             f"({percent}% checkpointed).{resume_note}"
         )
-    elif phase == "checkpointed":
-        job["message"] = f"Checkpoint saved: {completed} of {total} chunks ({percent}%)."
-    elif phase == "finalizing":
-        job["message"] = "All chunks transcribed. Rebuilding original timestamps..."
+    if phase == "checkpointed":
+        return f"Checkpoint saved: {completed} of {total} chunks ({percent}%)."
+    if phase == "finalizing":
+        return "All chunks transcribed. Rebuilding original timestamps..."
+    return None
 
 
 def _record_transcription_failure(
-    job,
+    job_id,
     model,
     message,
     code,
     elapsed_seconds,
     affect_job_status=True,
 ):
-    elapsed = max(0, int(round(elapsed_seconds)))
-    model_progress = (
-        job.get("transcripts", {}).get(model, {}).get("progress")
-        or (job.get("progress") if affect_job_status else None)
-    )
-    job.setdefault("transcripts", {})[model] = {
-        "transcript": "",
-        "timestamped": "",
-        "status": "error",
-        "error_code": code,
-        "message": message,
-        "elapsed_seconds": elapsed,
-        **({"progress": model_progress} if model_progress else {}),
-    }
-    if affect_job_status:
-        job["status"] = "error"
-        job["stage"] = "error"
-        job["message"] = message
-        job["failure_stage"] = "transcription"
-        job["failure_code"] = code
-        job["elapsed_seconds"] = elapsed
-        job["timeout_seconds"] = TRANSCRIPTION_TIMEOUT_SECONDS
-        job["retryable"] = bool(job.get("_file_path") and Path(job["_file_path"]).exists())
-        job["resume_available"] = bool(
-            job.get("progress", {}).get("mode") == "chunked"
-            and job.get("progress", {}).get("completed", 0) > 0
+    job = jobs[job_id]
+    with jobs.job_lock(job_id):
+        elapsed = max(0, int(round(elapsed_seconds)))
+        model_progress = (
+            job.get("transcripts", {}).get(model, {}).get("progress")
+            or (job.get("progress") if affect_job_status else None)
         )
+        job.setdefault("transcripts", {})[model] = {
+            "transcript": "",
+            "timestamped": "",
+            "status": "error",
+            "error_code": code,
+            "message": message,
+            "elapsed_seconds": elapsed,
+            **({"progress": model_progress} if model_progress else {}),
+        }
+        if affect_job_status:
+            job["status"] = "error"
+            job["stage"] = "error"
+            job["message"] = message
+            job["failure_stage"] = "transcription"
+            job["failure_code"] = code
+            job["elapsed_seconds"] = elapsed
+            job["timeout_seconds"] = TRANSCRIPTION_TIMEOUT_SECONDS
+            job["retryable"] = bool(job.get("_file_path") and Path(job["_file_path"]).exists())
+            job["resume_available"] = bool(
+                job.get("progress", {}).get("mode") == "chunked"
+                and job.get("progress", {}).get("completed", 0) > 0
+            )
+    jobs.touch(job_id)
 
 
-def _cleanup_whisper_outputs(source_path):
-    source = Path(source_path)
-    candidates = [source.with_suffix(ext) for ext in (".json", ".srt", ".vtt", ".txt", ".tsv")]
-    candidates.append(source.parent / f"{source.name}.json")
-    for candidate in candidates:
-        if candidate != source:
-            candidate.unlink(missing_ok=True)
+def _read_cli_whisper_output(job_id, source, model, result, elapsed, output_dir, affect_job_status=True):
+    """Return the whisper CLI's parsed JSON, or record the failure and return None."""
+    job = jobs[job_id]
+    if result.returncode != 0:
+        full_error = result.stderr or result.stdout or "unknown error"
+        message = f"Transcription failed after {format_duration(elapsed)}: {full_error[:400]}"
+        _record_transcription_failure(
+            job_id,
+            model,
+            message,
+            "process_error",
+            elapsed,
+            affect_job_status=affect_job_status,
+        )
+        print(f"[whisper error] job={job_id} rc={result.returncode}\n{full_error}", flush=True)
+        return None
 
+    json_file = _find_whisper_json(source, output_dir)
+    if not json_file:
+        hint = (result.stderr or result.stdout or "")[:300]
+        message = f"Transcription output not found. Whisper output: {hint}" if hint else "Transcription output not found."
+        _record_transcription_failure(
+            job_id,
+            model,
+            message,
+            "output_missing",
+            elapsed,
+            affect_job_status=affect_job_status,
+        )
+        return None
 
-def _transcribe_existing_file(job_id, source_path, model, make_primary=True, affect_job_status=True):
-    """Transcribe retained media with consistent timeout, logging, and state."""
+    try:
+        return jsonio.read_json_file(json_file)
+    except (OSError, ValueError) as error:
+        message = f"Transcription output could not be read: {str(error)}"
+        _record_transcription_failure(
+            job_id,
+            model,
+            message,
+            "output_invalid",
+            elapsed,
+            affect_job_status=affect_job_status,
+        )
+        return None
+
+
+def _whisper_cpp_runner(model):
+    """Return the bundled whisper.cpp runner when weights for this size ship too."""
+    if not WHISPER_CPP_BIN:
+        return None
+    model_path = find_ggml_model(__file__, model)
+    if not model_path:
+        return None
+    return partial(
+        transcribe_with_whisper_cpp,
+        whisper_cli=WHISPER_CPP_BIN,
+        model_path=model_path,
+        ffmpeg_bin=FFMPEG_BIN,
+    )
+
+
+def _effective_whisper(model):
+    """Return the backend and checkpoint that will transcribe ``model``."""
+    if _whisper_cpp_runner(model) is not None:
+        return "whisper.cpp", model
+    if USE_IN_PROCESS_WHISPER:
+        return "faster-whisper", resolve_whisper_model(model, WHISPER_DISTIL)
+    # The CLI has no distilled checkpoints; it always runs the named size.
+    return "whisper", model
+
+
+def _transcript_cache_key(source, model):
+    """Key a file's transcript by content, backend and checkpoint, or None if uncached."""
+    if TRANSCRIPT_CACHE is None:
+        return None
+    backend, checkpoint = _effective_whisper(model)
+    try:
+        return media_cache_key(source, f"{backend}/{checkpoint}")
+    except OSError:
+        return None
+
+
+def _transcribe_existing_file(
+    job_id,
+    source_path,
+    model,
+    make_primary=True,
+    affect_job_status=True,
+    live_segments=None,
+):
+    """Transcribe retained media with consistent timeout, logging, and state.
+
+    Decoded segments stream to the job's live transcript when
+    ``live_segments`` is true, which defaults to ``affect_job_status``.
+    """
     job = jobs[job_id]
     source = Path(source_path)
-    _cleanup_whisper_outputs(source)
-    _begin_transcription(job, model, affect_job_status=affect_job_status)
+    if live_segments is None:
+        live_segments = affect_job_status
+    _begin_transcription(job_id, model, affect_job_status=affect_job_status, live_segments=live_segments)
+
+    cache_key = _transcript_cache_key(source, model)
+    cached = TRANSCRIPT_CACHE.get(cache_key) if cache_key else None
+    if cached is not None:
+        with jobs.job_lock(job_id):
+            _store_completed_transcript(job, model, cached, make_primary=make_primary)
+            if affect_job_status:
+                _clear_job_failure(job)
+                job.pop("progress", None)
+                job["stage"] = "finalizing"
+        jobs.touch(job_id)
+        print(f"[transcript cache hit] job={job_id} model={model}", flush=True)
+        return True
+
+    with _transcription_slot(job_id, affect_job_status):
+        return _run_whisper(job_id, source, model, cache_key, make_primary, affect_job_status, live_segments)
+
+
+def _run_whisper(job_id, source, model, cache_key, make_primary, affect_job_status, live_segments):
+    """Decode ``source`` with the configured backend and record the outcome on the job."""
+    job = jobs[job_id]
+    whisper_cpp = _whisper_cpp_runner(model)
+    in_process = USE_IN_PROCESS_WHISPER and whisper_cpp is None
 
     duration = probe_media_duration(source, FFMPEG_BIN)
     if duration is not None:
-        job["media_duration_seconds"] = max(0, int(round(duration)))
+        jobs.update_job(job_id, media_duration_seconds=max(0, int(round(duration))))
 
     if duration is not None and duration >= LONG_FORM_THRESHOLD_SECONDS:
         checkpoint_dir = checkpoint_directory(WORK_DIR, job_id, model)
@@ -385,8 +704,18 @@ def _transcribe_existing_file(job_id, source_path, model, make_primary=True, aff
                 chunk_seconds=LONG_FORM_CHUNK_SECONDS,
                 preparation_timeout=LONG_FORM_PREPARATION_TIMEOUT_SECONDS,
                 chunk_timeout=TRANSCRIPTION_TIMEOUT_SECONDS,
+                whisper_runner=(
+                    partial(
+                        transcribe_chunk_in_process,
+                        model_loader=_load_shared_whisper_model,
+                        gpu_batch_size=WHISPER_GPU_BATCH_SIZE,
+                        distil=WHISPER_DISTIL,
+                    )
+                    if in_process
+                    else whisper_cpp or transcribe_with_whisper
+                ),
                 progress_callback=lambda progress: _update_long_form_progress(
-                    job,
+                    job_id,
                     model,
                     progress,
                     affect_job_status=affect_job_status,
@@ -418,7 +747,7 @@ def _transcribe_existing_file(job_id, source_path, model, make_primary=True, aff
                     f"{str(error)}{detail} The source was retained — choose Resume to continue."
                 )
             _record_transcription_failure(
-                job,
+                job_id,
                 model,
                 message,
                 error.code,
@@ -433,35 +762,67 @@ def _transcribe_existing_file(job_id, source_path, model, make_primary=True, aff
             )
             return False
 
-        _store_completed_transcript(
-            job,
-            model,
-            outcome.whisper_data,
-            make_primary=make_primary,
-        )
+        with jobs.job_lock(job_id):
+            _store_completed_transcript(
+                job,
+                model,
+                outcome.whisper_data,
+                make_primary=make_primary,
+            )
+            if affect_job_status:
+                _clear_job_failure(job)
+                job["progress"] = {
+                    "mode": "chunked",
+                    "phase": "done",
+                    "completed": outcome.total_chunks,
+                    "total": outcome.total_chunks,
+                    "current": None,
+                    "percent": 100,
+                    "resumed": outcome.resumed_chunks,
+                }
+                job["stage"] = "finalizing"
+                job["elapsed_seconds"] = max(0, int(round(outcome.elapsed_seconds)))
+        jobs.touch(job_id)
+        if cache_key:
+            TRANSCRIPT_CACHE.put(cache_key, outcome.whisper_data)
         cleanup_checkpoint(checkpoint_dir)
-        if affect_job_status:
-            _clear_job_failure(job)
-            job["progress"] = {
-                "mode": "chunked",
-                "phase": "done",
-                "completed": outcome.total_chunks,
-                "total": outcome.total_chunks,
-                "current": None,
-                "percent": 100,
-                "resumed": outcome.resumed_chunks,
-            }
-            job["stage"] = "finalizing"
-            job["elapsed_seconds"] = max(0, int(round(outcome.elapsed_seconds)))
         return True
 
     try:
-        result, elapsed = transcribe_with_whisper(
-            source,
-            model,
-            WORK_DIR,
-            TRANSCRIPTION_TIMEOUT_SECONDS,
-        )
+        if in_process:
+            whisper_data, elapsed = transcribe_in_process(
+                source,
+                model,
+                TRANSCRIPTION_TIMEOUT_SECONDS,
+                model_loader=_load_shared_whisper_model,
+                gpu_batch_size=WHISPER_GPU_BATCH_SIZE,
+                distil=WHISPER_DISTIL,
+                segment_callback=(
+                    partial(_append_live_segment, job_id)
+                    if live_segments
+                    else None
+                ),
+                duration=duration,
+            )
+        else:
+            # The CLI backends write a JSON sidecar; keep it in a scratch
+            # directory (tmpfs where there is one) that goes away with it.
+            with tempfile.TemporaryDirectory(prefix="videomasa-whisper-", dir=WHISPER_SCRATCH_DIR) as output_dir:
+                result, elapsed = (whisper_cpp or transcribe_with_whisper)(
+                    source,
+                    model,
+                    output_dir,
+                    TRANSCRIPTION_TIMEOUT_SECONDS,
+                )
+                whisper_data = _read_cli_whisper_output(
+                    job_id,
+                    source,
+                    model,
+                    result,
+                    elapsed,
+                    output_dir,
+                    affect_job_status=affect_job_status,
+                )
     except TranscriptionTimeout as error:
         elapsed_text = format_duration(error.elapsed_seconds)
         limit_text = format_duration(error.timeout_seconds)
@@ -470,14 +831,13 @@ def _transcribe_existing_file(job_id, source_path, model, make_primary=True, aff
             "The source was retained — choose Retry to try again."
         )
         _record_transcription_failure(
-            job,
+            job_id,
             model,
             message,
             "timeout",
             error.elapsed_seconds,
             affect_job_status=affect_job_status,
         )
-        _cleanup_whisper_outputs(source)
         print(
             f"[transcription timeout] job={job_id} model={model} "
             f"elapsed={error.elapsed_seconds:.1f}s limit={error.timeout_seconds}s",
@@ -487,70 +847,47 @@ def _transcribe_existing_file(job_id, source_path, model, make_primary=True, aff
     except Exception as error:
         message = f"Transcription could not start: {str(error)}"
         _record_transcription_failure(
-            job,
+            job_id,
             model,
             message,
             "exception",
             0,
             affect_job_status=affect_job_status,
         )
-        _cleanup_whisper_outputs(source)
         print(f"[transcription exception] job={job_id} model={model}: {error}", flush=True)
         return False
 
-    if result.returncode != 0:
-        full_error = result.stderr or result.stdout or "unknown error"
-        message = f"Transcription failed after {format_duration(elapsed)}: {full_error[:400]}"
-        _record_transcription_failure(
-            job,
-            model,
-            message,
-            "process_error",
-            elapsed,
-            affect_job_status=affect_job_status,
-        )
-        _cleanup_whisper_outputs(source)
-        print(f"[whisper error] job={job_id} rc={result.returncode}\n{full_error}", flush=True)
+    if whisper_data is None:
         return False
+    with jobs.job_lock(job_id):
+        _store_completed_transcript(job, model, whisper_data, make_primary=make_primary)
+        if affect_job_status:
+            _clear_job_failure(job)
+            job.pop("progress", None)
+            job["stage"] = "finalizing"
+            job["elapsed_seconds"] = max(0, int(round(elapsed)))
+    jobs.touch(job_id)
+    if cache_key:
+        TRANSCRIPT_CACHE.put(cache_key, whisper_data)
+    return True
 
-    json_file = _find_whisper_json(source, job_id)
-    if not json_file:
-        hint = (result.stderr or result.stdout or "")[:300]
-        message = f"Transcription output not found. Whisper output: {hint}" if hint else "Transcription output not found."
-        _record_transcription_failure(
-            job,
-            model,
-            message,
-            "output_missing",
-            elapsed,
-            affect_job_status=affect_job_status,
-        )
-        _cleanup_whisper_outputs(source)
-        return False
 
-    try:
-        with open(json_file) as input_file:
-            whisper_data = json.load(input_file)
-    except (OSError, ValueError) as error:
-        message = f"Transcription output could not be read: {str(error)}"
-        _record_transcription_failure(
-            job,
-            model,
-            message,
-            "output_invalid",
-            elapsed,
-            affect_job_status=affect_job_status,
-        )
-        _cleanup_whisper_outputs(source)
-        return False
-    _store_completed_transcript(job, model, whisper_data, make_primary=make_primary)
-    _cleanup_whisper_outputs(source)
-    if affect_job_status:
+def _finish_job(job_id):
+    """Mark a job complete and hand its worker slot to the next queued job."""
+    job = jobs[job_id]
+    with jobs.job_lock(job_id):
         _clear_job_failure(job)
-        job.pop("progress", None)
-        job["stage"] = "finalizing"
-        job["elapsed_seconds"] = max(0, int(round(elapsed)))
-    return True
+        job.update(status="done", stage="done", message="Complete")
+    jobs.touch(job_id)
+    check_queue_and_cleanup()
+
+
+def _transcribe_and_finish(job_id, source_path, model):
+    """Transcribe retained media as the job's primary result and complete the job."""
+    if not _transcribe_existing_file(job_id, source_path, model):
+        check_queue_and_cleanup()
+        return
+    _finish_job(job_id)
 
 
 def _is_twitter_url(url):
@@ -574,20 +911,65 @@ def _cookie_args(cookies_browser="none"):
         if cookie_path and cookie_path.is_file() and not cookie_path.is_symlink():
             return ["--cookies", str(cookie_path)]
         return []
-    if cookies_browser not in ("none",):
+    if cookies_browser != "none":
         return ["--cookies-from-browser", cookies_browser]
     return []
 
 
-def _probe_formats(url, cookies_browser="none"):
-    """Probe available formats for a URL using yt-dlp -j.
+def _cookie_options(cookies_browser="none"):
+    """Return yt-dlp library options equivalent to _cookie_args."""
+    if cookies_browser.startswith("cookie:"):
+        cookie_path = _cookie_path(cookies_browser[7:])
+        if cookie_path and cookie_path.is_file() and not cookie_path.is_symlink():
+            return {"cookiefile": str(cookie_path)}
+        return {}
+    if cookies_browser != "none":
+        return {"cookiesfrombrowser": (cookies_browser,)}
+    return {}
+
+
+def _extract_info(url, cookies_browser="none", thumbnail_path=None):
+    """Read yt-dlp metadata in-process, falling back to the CLI when the module is absent.
+
+    With ``thumbnail_path`` (a ``.jpg`` path) the same extraction also writes
+    the thumbnail there, so no second yt-dlp run is needed for it.
+    """
+    thumbnail_base = str(Path(thumbnail_path).with_suffix("")) if thumbnail_path else None
+    try:
+        from yt_dlp import YoutubeDL
+    except ImportError:
+        cmd = ["yt-dlp", "-j", "--no-playlist"] + _cookie_args(cookies_browser)
+        if thumbnail_base:
+            cmd += ["--no-simulate", "--skip-download", "--write-thumbnail",
+                    "--convert-thumbnails", "jpg", "-o", thumbnail_base]
+        result = subprocess.run(cmd + ["--", url], capture_output=True, text=True, timeout=30)
+        return jsonio.loads(result.stdout) if result.returncode == 0 else None
+
+    options = {
+        "quiet": True,
+        "no_warnings": True,
+        "noplaylist": True,
+        "skip_download": True,
+        "socket_timeout": 30,
+        **_cookie_options(cookies_browser),
+    }
+    if thumbnail_base:
+        options.update({
+            "writethumbnail": True,
+            "outtmpl": {"default": thumbnail_base},
+            "postprocessors": [{"key": "FFmpegThumbnailsConvertor", "format": "jpg", "when": "before_dl"}],
+        })
+    with YoutubeDL(options) as ydl:
+        return ydl.extract_info(url, download=bool(thumbnail_base))
+
+
+def _probe_formats(url, cookies_browser="none", thumbnail_path=None):
+    """Probe available formats for a URL from yt-dlp metadata.
     Returns dict: {"video": [2160, 1080, ...], "audio": [130, 49, ...]}"""
     try:
-        cmd = ["yt-dlp", "-j", "--no-playlist"] + _cookie_args(cookies_browser) + ["--", url]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode != 0:
+        info = _extract_info(url, cookies_browser, thumbnail_path)
+        if not info:
             return {"video": [], "audio": []}
-        info = json.loads(result.stdout)
         formats = info.get("formats", [])
         heights = set()
         bitrates = set()
@@ -609,76 +991,241 @@ def _probe_formats(url, cookies_browser="none"):
         return {"video": [], "audio": []}
 
 
+def _write_video_thumbnail(job_id, file_path):
+    """Grab a frame from a local video file; audio files have no thumbnail."""
+    mime = mimetypes.guess_type(str(file_path))[0] or ""
+    if not mime.startswith("video/"):
+        return None
+    thumb_path = WORK_DIR / f"{job_id}_thumb.jpg"
+    run_with_tail(
+        [FFMPEG_BIN, "-i", str(file_path), "-ss", "1", "-frames:v", "1",
+         "-vf", "scale=320:-1", "-q:v", "5", str(thumb_path)],
+        timeout=THUMBNAIL_TIMEOUT_SECONDS, capture_output=False
+    )
+    return thumb_path
+
+
+def _record_thumbnail(job_id, thumb_path):
+    """Publish a written thumbnail on its job; a missing file is ignored."""
+    if thumb_path and thumb_path.exists():
+        if jobs.get(job_id) is not None:
+            jobs.update_job(job_id, _thumb_path=str(thumb_path), thumbnail=f"/thumb/{job_id}")
+
+
+def _start_thumbnail_task(writer, job_id, *args):
+    """Run a thumbnail writer on the I/O pool so it overlaps download and transcription."""
+    def generate():
+        try:
+            _record_thumbnail(job_id, writer(job_id, *args))
+        except Exception:
+            pass  # thumbnail is optional, don't block the job
+
+    return io_executor.submit(generate)
+
+
+def _download_audio_track(job_id, url, cookies_browser="none", fallback_to_best=True):
+    """Fetch only the best audio stream to ``{job_id}.audio.<ext>``.
+
+    Returns ``(path, title)`` like ``_downloaded_media``; the path is None
+    on any failure. ``fallback_to_best`` lets yt-dlp take a muxed format
+    when there is no audio-only one; leave it off while the video is
+    downloading anyway, so a missing audio stream never fetches it twice.
+    """
+    cmd = [
+        "yt-dlp", "--no-playlist", "-f", "bestaudio/best" if fallback_to_best else "bestaudio",
+        "-o", str(WORK_DIR / f"{job_id}.audio.%(ext)s"),
+        "--print", "after_move:%(title)j",
+        "--print", "after_move:filepath",
+    ] + _cookie_args(cookies_browser) + ["--", url]
+    try:
+        result = run_with_tail(cmd, timeout=DOWNLOAD_TIMEOUT_SECONDS)
+    except (OSError, subprocess.TimeoutExpired):
+        return None, ""
+    if result.returncode != 0:
+        return None, ""
+    return _downloaded_media(result)
+
+
+# --print makes yt-dlp quiet; --progress brings back one compact line per
+# update, which _record_download_progress consumes before the output tail.
+_PROGRESS_ARGS = (
+    "--progress",
+    "--newline",
+    "--progress-template",
+    "download:[progress] %(progress.downloaded_bytes)s/%(progress.total_bytes,progress.total_bytes_estimate)s",
+)
+_PROGRESS_LINE = re.compile(rb"\[progress\] (\d+)/(\d+(?:\.\d+)?)")
+
+
+def _record_download_progress(job_id, line):
+    """Show a yt-dlp progress line as a percentage; return whether it was one.
+
+    Only a plain download message is replaced, so the notes run_job shows
+    while the audio track is transcribed alongside the download stay put.
+    """
+    if not line.startswith(b"[progress] "):
+        return False
+    match = _PROGRESS_LINE.match(line)
+    if match and float(match.group(2)) > 0:
+        percent = min(100, int(int(match.group(1)) * 100 / float(match.group(2))))
+        message = f"Downloading video... {percent}%"
+        job = jobs.get(job_id)
+        if job is None:
+            return True
+        current = job.get("message", "")
+        if job.get("status") == "downloading" and current.startswith("Downloading video") and current != message:
+            jobs.update_job(job_id, message=message)
+    return True
+
+
+def _start_video_download(job_id, url, cookies_browser):
+    """Start the best-quality MP4 download on the I/O pool; return its Future."""
+    cmd = [
+        "yt-dlp",
+        "--no-playlist",
+        "-o", str(WORK_DIR / f"{job_id}.%(ext)s"),
+        "--print", "after_move:%(title)j",
+        "--print", "after_move:filepath",
+        *_PROGRESS_ARGS,
+        "-S", "vcodec:h264,acodec:aac",
+        "--merge-output-format", "mp4",
+    ]
+    cmd.extend(_cookie_args(cookies_browser))
+    if _is_twitter_url(url):
+        cmd.extend(["--extractor-retries", "5"])
+    cmd.extend(["--", url])
+    return io_executor.submit(
+        run_with_tail,
+        cmd,
+        timeout=DOWNLOAD_TIMEOUT_SECONDS,
+        line_filter=partial(_record_download_progress, job_id),
+    )
+
+
+def _record_probe_formats(job_id, probe_task, timeout):
+    """Copy the format probe's result onto the job once it finishes (or ``timeout`` passes)."""
+    wait([probe_task], timeout=timeout)
+    formats = probe_task.result() if probe_task.done() else None
+    if formats:
+        fields = {"available_formats": formats}
+        # Best quality = highest probed video height
+        video_heights = formats.get("video", [])
+        if video_heights:
+            fields["downloaded_quality"] = f"{video_heights[0]}p"
+        jobs.update_job(job_id, **fields)
+
+
 def run_job(job_id: str, url: str, model_size: str, do_transcribe: bool, do_download: bool,
             cookies_browser: str = "none"):
     """Background worker: download video, optionally transcribe, optionally keep file for download."""
     job = jobs[job_id]
 
     try:
-        # Download thumbnail locally (remote CDN URLs expire/get blocked)
-        try:
-            thumb_cmd = ["yt-dlp", "--no-playlist", "--write-thumbnail",
-                         "--skip-download", "--convert-thumbnails", "jpg"] + _cookie_args(cookies_browser) + [
-                         "-o", str(WORK_DIR / f"{job_id}_thumb"), "--", url]
-            thumb_path = WORK_DIR / f"{job_id}_thumb.jpg"
-            subprocess.run(thumb_cmd, capture_output=True, text=True, timeout=15)
-            if thumb_path.exists():
-                job["thumbnail"] = f"/thumb/{job_id}"
-        except Exception:
-            pass  # thumbnail is optional, don't block the job
+        # One metadata extraction alongside the download probes the formats
+        # and writes the local thumbnail (remote CDN URLs expire/get blocked).
+        thumb_path = WORK_DIR / f"{job_id}_thumb.jpg"
+        probe_task = io_executor.submit(_probe_formats, url, cookies_browser, thumb_path)
+        probe_task.add_done_callback(lambda _task: _record_thumbnail(job_id, thumb_path))
+
+        jobs.update_job(
+            job_id,
+            status="downloading",
+            stage="download",
+            stage_started_at=int(time.time()),
+            timeout_seconds=DOWNLOAD_TIMEOUT_SECONDS,
+            message="Downloading video..." if do_download else "Downloading audio...",
+        )
 
-        # Probe available formats in background thread
-        probe_result = [None]
-        def do_probe():
-            probe_result[0] = _probe_formats(url, cookies_browser)
-        probe_thread = threading.Thread(target=do_probe, daemon=True)
-        probe_thread.start()
-
-        job["status"] = "downloading"
-        job["stage"] = "download"
-        job["stage_started_at"] = int(time.time())
-        job["timeout_seconds"] = DOWNLOAD_TIMEOUT_SECONDS
-        job["message"] = "Downloading video..."
-
-        # Download with yt-dlp — always best quality
-        out_template = str(WORK_DIR / f"{job_id}_%(title)s.%(ext)s")
-        cmd = [
-            "yt-dlp",
-            "--no-playlist",
-            "-o", out_template,
-            "-S", "vcodec:h264,acodec:aac",
-            "--merge-output-format", "mp4",
-        ]
-
-        cmd.extend(_cookie_args(cookies_browser))
-
-        if _is_twitter_url(url):
-            cmd.extend(["--extractor-retries", "5"])
-
-        cmd.extend(["--", url])
         download_started = time.monotonic()
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=DOWNLOAD_TIMEOUT_SECONDS,
+        download_task = _start_video_download(job_id, url, cookies_browser) if do_download else None
+
+        # Transcription only needs the much smaller audio track. For
+        # transcribe-only jobs it is the whole download; otherwise it is
+        # transcribed while the video is still downloading.
+        early_transcript = None
+        audio_source = None
+        if do_transcribe:
+            audio_path, audio_title = _download_audio_track(
+                job_id,
+                url,
+                cookies_browser,
+                fallback_to_best=download_task is None,
             )
+            if audio_path and download_task is None:
+                with jobs.job_lock(job_id):
+                    job.update(
+                        _file_path=str(audio_path),
+                        _audio_only=True,
+                        file_status="present",
+                        title=audio_title,
+                        filename=_media_filename(audio_title, audio_path),
+                    )
+                jobs.touch(job_id)
+                early_transcript = _transcribe_existing_file(job_id, audio_path, model_size)
+                if early_transcript:
+                    _record_probe_formats(job_id, probe_task, THUMBNAIL_TIMEOUT_SECONDS)
+                # Checked and finished under one lock: a /merge adding the
+                # download either lands first and is honoured below, or sees
+                # the finished job and is refused.
+                with jobs.job_lock(job_id):
+                    wants_video = job["do_download"]
+                    if early_transcript and not wants_video:
+                        _clear_job_failure(job)
+                        job.update(status="done", stage="done", message="Complete")
+                if not wants_video:
+                    if early_transcript:
+                        jobs.touch(job_id)
+                    check_queue_and_cleanup()
+                    return
+                # A merge asked for the video too; the audio stays the source
+                # until the video replaces it.
+                audio_source = audio_path
+                jobs.update_job(job_id, status="downloading", stage="download", message="Downloading video...")
+                download_started = time.monotonic()
+                download_task = _start_video_download(job_id, url, cookies_browser)
+            elif audio_path:
+                # The job stays "downloading" until the video lands: a failure
+                # here must not end it while the download is still running.
+                jobs.update_job(job_id, message="Transcribing audio while the video downloads...")
+                try:
+                    early_transcript = _transcribe_existing_file(
+                        job_id,
+                        audio_path,
+                        model_size,
+                        affect_job_status=False,
+                        live_segments=True,
+                    )
+                finally:
+                    audio_path.unlink(missing_ok=True)
+                if early_transcript and not download_task.done():
+                    jobs.update_job(
+                        job_id,
+                        status="downloading",
+                        stage="download",
+                        message="Transcript ready. Finishing video download...",
+                    )
+        if download_task is None:
+            # The audio-only fetch failed; fall back to the full download.
+            download_started = time.monotonic()
+            download_task = _start_video_download(job_id, url, cookies_browser)
+        try:
+            result = download_task.result()
         except subprocess.TimeoutExpired:
             elapsed = max(0, int(round(time.monotonic() - download_started)))
-            job.update({
-                "status": "error",
-                "stage": "error",
-                "message": (
+            jobs.update_job(
+                job_id,
+                status="error",
+                stage="error",
+                message=(
                     f"Download timed out after {format_duration(elapsed)} "
                     f"(limit: {format_duration(DOWNLOAD_TIMEOUT_SECONDS)})."
                 ),
-                "failure_stage": "download",
-                "failure_code": "timeout",
-                "elapsed_seconds": elapsed,
-                "timeout_seconds": DOWNLOAD_TIMEOUT_SECONDS,
-                "retryable": False,
-            })
+                failure_stage="download",
+                failure_code="timeout",
+                elapsed_seconds=elapsed,
+                timeout_seconds=DOWNLOAD_TIMEOUT_SECONDS,
+                retryable=False,
+            )
             print(
                 f"[download timeout] job={job_id} elapsed={elapsed}s "
                 f"limit={DOWNLOAD_TIMEOUT_SECONDS}s",
@@ -688,86 +1235,91 @@ def run_job(job_id: str, url: str, model_size: str, do_transcribe: bool, do_down
             return
 
         # Collect probe results (wait up to 5s if still running)
-        probe_thread.join(timeout=5)
-        if probe_result[0]:
-            job["available_formats"] = probe_result[0]
-            # Best quality = highest probed video height
-            video_heights = probe_result[0].get("video", [])
-            if video_heights:
-                job["downloaded_quality"] = f"{video_heights[0]}p"
+        _record_probe_formats(job_id, probe_task, 5)
 
         if result.returncode != 0:
-            job["status"] = "error"
-            job["stage"] = "error"
-            job["failure_stage"] = "download"
-            job["failure_code"] = "process_error"
-            job["retryable"] = False
             stderr = result.stderr
             if _is_twitter_url(url):
                 if "No video could be found" in stderr or "Requested format is not available" in stderr:
-                    job["message"] = "Twitter: Video requires login. Set 'Browser cookies' to your browser and retry."
+                    message = "Twitter: Video requires login. Set 'Browser cookies' to your browser and retry."
                 elif "Failed to parse JSON" in stderr or "guest token" in stderr.lower():
-                    job["message"] = "Twitter: API error. Try setting browser cookies, or update yt-dlp."
+                    message = "Twitter: API error. Try setting browser cookies, or update yt-dlp."
                 else:
-                    job["message"] = f"Twitter download failed: {stderr[:200]}"
+                    message = f"Twitter download failed: {stderr[:200]}"
             else:
-                job["message"] = f"Download failed: {stderr[:200]}"
+                message = f"Download failed: {stderr[:200]}"
+            jobs.update_job(
+                job_id,
+                status="error",
+                stage="error",
+                failure_stage="download",
+                failure_code="process_error",
+                retryable=False,
+                message=message,
+            )
             check_queue_and_cleanup()
             return
 
-        # Find the downloaded file
-        downloaded = None
-        for f in WORK_DIR.iterdir():
-            if f.name.startswith(job_id) and f.suffix in ('.mp4', '.mkv', '.webm', '.mov', '.m4a', '.mp3', '.wav'):
-                downloaded = f
-                break
+        downloaded, title = _downloaded_media(result)
 
         if not downloaded:
-            job["status"] = "error"
-            job["message"] = "Download completed but file not found."
+            jobs.update_job(job_id, status="error", stage="error", message="Download completed but file not found.")
+            check_queue_and_cleanup()
             return
 
-        # Always store file path and title (title = filename minus job_id prefix and extension)
-        job["_file_path"] = str(downloaded)
-        job["file_status"] = "present"
-        prefix = f"{job_id}_"
-        display_name = downloaded.name
-        if display_name.startswith(prefix):
-            display_name = display_name[len(prefix):]
-        title = downloaded.stem
-        if title.startswith(prefix):
-            title = title[len(prefix):]
-        job["title"] = title
-        job["filename"] = display_name
-
-        # If download requested, mark file as ready (read from job dict so merges take effect)
-        if job["do_download"]:
-            job["download_ready"] = True
-            job["download_path"] = str(downloaded)
+        # The file is always {job_id}.<ext>; the title comes from yt-dlp's print.
+        # Checked under the job lock so a concurrent /merge adding the
+        # download sees either the old flags or the published file.
+        with jobs.job_lock(job_id):
+            job.update(
+                _file_path=str(downloaded),
+                file_status="present",
+                title=title,
+                filename=_media_filename(title, downloaded),
+            )
+            job.pop("_audio_only", None)
+            if job["do_download"]:
+                job["download_ready"] = True
+                job["download_path"] = str(downloaded)
+        jobs.touch(job_id)
+        if audio_source:
+            audio_source.unlink(missing_ok=True)
+
+        if early_transcript is False:
+            # The audio-track transcription failed; now that the video is
+            # retained, surface it so Retry can re-run it on the video.
+            failure = job["transcripts"][model_size]
+            _record_transcription_failure(
+                job_id,
+                model_size,
+                failure["message"],
+                failure["error_code"],
+                failure["elapsed_seconds"],
+            )
+            check_queue_and_cleanup()
+            return
 
         # If transcribe requested, run whisper (read from dict so merges take effect)
-        if job["do_transcribe"]:
+        if job["do_transcribe"] and not early_transcript:
             if not _transcribe_existing_file(job_id, downloaded, model_size):
                 check_queue_and_cleanup()
                 return
 
-        _clear_job_failure(job)
-        job["status"] = "done"
-        job["stage"] = "done"
-        job["message"] = "Complete"
-        check_queue_and_cleanup()
+        wait([probe_task], timeout=THUMBNAIL_TIMEOUT_SECONDS)
+        _finish_job(job_id)
 
     except subprocess.TimeoutExpired:
-        failed_stage = job.get("stage", "process")
-        job["status"] = "error"
-        job["stage"] = "error"
-        job["failure_stage"] = failed_stage
-        job["failure_code"] = "timeout"
-        job["message"] = "An unexpected processing stage timed out. See the server log for details."
+        jobs.update_job(
+            job_id,
+            status="error",
+            stage="error",
+            failure_stage=job.get("stage", "process"),
+            failure_code="timeout",
+            message="An unexpected processing stage timed out. See the server log for details.",
+        )
         check_queue_and_cleanup()
     except Exception as e:
-        job["status"] = "error"
-        job["message"] = f"Error: {str(e)}"
+        jobs.update_job(job_id, status="error", message=f"Error: {str(e)}")
         check_queue_and_cleanup()
 
 
@@ -775,12 +1327,6 @@ def run_file_job(job_id: str, file_path: Path, model_size: str, do_transcribe: b
     """Background worker for locally uploaded files (no yt-dlp needed)."""
     job = jobs[job_id]
     try:
-        job["status"] = "processing"
-        job["message"] = "Processing file..."
-
-        job["_file_path"] = str(file_path)
-        job["file_status"] = "present"
-
         display_name = file_path.name
         prefix = f"{job_id}_"
         if display_name.startswith(prefix):
@@ -788,48 +1334,41 @@ def run_file_job(job_id: str, file_path: Path, model_size: str, do_transcribe: b
         title = file_path.stem
         if title.startswith(prefix):
             title = title[len(prefix):]
-        job["title"] = title
-        job["filename"] = display_name
+        jobs.update_job(
+            job_id,
+            status="processing",
+            message="Processing file...",
+            _file_path=str(file_path),
+            file_status="present",
+            title=title,
+            filename=display_name,
+        )
 
-        # Generate thumbnail for video files using ffmpeg
-        thumb_path = WORK_DIR / f"{job_id}_thumb.jpg"
-        try:
-            mime = mimetypes.guess_type(str(file_path))[0] or ""
-            if mime.startswith("video/"):
-                subprocess.run(
-                    [FFMPEG_BIN, "-i", str(file_path), "-ss", "1", "-frames:v", "1",
-                     "-vf", "scale=320:-1", "-q:v", "5", str(thumb_path)],
-                    capture_output=True, timeout=15
-                )
-                if thumb_path.exists():
-                    job["thumbnail"] = f"/thumb/{job_id}"
-        except Exception:
-            pass  # thumbnail is optional
+        # Generate the thumbnail with ffmpeg while whisper runs
+        thumb_task = _start_thumbnail_task(_write_video_thumbnail, job_id, file_path)
 
         if do_download:
-            job["download_ready"] = True
-            job["download_path"] = str(file_path)
+            jobs.update_job(job_id, download_ready=True, download_path=str(file_path))
 
         if do_transcribe:
             if not _transcribe_existing_file(job_id, file_path, model_size):
                 check_queue_and_cleanup()
                 return
 
-        _clear_job_failure(job)
-        job["status"] = "done"
-        job["stage"] = "done"
-        job["message"] = "Complete"
-        check_queue_and_cleanup()
+        wait([thumb_task], timeout=THUMBNAIL_TIMEOUT_SECONDS)
+        _finish_job(job_id)
 
     except subprocess.TimeoutExpired:
-        job["status"] = "error"
-        job["stage"] = "error"
-        job["failure_code"] = "timeout"
-        job["message"] = "An unexpected processing stage timed out. See the server log for details."
+        jobs.update_job(
+            job_id,
+            status="error",
+            stage="error",
+            failure_code="timeout",
+            message="An unexpected processing stage timed out. See the server log for details.",
+        )
         check_queue_and_cleanup()
     except Exception as e:
-        job["status"] = "error"
-        job["message"] = f"Error: {str(e)}"
+        jobs.update_job(job_id, status="error", message=f"Error: {str(e)}")
         check_queue_and_cleanup()
 
 
@@ -859,12 +1398,33 @@ def health():
     return jsonify({**_health, "app_version": APP_VERSION})
 
 
+def _send_work_file(path, **options):
+    """``send_file`` for files in WORK_DIR, translated to X-Accel-Redirect for nginx."""
+    response = send_file(path, **options)
+    if XACCEL_PREFIX and "X-Sendfile" in response.headers:
+        relative = Path(response.headers.pop("X-Sendfile")).resolve().relative_to(WORK_DIR.resolve())
+        response.headers["X-Accel-Redirect"] = f"{XACCEL_PREFIX}/{relative.as_posix()}"
+    return response
+
+
 @app.route("/thumb/<job_id>")
 def thumb(job_id):
-    thumb_path = WORK_DIR / f"{job_id}_thumb.jpg"
-    if not thumb_path.exists():
+    # The path is recorded once when the thumbnail is written; a later
+    # cleanup surfaces as FileNotFoundError rather than a stat per request.
+    thumb_path = (jobs.get(job_id) or {}).get("_thumb_path")
+    if not thumb_path:
+        return jsonify({"error": "Thumbnail not found"}), 404
+    try:
+        # Thumbnails never change once written: let the browser keep them and
+        # revalidate with the ETag send_file derives from the file.
+        response = _send_work_file(thumb_path, mimetype="image/jpeg", max_age=THUMBNAIL_MAX_AGE_SECONDS)
+    except FileNotFoundError:
         return jsonify({"error": "Thumbnail not found"}), 404
-    return send_file(str(thumb_path), mimetype="image/jpeg")
+    # The URL is token-gated: only the browser may keep it, not shared proxies.
+    response.cache_control.public = False
+    response.cache_control.private = True
+    response.cache_control.immutable = True
+    return response
 
 
 @app.route("/process", methods=["POST"])
@@ -880,7 +1440,8 @@ def process():
     do_download = data.get("download", False)
     cookies_browser = data.get("cookies_browser", "none")
 
-    if model_size not in ("tiny", "base", "small", "medium"):
+    # With VIDEOMASA_WHISPER_DISTIL these sizes map to English-only distil-whisper checkpoints.
+    if model_size not in VALID_MODELS:
         model_size = "base"
     if not cookies_browser.startswith("cookie:") and cookies_browser not in ALLOWED_COOKIES_BROWSERS:
         cookies_browser = "none"
@@ -915,17 +1476,43 @@ def process():
     added, error = _add_job(job_id, job)
     if not added:
         return jsonify({"error": error}), 429
+    position = _queue_position()
+    job["message"] = _queued_message(position)
     if not _submit_job(run_job, job_id, url, model_size, do_transcribe, do_download, cookies_browser):
         with jobs_lock:
             jobs.pop(job_id, None)
         return jsonify({"error": "Job queue is full or shutting down"}), 503
+    if do_transcribe:
+        # Load the model while the video downloads rather than after it.
+        _warm_whisper_model(model_size)
 
-    return jsonify({"job_id": job_id})
+    return jsonify({"job_id": job_id, "queue_position": position})
 
 
 ALLOWED_EXTENSIONS = {'.mp4', '.mov', '.webm', '.mkv', '.mp3', '.wav', '.m4a', '.ogg', '.flac', '.avi', '.m4v'}
 
 
+def _save_upload(file, saved_path):
+    """Move an uploaded part into place, renaming its WORK_DIR spool when possible."""
+    spool = getattr(file.stream, "name", None)
+    if isinstance(spool, str) and Path(spool).parent == WORK_DIR:
+        file.stream.close()
+        os.replace(spool, saved_path)
+        return
+    with open(saved_path, "wb") as output:
+        shutil.copyfileobj(file.stream, output, 4 * 1024 * 1024)
+
+
+@app.teardown_request
+def _remove_upload_spools(_error=None):
+    spools = request.__dict__.get("_upload_spools", ())
+    if spools:
+        for file in request.files.values():
+            file.close()
+        for spool in spools:
+            Path(spool).unlink(missing_ok=True)
+
+
 @app.route("/upload", methods=["POST"])
 def upload():
     if request.content_length and request.content_length > MAX_UPLOAD_BYTES:
@@ -942,10 +1529,10 @@ def upload():
         return jsonify({"error": f"Unsupported file type: {ext}"}), 400
 
     model_size = request.form.get("model", "base")
-    do_transcribe = request.form.get("transcribe", "true").lower() in ("true", "1", "yes")
-    do_download = request.form.get("download", "false").lower() in ("true", "1", "yes")
+    do_transcribe = request.form.get("transcribe", "true").lower() in TRUE_VALUES
+    do_download = request.form.get("download", "false").lower() in TRUE_VALUES
 
-    if model_size not in ("tiny", "base", "small", "medium"):
+    if model_size not in VALID_MODELS:
         model_size = "base"
 
     if not do_transcribe and not do_download:
@@ -954,7 +1541,7 @@ def upload():
     job_id = uuid.uuid4().hex[:12]
     safe_name = secure_filename(file.filename)
     saved_path = WORK_DIR / f"{job_id}_{safe_name}"
-    file.save(str(saved_path))
+    _save_upload(file, saved_path)
 
     job = {
         "status": "queued",
@@ -981,23 +1568,187 @@ def upload():
     if not added:
         saved_path.unlink(missing_ok=True)
         return jsonify({"error": error}), 429
+    position = _queue_position()
+    job["message"] = _queued_message(position)
     if not _submit_job(run_file_job, job_id, saved_path, model_size, do_transcribe, do_download):
         with jobs_lock:
             jobs.pop(job_id, None)
         saved_path.unlink(missing_ok=True)
         return jsonify({"error": "Job queue is full or shutting down"}), 503
 
-    return jsonify({"job_id": job_id})
+    return jsonify({"job_id": job_id, "queue_position": position})
+
+
+def _public_status(job_id, since=None, fields=None):
+    """Return a job's public fields, or None for an unknown job.
+
+    ``fields`` (a comma-separated string) limits the keys; ``transcript_status``
+    is a derived {model: status} map for that mode. ``since`` adds the live
+    segments decoded after that count.
+    """
+
+    def read(job):
+        # Only the copy and the live-segment slices need the job lock;
+        # filtering and serialization run after it is released.
+        view = {key: value for key, value in job.items() if not key.startswith("_")}
+        if "transcripts" in view:
+            view["transcripts"] = dict(view["transcripts"])
+        if since is not None:
+            start = max(0, since)
+            view["new_starts"] = job.get("_seg_start", [])[start:]
+            view["new_ends"] = job.get("_seg_end", [])[start:]
+            view["new_texts"] = job.get("_seg_text", [])[start:]
+            view["version"] = len(job.get("_seg_text", []))
+        return view
+
+    try:
+        public_job = jobs.apply(job_id, read)
+    except KeyError:
+        return None
+    if fields is not None:
+        wanted = {field.strip() for field in fields.split(",") if field.strip()}
+        if since is not None:
+            wanted |= {"new_starts", "new_ends", "new_texts", "version"}
+        if "transcript_status" in wanted:
+            public_job["transcript_status"] = {
+                model: entry.get("status") for model, entry in public_job.get("transcripts", {}).items()
+            }
+        public_job = {key: value for key, value in public_job.items() if key in wanted}
+    return public_job
 
 
 @app.route("/status/<job_id>")
 def status(job_id):
-    with jobs_lock:
-        job = jobs.get(job_id)
-        public_job = {key: value for key, value in job.items() if not key.startswith("_")} if job else None
+    """Return a job's public state (see _public_status for the query options).
+
+    Finished text is fetched once from /transcript. An unchanged reply is
+    answered 304 against the client's ETag.
+    """
+    public_job = _public_status(job_id, request.args.get("since", type=int), request.args.get("fields"))
+    if public_job is None:
+        return jsonify({"error": "Job not found"}), 404
+    response = jsonify(public_job)
+    response.add_etag()
+    return response.make_conditional(request)
+
+
+def _status_events(watched, fields, tagged):
+    """Yield Server-Sent Events for the jobs in ``watched`` until all finish.
+
+    ``watched`` maps job ids to the live segments the client already has.
+    Each event is a JSON object of the keys whose values changed since that
+    job's previous event, plus any new live segments; an ``end`` event
+    follows each job's final state. ``tagged`` adds the job id to every
+    payload so one stream can carry several jobs.
+    """
+    sent = {job_id: {} for job_id in watched}
+    idle = 0.0
+    # Jobs whose version has not moved are skipped; None forces a full pass.
+    compared = None
+    while watched:
+        versions = {job_id: jobs.version(job_id) for job_id in watched}
+        for job_id, seen in list(watched.items()):
+            if compared is not None and compared.get(job_id) == versions[job_id]:
+                continue
+            tag = {"job": job_id} if tagged else {}
+            public_job = _public_status(job_id, seen, fields)
+            if public_job is None:
+                del watched[job_id]
+                if tagged:
+                    yield f"event: end\ndata: {jsonio.dumps(tag)}\n\n"
+                continue
+            delta = {}
+            for key, value in public_job.items():
+                if key in {"new_starts", "new_ends", "new_texts", "version"}:
+                    continue
+                encoded = jsonio.dumps(value)
+                if sent[job_id].get(key) != encoded:
+                    sent[job_id][key] = encoded
+                    delta[key] = value
+            if public_job["new_texts"] or public_job["version"] < seen:
+                delta.update({key: public_job[key] for key in ("new_starts", "new_ends", "new_texts")})
+            if delta:
+                delta["version"] = watched[job_id] = public_job["version"]
+                yield f"data: {jsonio.dumps({**tag, **delta})}\n\n"
+                idle = 0.0
+            job = jobs.get(job_id)
+            if job is None or not has_active_jobs([job]):
+                del watched[job_id]
+                yield f"event: end\ndata: {jsonio.dumps(tag)}\n\n"
+        if not watched:
+            break
+        # Workers touch() the job on segment and state changes, so a wake-up
+        # only rebuilds the jobs that moved; the timeout compares them all
+        # to pick up fields set without a touch.
+        if jobs.wait_for_changes(versions, EVENT_POLL_SECONDS) != versions:
+            compared = versions
+        else:
+            compared = None
+            idle += EVENT_POLL_SECONDS
+            if idle >= EVENT_KEEPALIVE_SECONDS:
+                idle = 0.0
+                yield ": keepalive\n\n"
+
+
+def _event_stream_response(watched, fields, tagged):
+    if not _event_stream_slots.acquire(blocking=False):
+        return jsonify({"error": "Too many event streams; poll /status instead"}), 503
+    held = [True]
+
+    def release_slot():
+        # close() runs whether or not the body was ever iterated; release once.
+        if held and held.pop():
+            _event_stream_slots.release()
+
+    response = app.response_class(_status_events(watched, fields, tagged), mimetype="text/event-stream")
+    response.call_on_close(release_slot)
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
+
+
+@app.route("/events/<job_id>")
+def job_events(job_id):
+    """Stream a job's status as Server-Sent Events carrying only changed keys.
+
+    Takes the same ``fields`` and ``since`` options as /status. Streams are
+    capped so they cannot occupy every server thread; a 503 tells the client
+    to fall back to polling /status.
+    """
+    if job_id not in jobs:
+        return jsonify({"error": "Job not found"}), 404
+    since = max(0, request.args.get("since", 0, type=int))
+    return _event_stream_response({job_id: since}, request.args.get("fields"), tagged=False)
+
+
+@app.route("/events")
+def jobs_events():
+    """Stream several jobs over one connection, each payload tagged with ``job``.
+
+    ``jobs`` lists ``id:since`` pairs separated by commas, so a page watching
+    many jobs holds one server thread and one browser connection instead of
+    one per job. Otherwise behaves like /events/<job_id>.
+    """
+    watched = {}
+    for item in request.args.get("jobs", "").split(","):
+        job_id, _, since = item.strip().partition(":")
+        if job_id in jobs:
+            watched[job_id] = max(0, int(since)) if since.isdigit() else 0
+    if not watched:
+        return jsonify({"error": "Job not found"}), 404
+    return _event_stream_response(watched, request.args.get("fields"), tagged=True)
+
+
+@app.route("/transcript/<job_id>/<model>")
+def transcript(job_id, model):
+    """Return one model's transcript entry, fetched once it is done."""
+    job = jobs.snapshot(job_id)
     if not job:
         return jsonify({"error": "Job not found"}), 404
-    return jsonify(public_job)
+    entry = job.get("transcripts", {}).get(model)
+    if entry is None:
+        return jsonify({"error": "No transcript for this model"}), 404
+    return jsonify(entry)
 
 
 @app.route("/merge/<job_id>", methods=["POST"])
@@ -1013,56 +1764,66 @@ def merge_job(job_id):
     add_download = data.get("download", False)
     add_transcribe = data.get("transcribe", False)
     model_size = data.get("model", "base")
-    if model_size not in ("tiny", "base", "small", "medium"):
+    if model_size not in VALID_MODELS:
         model_size = "base"
 
     resp = {"ok": True}
+    run_transcription = None
 
-    # Add download capability
-    if add_download and not job["do_download"]:
-        job["do_download"] = True
-        file_path = job.get("_file_path", "")
-        if file_path and Path(file_path).exists():
-            job["download_ready"] = True
-            job["download_path"] = file_path
-            resp["download_ready"] = True
-            resp["filename"] = job.get("filename", "")
-
-    # Add transcribe capability
-    if add_transcribe and not job["do_transcribe"]:
-        job["do_transcribe"] = True
-        # If job already finished (download-only), spawn a new transcription thread
-        if job["status"] == "done":
+    # Check-and-set under the job lock so a worker finishing concurrently
+    # cannot interleave with the capability flags.
+    with jobs.job_lock(job_id):
+        # Add download capability
+        if (
+            add_download
+            and not job["do_download"]
+            and job.get("_audio_only")
+            and job["status"] in TERMINAL_JOB_STATUSES
+        ):
+            message = "Only the audio was downloaded for this job. Add the URL again to download the video."
+            return jsonify({"error": message}), 409
+        if add_download and not job["do_download"]:
+            job["do_download"] = True
             file_path = job.get("_file_path", "")
-            if file_path and Path(file_path).exists():
-                merge_model = model_size  # capture for closure
-                job["status"] = "queued"
-                job["message"] = "Transcription queued..."
-
-                def run_transcription():
-                    try:
-                        if not _transcribe_existing_file(job_id, file_path, merge_model):
+            # An audio-only source is not the video; the running job fetches it.
+            if file_path and not job.get("_audio_only") and Path(file_path).exists():
+                job["download_ready"] = True
+                job["download_path"] = file_path
+                resp["download_ready"] = True
+                resp["filename"] = job.get("filename", "")
+
+        # Add transcribe capability
+        if add_transcribe and not job["do_transcribe"]:
+            job["do_transcribe"] = True
+            # If job already finished (download-only), spawn a new transcription thread
+            if job["status"] == "done":
+                file_path = job.get("_file_path", "")
+                if file_path and Path(file_path).exists():
+                    merge_model = model_size  # capture for closure
+                    job["status"] = "queued"
+                    job["message"] = "Transcription queued..."
+
+                    def run_transcription():
+                        try:
+                            _transcribe_and_finish(job_id, file_path, merge_model)
+                        except Exception as e:
+                            with jobs.job_lock(job_id):
+                                job["status"] = "error"
+                                job["stage"] = "error"
+                                job["message"] = f"Error: {str(e)}"
+                                job["transcripts"][merge_model] = {"transcript": "", "timestamped": "", "status": "error"}
+                            jobs.touch(job_id)
                             check_queue_and_cleanup()
-                            return
-                        _clear_job_failure(job)
-                        job["status"] = "done"
-                        job["stage"] = "done"
-                        job["message"] = "Complete"
-                        check_queue_and_cleanup()
-                    except Exception as e:
-                        job["status"] = "error"
-                        job["stage"] = "error"
-                        job["message"] = f"Error: {str(e)}"
-                        job["transcripts"][merge_model] = {"transcript": "", "timestamped": "", "status": "error"}
-                        check_queue_and_cleanup()
-
-                if not _submit_job(run_transcription):
+                else:
                     job["status"] = "error"
-                    job["message"] = "Job queue is full. Try again after another job finishes."
-                    return jsonify({"error": job["message"]}), 429
-            else:
-                job["status"] = "error"
-                job["message"] = "File no longer exists for transcription."
+                    job["message"] = "File no longer exists for transcription."
+
+    jobs.touch(job_id)
+
+    if run_transcription and not _submit_job(run_transcription):
+        message = "Job queue is full. Try again after another job finishes."
+        jobs.update_job(job_id, status="error", message=message)
+        return jsonify({"error": message}), 429
 
     return jsonify(resp)
 
@@ -1078,7 +1839,7 @@ def retranscribe(job_id):
         return jsonify({"error": "Expected application/json"}), 415
     data = request.get_json(silent=True) or {}
     model = data.get("model", "base")
-    if model not in ("tiny", "base", "small", "medium"):
+    if model not in VALID_MODELS:
         model = "base"
 
     # Check if already transcribing this model
@@ -1091,7 +1852,7 @@ def retranscribe(job_id):
         return jsonify({"error": "Source file was cleaned up. Resubmit the URL to transcribe with a different model."}), 410
 
     # Mark as transcribing before the worker starts so the UI can switch tabs immediately.
-    _begin_transcription(job, model, affect_job_status=False)
+    _begin_transcription(job_id, model, affect_job_status=False)
 
     rt_model = model  # capture for closure
 
@@ -1106,7 +1867,7 @@ def retranscribe(job_id):
             )
         except Exception as e:
             _record_transcription_failure(
-                job,
+                job_id,
                 rt_model,
                 f"Error: {str(e)}",
                 "exception",
@@ -1124,17 +1885,10 @@ def retranscribe(job_id):
 def _retry_transcription_job(job_id, file_path, model):
     job = jobs[job_id]
     try:
-        if not _transcribe_existing_file(job_id, file_path, model):
-            check_queue_and_cleanup()
-            return
-        _clear_job_failure(job)
-        job["status"] = "done"
-        job["stage"] = "done"
-        job["message"] = "Complete"
-        check_queue_and_cleanup()
+        _transcribe_and_finish(job_id, file_path, model)
     except Exception as error:
         _record_transcription_failure(
-            job,
+            job_id,
             model,
             f"Retry failed: {str(error)}",
             "exception",
@@ -1146,7 +1900,7 @@ def _retry_transcription_job(job_id, file_path, model):
 @app.route("/retry/<job_id>", methods=["POST"])
 def retry_job(job_id):
     """Retry a recoverable transcription without re-uploading the media."""
-    with jobs_lock:
+    with jobs.job_lock(job_id):
         job = jobs.get(job_id)
         if not job:
             return jsonify({"error": "Job not found"}), 404
@@ -1162,20 +1916,15 @@ def retry_job(job_id):
             return jsonify({"error": "The retained source is no longer available"}), 410
 
         model = job.get("model", "base")
-        if model not in ("tiny", "base", "small", "medium"):
+        if model not in VALID_MODELS:
             model = "base"
-        job["status"] = "queued"
-        job["stage"] = "queued"
-        job["message"] = "Retry queued..."
-        job["retryable"] = False
+        job.update(status="queued", stage="queued", message="Retry queued...", retryable=False)
+    jobs.touch(job_id)
 
     if not _submit_job(_retry_transcription_job, job_id, file_path, model):
-        with jobs_lock:
-            job["status"] = "error"
-            job["stage"] = "error"
-            job["message"] = "Job queue is full. Try Retry again after another job finishes."
-            job["retryable"] = True
-        return jsonify({"error": job["message"]}), 429
+        message = "Job queue is full. Try Retry again after another job finishes."
+        jobs.update_job(job_id, status="error", stage="error", message=message, retryable=True)
+        return jsonify({"error": message}), 429
 
     return jsonify({"ok": True, "status": "queued", "model": model}), 202
 
@@ -1243,23 +1992,33 @@ def download_file(job_id):
     filepath = job.get("download_path") or job.get("_file_path", "")
     filename = job.get("filename", "")
 
-    if not filepath or not Path(filepath).exists():
+    if not filepath:
         return jsonify({"error": "File no longer exists on disk"}), 404
 
-    return send_file(filepath, as_attachment=True, download_name=filename or Path(filepath).name)
+    try:
+        # conditional=True answers Range requests with 206, so an interrupted
+        # multi-GB download resumes; the body goes through wsgi.file_wrapper.
+        return _send_work_file(
+            filepath,
+            as_attachment=True,
+            download_name=filename or os.path.basename(filepath),
+            conditional=True,
+        )
+    except FileNotFoundError:
+        return jsonify({"error": "File no longer exists on disk"}), 404
 
 
 @app.route("/download-srt/<job_id>")
 def download_srt(job_id):
     """Download one completed Whisper model as a CapCut-compatible SRT file."""
     requested_model = request.args.get("model", "").strip().lower()
-    with jobs_lock:
+    with jobs.job_lock(job_id):
         job = jobs.get(job_id)
         if not job:
             return jsonify({"error": "Job not found"}), 404
 
         model = requested_model or job.get("model", "base")
-        if model not in ("tiny", "base", "small", "medium"):
+        if model not in VALID_MODELS:
             return jsonify({"error": "Invalid transcription model"}), 400
 
         entry = job.get("transcripts", {}).get(model, {})
@@ -1283,8 +2042,25 @@ def download_srt(job_id):
     )
 
 
+def _audio_export_command(source, output, audio_format):
+    """Build the ffmpeg command for one audio export format."""
+    if audio_format == "m4a":
+        # Downloads are sorted for AAC, so the stream can usually be copied
+        # into an M4A container without decoding; other codecs get encoded.
+        codec = ["copy"] if probe_audio_codec(source, FFMPEG_BIN) == "aac" else ["aac", "-b:a", "192k"]
+        return [FFMPEG_BIN, "-i", str(source), "-vn", "-c:a", *codec, "-f", "ipod", "-y", str(output)]
+    return [FFMPEG_BIN, "-i", str(source), "-vn", "-acodec", "libmp3lame", "-q:a", "2",
+            "-f", "mp3", "-y", str(output)]
+
+
 @app.route("/download-mp3/<job_id>")
 def download_mp3(job_id):
+    """Export the job's audio as MP3, or as M4A with ?format=m4a."""
+    audio_format = request.args.get("format", "mp3")
+    if audio_format not in AUDIO_EXPORT_FORMATS:
+        return jsonify({"error": "Unsupported audio format"}), 400
+    label = audio_format.upper()
+
     job = jobs.get(job_id)
     if not job:
         return jsonify({"error": "Job not found"}), 404
@@ -1298,20 +2074,35 @@ def download_mp3(job_id):
     if not filepath.exists():
         return jsonify({"error": "File no longer exists on disk"}), 404
 
-    mp3_path = filepath.with_suffix(".mp3")
-    if not mp3_path.exists():
-        try:
-            result = subprocess.run(
-                [FFMPEG_BIN, "-i", str(filepath), "-vn", "-acodec", "libmp3lame", "-q:a", "2", str(mp3_path)],
-                capture_output=True, timeout=120
-            )
+    export_path = filepath.with_suffix(f".{audio_format}")
+    ready_key = f"_{audio_format}_ready"
+    # One conversion per job: concurrent clicks wait for it instead of running
+    # a second ffmpeg into the same file, and the result only appears once
+    # complete, via rename. A source already in the format is served as is.
+    with _audio_export_locks.setdefault(job_id, threading.Lock()):
+        if export_path != filepath and not job.get(ready_key):
+            partial_path = export_path.with_name(f"{export_path.name}.part")
+            try:
+                result = run_with_tail(
+                    _audio_export_command(filepath, partial_path, audio_format), timeout=120
+                )
+            except FileNotFoundError:
+                return jsonify({"error": f"ffmpeg not found — required for {label} conversion"}), 500
+            except subprocess.TimeoutExpired:
+                partial_path.unlink(missing_ok=True)
+                return jsonify({"error": f"{label} conversion timed out"}), 500
             if result.returncode != 0:
-                return jsonify({"error": f"MP3 conversion failed: {result.stderr[:200] if result.stderr else 'unknown error'}"}), 500
-        except FileNotFoundError:
-            return jsonify({"error": "ffmpeg not found — required for MP3 conversion"}), 500
+                partial_path.unlink(missing_ok=True)
+                return jsonify({"error": f"{label} conversion failed: {result.stderr[:200] if result.stderr else 'unknown error'}"}), 500
+            os.replace(partial_path, export_path)
+            job[ready_key] = True
 
-    mp3_filename = Path(job.get("filename", filepath.stem)).with_suffix(".mp3").name
-    return send_file(str(mp3_path), as_attachment=True, download_name=mp3_filename)
+    export_filename = Path(job.get("filename", filepath.stem)).with_suffix(f".{audio_format}").name
+    try:
+        return _send_work_file(str(export_path), as_attachment=True, download_name=export_filename, conditional=True)
+    except FileNotFoundError:
+        job.pop(ready_key, None)
+        return jsonify({"error": f"The converted {label} was cleaned up. Try again."}), 404
 
 
 @app.route("/redownload/<job_id>", methods=["POST"])
@@ -1351,12 +2142,15 @@ def redownload(job_id):
     new_job_id = uuid.uuid4().hex[:12]
 
     # Copy thumbnail so it persists independently
-    source_thumb = WORK_DIR / f"{job_id}_thumb.jpg"
+    source_thumb = source_job.get("_thumb_path")
     new_thumb = WORK_DIR / f"{new_job_id}_thumb.jpg"
     thumb_url = ""
-    if source_thumb.exists():
-        shutil.copy2(str(source_thumb), str(new_thumb))
-        thumb_url = f"/thumb/{new_job_id}"
+    if source_thumb:
+        try:
+            shutil.copy2(source_thumb, str(new_thumb))
+            thumb_url = f"/thumb/{new_job_id}"
+        except FileNotFoundError:
+            pass
 
     new_job_data = {
         "status": "queued",
@@ -1380,6 +2174,8 @@ def redownload(job_id):
         "stage": "queued",
         "retryable": False,
     }
+    if thumb_url:
+        new_job_data["_thumb_path"] = str(new_thumb)
 
     added, error = _add_job(new_job_id, new_job_data)
     if not added:
@@ -1389,11 +2185,13 @@ def redownload(job_id):
 
     def do_redownload():
         try:
-            new_job["status"] = "downloading"
-            new_job["message"] = f"Downloading at {quality_label}..."
+            jobs.update_job(new_job_id, status="downloading", message=f"Downloading at {quality_label}...")
 
-            out_template = str(WORK_DIR / f"{new_job_id}_%(title)s.%(ext)s")
-            cmd = ["yt-dlp", "--no-playlist", "-o", out_template]
+            out_template = str(WORK_DIR / f"{new_job_id}.%(ext)s")
+            cmd = [
+                "yt-dlp", "--no-playlist", "-o", out_template,
+                "--print", "after_move:%(title)j", "--print", "after_move:filepath",
+            ]
 
             if audio_only or audio_bitrate:
                 if audio_bitrate:
@@ -1409,61 +2207,50 @@ def redownload(job_id):
 
             cmd.extend(["--", url])
             download_started = time.monotonic()
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=DOWNLOAD_TIMEOUT_SECONDS,
-            )
+            result = run_with_tail(cmd, timeout=DOWNLOAD_TIMEOUT_SECONDS)
 
             if result.returncode != 0:
-                new_job["status"] = "error"
-                new_job["message"] = f"Download failed: {result.stderr[:200]}"
+                jobs.update_job(new_job_id, status="error", message=f"Download failed: {result.stderr[:200]}")
                 check_queue_and_cleanup()
                 return
 
-            # Find downloaded file
-            downloaded = None
-            for f in WORK_DIR.iterdir():
-                if f.name.startswith(new_job_id) and not f.name.endswith("_thumb.jpg") and f.suffix in ('.mp4', '.mkv', '.webm', '.mov', '.m4a', '.mp3', '.wav'):
-                    downloaded = f
-                    break
+            downloaded, title = _downloaded_media(result)
 
             if not downloaded:
-                new_job["status"] = "error"
-                new_job["message"] = "Download completed but file not found."
+                jobs.update_job(new_job_id, status="error", message="Download completed but file not found.")
                 check_queue_and_cleanup()
                 return
 
-            new_job["_file_path"] = str(downloaded)
-            new_job["file_status"] = "present"
-            prefix = f"{new_job_id}_"
-            display_name = downloaded.name
-            if display_name.startswith(prefix):
-                display_name = display_name[len(prefix):]
-            new_job["filename"] = display_name
-            new_job["download_ready"] = True
-            new_job["download_path"] = str(downloaded)
-            new_job["status"] = "done"
-            new_job["message"] = "Complete"
+            jobs.update_job(
+                new_job_id,
+                _file_path=str(downloaded),
+                file_status="present",
+                filename=_media_filename(title or new_job.get("title"), downloaded),
+                download_ready=True,
+                download_path=str(downloaded),
+                status="done",
+                message="Complete",
+            )
             check_queue_and_cleanup()
 
         except subprocess.TimeoutExpired:
             elapsed = max(0, int(round(time.monotonic() - download_started)))
-            new_job["status"] = "error"
-            new_job["stage"] = "error"
-            new_job["failure_stage"] = "download"
-            new_job["failure_code"] = "timeout"
-            new_job["elapsed_seconds"] = elapsed
-            new_job["timeout_seconds"] = DOWNLOAD_TIMEOUT_SECONDS
-            new_job["message"] = (
-                f"Download timed out after {format_duration(elapsed)} "
-                f"(limit: {format_duration(DOWNLOAD_TIMEOUT_SECONDS)})."
+            jobs.update_job(
+                new_job_id,
+                status="error",
+                stage="error",
+                failure_stage="download",
+                failure_code="timeout",
+                elapsed_seconds=elapsed,
+                timeout_seconds=DOWNLOAD_TIMEOUT_SECONDS,
+                message=(
+                    f"Download timed out after {format_duration(elapsed)} "
+                    f"(limit: {format_duration(DOWNLOAD_TIMEOUT_SECONDS)})."
+                ),
             )
             check_queue_and_cleanup()
         except Exception as e:
-            new_job["status"] = "error"
-            new_job["message"] = f"Error: {str(e)}"
+            jobs.update_job(new_job_id, status="error", message=f"Error: {str(e)}")
             check_queue_and_cleanup()
 
     if not _submit_job(do_redownload):
@@ -1482,27 +2269,52 @@ def cleanup_file(job_id):
     if not job:
         return jsonify({"error": "Job not found"}), 404
 
+    _remove_job_files(job_id, job)
+    return jsonify({"ok": True})
+
+
+def _remove_job_files(job_id, job):
+    """Delete a job's media, audio exports, thumbnail and checkpoints."""
     file_path = job.get("_file_path", "")
     if file_path:
         p = Path(file_path)
-        if p.exists():
-            p.unlink(missing_ok=True)
-        # Clean up converted MP3 too
-        mp3_p = p.with_suffix(".mp3")
-        if mp3_p.exists():
-            mp3_p.unlink(missing_ok=True)
+        p.unlink(missing_ok=True)
+        # Clean up converted audio exports too
+        for audio_format in AUDIO_EXPORT_FORMATS:
+            p.with_suffix(f".{audio_format}").unlink(missing_ok=True)
+            job.pop(f"_{audio_format}_ready", None)
 
     # Clean up thumbnail too
-    thumb_path = WORK_DIR / f"{job_id}_thumb.jpg"
-    thumb_path.unlink(missing_ok=True)
-    for model in ("tiny", "base", "small", "medium"):
+    thumb_path = job.pop("_thumb_path", None)
+    if thumb_path:
+        Path(thumb_path).unlink(missing_ok=True)
+    for model in WHISPER_MODELS:
         cleanup_checkpoint(checkpoint_directory(WORK_DIR, job_id, model))
 
     job["file_status"] = "cleaned"
     job["download_ready"] = False
     job["retryable"] = False
     job["resume_available"] = False
-    return jsonify({"ok": True})
+
+
+def _expire_finished_jobs():
+    """Drop jobs that finished at least JOB_TTL_SECONDS ago, files included."""
+    for job_id, job in jobs.items():
+        with jobs.job_lock(job_id):
+            finished = jobs.finished_seconds(job_id)
+            if has_active_jobs([job]) or finished is None or finished < JOB_TTL_SECONDS:
+                continue
+            _remove_job_files(job_id, job)
+        jobs.pop(job_id, None)
+        _audio_export_locks.pop(job_id, None)
+
+
+def _job_janitor():
+    """Background thread: expire finished jobs a few times per TTL."""
+    interval = max(60, JOB_TTL_SECONDS // 4)
+    while True:
+        time.sleep(interval)
+        _expire_finished_jobs()
 
 
 # ─── Cleanup helpers ─────────────────────────────────────────
@@ -1525,28 +2337,72 @@ def check_queue_and_cleanup():
             continue
         file_path = job.get("_file_path", "")
         if file_path:
-            p = Path(file_path)
-            if p.exists():
-                p.unlink(missing_ok=True)
+            Path(file_path).unlink(missing_ok=True)
         job["file_status"] = "cleaned"
 
 
-def cleanup_downloads_dir():
-    """Remove all video files from the downloads directory (used on shutdown)."""
+_TRASH_PREFIX = f".{WORK_DIR.name}.trash-"
+
+
+def _remove_trash():
+    """Delete work directories set aside by earlier cleanups, including other runs'."""
+    try:
+        with os.scandir(WORK_DIR.parent) as entries:
+            stale = [entry.path for entry in entries if entry.name.startswith(_TRASH_PREFIX)]
+    except OSError:
+        return
+    for path in stale:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def cleanup_downloads_dir(background=False):
+    """Empty the downloads directory (used on startup and shutdown).
+
+    The directory is renamed aside and recreated, then the old tree is
+    deleted. With ``background`` (the startup sweep) the delete runs on a
+    daemon thread so the server starts without waiting on it; a removal cut
+    short by process exit is finished by the next startup. Otherwise the
+    delete completes before returning, so media never outlives shutdown.
+    Where the rename fails (Windows refuses while a file is open) the tree
+    is deleted in place instead.
+    """
+    trash = WORK_DIR.with_name(f"{_TRASH_PREFIX}{os.getpid()}-{uuid.uuid4().hex[:8]}")
     try:
-        for f in WORK_DIR.iterdir():
-            if f.is_file() and f.suffix in ('.mp4', '.mkv', '.webm', '.mov', '.m4a', '.mp3', '.wav', '.json', '.srt', '.vtt', '.txt', '.tsv', '.jpg'):
-                f.unlink(missing_ok=True)
-        shutil.rmtree(WORK_DIR / ".checkpoints", ignore_errors=True)
+        try:
+            os.rename(WORK_DIR, trash)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            shutil.rmtree(WORK_DIR, ignore_errors=True)
+        WORK_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if background:
+            threading.Thread(target=_remove_trash, name="videomasa-trash", daemon=True).start()
+        else:
+            _remove_trash()
     except Exception:
         pass
 
 
-atexit.register(cleanup_downloads_dir)
+# Re-entrant: the signal handler may interrupt the atexit cleanup on the main thread.
+_shutdown_cleanup_lock = threading.RLock()
+_shutdown_cleaned = False
+
+
+def _cleanup_at_shutdown():
+    """Empty the downloads directory once, however many exit paths fire."""
+    global _shutdown_cleaned
+    with _shutdown_cleanup_lock:
+        if _shutdown_cleaned:
+            return
+        _shutdown_cleaned = True
+        cleanup_downloads_dir()
+
+
+atexit.register(_cleanup_at_shutdown)
 
 
 def _signal_handler(signum, frame):
-    cleanup_downloads_dir()
+    _cleanup_at_shutdown()
     raise SystemExit(0)
 
 
@@ -1557,7 +2413,7 @@ signal.signal(signal.SIGTERM, _signal_handler)
 @app.route("/shutdown", methods=["POST"])
 def shutdown():
     """Graceful shutdown endpoint for the launcher/menu bar to stop the server."""
-    cleanup_downloads_dir()
+    _cleanup_at_shutdown()
     os.kill(os.getpid(), signal.SIGTERM)
     return jsonify({"ok": True})
 
@@ -1566,12 +2422,13 @@ def shutdown():
 def heartbeat():
     """Browser pings this every 30s. If no ping for 5 min, server auto-shuts down."""
     global _last_heartbeat
-    _last_heartbeat = time.time()
+    _last_heartbeat = time.monotonic()
+    _heartbeat_event.set()
     return jsonify({"ok": True})
 
 
 def _should_shutdown_for_inactivity(now=None):
-    current_time = time.time() if now is None else now
+    current_time = time.monotonic() if now is None else now
     if current_time - _last_heartbeat <= _HEARTBEAT_TIMEOUT:
         return False
     with jobs_lock:
@@ -1579,28 +2436,73 @@ def _should_shutdown_for_inactivity(now=None):
 
 
 def _heartbeat_watchdog():
-    """Background thread: check heartbeat, shut down if browser tab is gone."""
+    """Background thread: check heartbeat, shut down if browser tab is gone.
+
+    Sleeps until the heartbeat deadline instead of polling; each ping wakes
+    it to push the deadline back.
+    """
     while True:
-        time.sleep(30)
+        remaining = _HEARTBEAT_TIMEOUT - (time.monotonic() - _last_heartbeat)
+        if _heartbeat_event.wait(timeout=remaining if remaining > 0 else _WATCHDOG_RECHECK_SECONDS):
+            _heartbeat_event.clear()
+            continue
         if _should_shutdown_for_inactivity():
             print("\nNo browser heartbeat for 5 minutes — shutting down.")
-            cleanup_downloads_dir()
+            _cleanup_at_shutdown()
             os.kill(os.getpid(), signal.SIGTERM)
             break
 
 
+def _warm_whisper_model(model):
+    """Start loading an in-process model in the background; return the Future, or None.
+
+    None also means the model is already loaded and there is nothing to do.
+    """
+    if not USE_IN_PROCESS_WHISPER:
+        return None
+    checkpoint = resolve_whisper_model(model, WHISPER_DISTIL)
+    if whisper_model_loaded(checkpoint, WHISPER_COMPUTE_TYPE):
+        return None
+    return model_loader_executor.submit(_load_shared_whisper_model, checkpoint)
+
+
+def _preload_whisper_models():
+    """Load the configured in-process models so the first job doesn't wait on them."""
+    if not USE_IN_PROCESS_WHISPER:
+        return []
+    futures = (_warm_whisper_model(model) for model in WHISPER_PRELOAD_MODELS)
+    return [future for future in futures if future is not None]
+
+
+def _serve(port):
+    """Serve with waitress when installed, else Werkzeug's threaded server.
+
+    Job state lives in this process, so both run one process with a thread
+    pool rather than multiple workers.
+    """
+    try:
+        from waitress import serve
+    except ImportError:
+        app.run(debug=False, host="127.0.0.1", port=port, threaded=True)
+        return
+    serve(app, host="127.0.0.1", port=port, threads=SERVER_THREADS, _quiet=True)
+
+
 if __name__ == "__main__":
     # Clean up any leftover files from a previous un-clean shutdown
-    cleanup_downloads_dir()
+    cleanup_downloads_dir(background=True)
     port = APP_PORT
     launch_url = f"http://127.0.0.1:{port}/?token={API_TOKEN}"
-    if os.environ.get("VIDEOMASA_OPEN_BROWSER", "").lower() in ("1", "true", "yes"):
+    if os.environ.get("VIDEOMASA_OPEN_BROWSER", "").lower() in TRUE_VALUES:
         threading.Timer(1.5, lambda: webbrowser.open(launch_url)).start()
     # Start heartbeat watchdog — auto-shuts down if browser tab is closed
     watchdog = threading.Thread(target=_heartbeat_watchdog, daemon=True)
     watchdog.start()
+    if JOB_TTL_SECONDS:
+        threading.Thread(target=_job_janitor, name="videomasa-janitor", daemon=True).start()
+    _preload_whisper_models()
     print("\n" + "=" * 52)
     display_url = f"http://127.0.0.1:{port}" if CONFIGURED_API_TOKEN else launch_url
     print(f"  VIDEO TOOL running at {display_url}")
     print("=" * 52 + "\n")
-    app.run(debug=False, host="127.0.0.1", port=port)
+    _serve(port)
@@ -1,15 +1,20 @@
 import json
 import os
 import subprocess
+import sys
 import tempfile
+import threading
 import unittest
 import wave
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
 
 from videomasa.config import int_from_env, read_app_version
 from videomasa.runtime import check_health
-from videomasa.job_state import format_duration, has_active_jobs
+from videomasa import jsonio, transcription
+from videomasa.job_state import JobStore, format_duration, has_active_jobs
+from videomasa.processes import run_with_tail
 from videomasa.security import (
     constant_time_token_match,
     cookie_path,
@@ -17,14 +22,28 @@ from videomasa.security import (
     request_origin_is_local,
     validated_url,
 )
-from videomasa.subtitles import build_srt, format_srt_timestamp, parse_whisper_result
+from videomasa.transcript_cache import TranscriptCache, media_cache_key
+from videomasa.subtitles import (
+    build_srt,
+    format_srt_timestamp,
+    format_timestamped,
+    parse_whisper_result,
+)
 from videomasa.transcription import (
     LongFormTranscriptionFailure,
+    TranscriptionScheduler,
     TranscriptionTimeout,
     checkpoint_directory,
+    duration_bucket,
+    load_whisper_model,
+    probe_audio_codec,
     probe_media_duration,
+    resolve_whisper_model,
+    transcribe_in_process,
     transcribe_long_form,
     transcribe_with_whisper,
+    transcribe_with_whisper_cpp,
+    whisper_model_loaded,
 )
 
 
@@ -93,6 +112,88 @@ class RuntimeTests(unittest.TestCase):
         self.assertEqual(health["whisper_import"]["detail"], "OK")
 
 
+    def test_run_with_tail_keeps_only_the_end_of_chatty_output(self) -> None:
+        script = "import sys; print('x' * 100000); sys.stderr.write('boom' * 5000 + 'END'); sys.exit(3)"
+        result = run_with_tail([sys.executable, "-c", script], timeout=30, tail_bytes=64)
+
+        self.assertEqual(result.returncode, 3)
+        self.assertEqual(result.stdout, "x" * 63 + "\n")
+        self.assertEqual(len(result.stderr), 64)
+        self.assertTrue(result.stderr.endswith("END"))
+        with self.assertRaises(subprocess.TimeoutExpired):
+            run_with_tail([sys.executable, "-c", "import time; time.sleep(30)"], timeout=0.2)
+
+    def test_run_with_tail_line_filter_consumes_lines_from_both_streams(self) -> None:
+        script = (
+            "import sys; print('[progress] 1/2'); print('kept'); "
+            "sys.stderr.write('[progress] 2/2\\nfailed\\n')"
+        )
+        seen = []
+
+        def progress(line):
+            if line.startswith(b"[progress] "):
+                seen.append(line)
+                return True
+            return False
+
+        result = run_with_tail([sys.executable, "-c", script], timeout=30, line_filter=progress)
+
+        self.assertEqual(sorted(seen), [b"[progress] 1/2\n", b"[progress] 2/2\n"])
+        self.assertEqual(result.stdout.splitlines(), ["kept"])
+        self.assertEqual(result.stderr, "failed\n")
+
+    def test_run_with_tail_keeps_draining_after_a_line_filter_error(self) -> None:
+        script = "print('first'); print('second')"
+
+        def broken(line):
+            if line == b"first\n":
+                raise KeyError("job")
+            return False
+
+        with patch("builtins.print"):
+            result = run_with_tail([sys.executable, "-c", script], timeout=30, line_filter=broken)
+
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(result.stdout.splitlines(), ["first", "second"])
+
+    def test_run_with_tail_timeouts_share_one_watcher_thread(self) -> None:
+        sleeper = [sys.executable, "-c", "import time; time.sleep(30)"]
+        errors = []
+
+        def run():
+            try:
+                run_with_tail(sleeper, timeout=0.3)
+            except subprocess.TimeoutExpired as exc:
+                errors.append(exc)
+
+        callers = [threading.Thread(target=run) for _ in range(3)]
+        for caller in callers:
+            caller.start()
+        for caller in callers:
+            caller.join(10)
+
+        self.assertEqual(len(errors), 3)
+        watchers = [thread for thread in threading.enumerate() if thread.name == "videomasa-deadlines"]
+        self.assertEqual(len(watchers), 1)
+        self.assertEqual(run_with_tail([sys.executable, "-c", "pass"], timeout=30).returncode, 0)
+
+
+class JsonIOTests(unittest.TestCase):
+    def test_json_helpers_round_trip_bytes_text_and_files(self) -> None:
+        value = {"text": "Grüße", "segments": [{"start": 0.5, "end": 1.0}]}
+        encoded = jsonio.dumps(value)
+
+        self.assertEqual(jsonio.loads(encoded), value)
+        self.assertEqual(jsonio.loads(encoded.encode("utf-8")), value)
+        self.assertIn("Grüße", encoded)
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "talk.json"
+            path.write_text(encoded, encoding="utf-8")
+            self.assertEqual(jsonio.read_json_file(path), value)
+        with self.assertRaises(ValueError):
+            jsonio.loads(b"{not json")
+
+
 class SubtitleTests(unittest.TestCase):
     def test_srt_timestamps_preserve_milliseconds_and_roll_over(self) -> None:
         self.assertEqual(format_srt_timestamp(1.2346), "00:00:01,235")
@@ -120,6 +221,15 @@ class SubtitleTests(unittest.TestCase):
         )
 
 
+    def test_timestamped_lines_format_parallel_arrays_in_one_pass(self) -> None:
+        self.assertEqual(
+            format_timestamped([0.4, 61.9, 3725.0], [2.0, 75.2, 3730.5], ["One", "Two", "Three"]),
+            "[00:00 → 00:02]  One\n[01:01 → 01:15]  Two\n[62:05 → 62:10]  Three",
+        )
+        self.assertEqual(format_timestamped([], [], []), "")
+        self.assertEqual(format_timestamped([216_001], [216_062], ["Late"]), "[3600:01 → 3601:02]  Late")
+
+
 class JobStateTests(unittest.TestCase):
     def test_active_jobs_include_model_only_retranscriptions(self) -> None:
         self.assertFalse(has_active_jobs([{"status": "done", "transcripts": {}}]))
@@ -136,6 +246,87 @@ class JobStateTests(unittest.TestCase):
         self.assertEqual(format_duration(3_661), "1h 1m")
 
 
+    def test_job_store_behaves_like_a_dict_with_per_job_locks(self) -> None:
+        store = JobStore()
+        store["a"] = {"status": "queued"}
+        store.update_job("a", status="done", message="Complete")
+
+        self.assertEqual(store["a"], {"status": "done", "message": "Complete"})
+        self.assertIs(store.job_lock("a"), store.job_lock("a"))
+        self.assertIsNot(store.job_lock("missing"), store.job_lock("missing"))
+        self.assertEqual([job_id for job_id, _job in store.items()], ["a"])
+        self.assertEqual(store.pop("a")["message"], "Complete")
+        self.assertNotIn("a", store)
+
+    def test_job_store_snapshots_and_applies_changes_under_the_job_lock(self) -> None:
+        store = JobStore()
+        store["a"] = {"status": "queued", "transcripts": {}}
+
+        snapshot = store.snapshot("a")
+        added = store.apply("a", lambda job: job["transcripts"].setdefault("base", {"status": "running"}))
+        snapshot["status"] = "edited"
+
+        self.assertEqual(added, {"status": "running"})
+        self.assertEqual(store["a"]["status"], "queued")
+        self.assertIsNone(store.snapshot("missing"))
+        with self.assertRaises(KeyError):
+            store.apply("missing", dict)
+
+    def test_job_store_times_expiry_from_when_a_job_finished(self) -> None:
+        store = JobStore()
+        store["a"] = {"status": "transcribing", "transcripts": {}}
+        self.assertIsNone(store.finished_seconds("a"))
+
+        with patch("videomasa.job_state.time.monotonic", return_value=100.0):
+            store.update_job("a", status="done")
+        with patch("videomasa.job_state.time.monotonic", return_value=160.0):
+            store.update_job("a", thumbnail="/thumb/a")
+            self.assertEqual(store.finished_seconds("a"), 60.0)
+
+        store.update_job("a", status="transcribing")
+        self.assertIsNone(store.finished_seconds("a"))
+
+        store.touch("missing")
+        self.assertEqual(store.version("missing"), 0)
+        self.assertNotIn("missing", store._finished_at)
+
+
+class TranscriptCacheTests(unittest.TestCase):
+    def test_cache_round_trips_timed_text_and_evicts_least_recently_used(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            media = Path(directory) / "talk.wav"
+            media.write_bytes(b"same audio")
+            key = media_cache_key(media, "base")
+            whisper_data = {
+                "text": "Hello",
+                "language": "en",
+                "segments": [{"id": 0, "start": 0.0, "end": 1.0, "text": "Hello", "tokens": [1, 2, 3]}],
+            }
+            cache = TranscriptCache(Path(directory) / "cache" / "transcripts.sqlite3", 400)
+            cache.put(key, whisper_data)
+
+            self.assertTrue(key.endswith(":base"))
+            self.assertEqual(media_cache_key(media, "small")[:64], key[:64])
+            self.assertEqual(
+                cache.get(key),
+                {"text": "Hello", "language": "en", "segments": [{"id": 0, "start": 0.0, "end": 1.0, "text": "Hello"}]},
+            )
+            cache.put("other:base", {"text": "x" * 300, "segments": []})
+            self.assertIsNone(cache.get(key))
+            self.assertEqual(cache.get("other:base")["text"], "x" * 300)
+
+
+    def test_corrupt_database_disables_the_cache_instead_of_raising(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "transcripts.sqlite3"
+            path.write_bytes(b"this is not a database" * 100)
+
+            cache = TranscriptCache(path, 1024)
+            cache.put("key:base", {"text": "Hello", "segments": []})
+
+            self.assertFalse(cache.enabled)
+            self.assertIsNone(cache.get("key:base"))
+
 class TranscriptionExecutionTests(unittest.TestCase):
     def test_ffmpeg_duration_probe_parses_hours_minutes_and_seconds(self) -> None:
         def fake_runner(command, **_kwargs):
@@ -151,10 +342,26 @@ class TranscriptionExecutionTests(unittest.TestCase):
             3723.45,
         )
 
+    def test_audio_codec_probe_reads_the_first_audio_stream(self) -> None:
+        def fake_runner(command, **_kwargs):
+            return subprocess.CompletedProcess(
+                command,
+                1,
+                "",
+                "  Stream #0:0[0x1](und): Video: h264 (High), yuv420p, 1920x1080\n"
+                "  Stream #0:1[0x2](und): Audio: aac (LC) (mp4a / 0x6134706D), 44100 Hz, stereo\n",
+            )
+
+        def silent_runner(command, **_kwargs):
+            return subprocess.CompletedProcess(command, 1, "", "  Stream #0:0: Video: h264\n")
+
+        self.assertEqual(probe_audio_codec("talk.mp4", "/ffmpeg", runner=fake_runner), "aac")
+        self.assertIsNone(probe_audio_codec("silent.mp4", "/ffmpeg", runner=silent_runner))
+
     def test_timeout_reports_configured_limit_and_measured_elapsed_time(self) -> None:
         timeout = subprocess.TimeoutExpired(["whisper"], 25)
         with (
-            patch("videomasa.transcription.subprocess.run", side_effect=timeout),
+            patch("videomasa.transcription.run_with_tail", side_effect=timeout),
             patch("videomasa.transcription.time.monotonic", side_effect=[100.0, 125.5]),
         ):
             with self.assertRaises(TranscriptionTimeout) as caught:
@@ -164,6 +371,228 @@ class TranscriptionExecutionTests(unittest.TestCase):
         self.assertEqual(caught.exception.elapsed_seconds, 25.5)
         self.assertEqual(caught.exception.command[0], "whisper")
 
+    def test_whisper_cpp_output_is_rewritten_to_whisper_json_after_wav_conversion(self) -> None:
+        commands = []
+
+        def fake_run(command, **_kwargs):
+            commands.append(command)
+            if command[0] == "/whisper-cli":
+                Path(f"{command[command.index('-of') + 1]}.json").write_text(json.dumps({
+                    "result": {"language": "en"},
+                    "transcription": [
+                        {"offsets": {"from": 0, "to": 1500}, "text": " Hello"},
+                        {"offsets": {"from": 1500, "to": 2750}, "text": " world"},
+                    ],
+                }))
+            return subprocess.CompletedProcess(command, 0, "", "")
+
+        with tempfile.TemporaryDirectory() as directory:
+            output_dir = Path(directory)
+            result, _elapsed = transcribe_with_whisper_cpp(
+                output_dir / "talk.mp4",
+                "base",
+                output_dir,
+                60,
+                whisper_cli="/whisper-cli",
+                model_path="/ggml-base-q5_0.bin",
+                ffmpeg_bin="/ffmpeg",
+                runner=fake_run,
+            )
+            data = json.loads((output_dir / "talk.json").read_text())
+            leftovers = sorted(path.name for path in output_dir.iterdir())
+
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual([command[0] for command in commands], ["/ffmpeg", "/whisper-cli"])
+        self.assertTrue(commands[1][commands[1].index("-f") + 1].endswith("talk.whisper-cpp.wav"))
+        self.assertEqual(data["text"], "Hello world")
+        self.assertEqual(data["language"], "en")
+        self.assertEqual([(seg["start"], seg["end"]) for seg in data["segments"]], [(0.0, 1.5), (1.5, 2.75)])
+        self.assertEqual(leftovers, ["talk.json"])
+
+    def test_in_process_transcription_builds_whisper_json_without_output_files(self) -> None:
+        class FakeSegment:
+            def __init__(self, index, start, end, text):
+                self.id = index
+                self.start = start
+                self.end = end
+                self.text = text
+
+        class FakeModel:
+            def transcribe(self, source, **options):
+                self.source = source
+                self.options = options
+                segments = iter([
+                    FakeSegment(0, 0.0, 1.5, " Hello"),
+                    FakeSegment(1, 1.5, 3.0, " world."),
+                    FakeSegment(2, 3.0, 4.0, " Subtitles by the Amara.org community"),
+                    FakeSegment(3, 4.0, 5.0, " Again."),
+                    FakeSegment(4, 5.0, 6.0, " again"),
+                    FakeSegment(5, 6.0, 7.0, " Again."),
+                    FakeSegment(6, 7.0, 8.0, " Again."),
+                ])
+                return segments, SimpleNamespace(language="en")
+
+        fake_model = FakeModel()
+        data, _elapsed = transcribe_in_process(
+            "podcast.mp4",
+            "base",
+            60,
+            model_loader=lambda _model: fake_model,
+        )
+
+        self.assertEqual(data["text"], "Hello world. Again. again")
+        self.assertEqual(data["language"], "en")
+        self.assertEqual([segment["end"] for segment in data["segments"]], [1.5, 3.0, 5.0, 6.0])
+        self.assertTrue(fake_model.options["vad_filter"])
+        self.assertFalse(fake_model.options["condition_on_previous_text"])
+
+    def test_gpu_transcription_decodes_audio_before_queueing_for_the_lane(self) -> None:
+        decoded = []
+
+        def decode_audio(path):
+            decoded.append((path, threading.current_thread().name))
+            return "pcm"
+
+        class FakeModel:
+            def transcribe(self, audio, **options):
+                self.audio = audio
+                self.options = options
+                return iter([]), SimpleNamespace(language=None)
+
+        fake_model = FakeModel()
+        with (
+            patch.dict("sys.modules", {"faster_whisper": SimpleNamespace(decode_audio=decode_audio)}),
+            patch("videomasa.transcription._cuda_available", return_value=True),
+            patch("videomasa.transcription._batched_pipeline", side_effect=lambda _name, model: model),
+        ):
+            transcribe_in_process("talk.mp4", "base", 60, model_loader=lambda _model: fake_model, gpu_batch_size=8)
+
+        self.assertEqual(decoded, [("talk.mp4", threading.current_thread().name)])
+        self.assertEqual(fake_model.audio, "pcm")
+        self.assertEqual(fake_model.options["batch_size"], 8)
+
+    def test_shared_model_is_loaded_once_as_int8_with_parallel_workers(self) -> None:
+        created = []
+
+        def whisper_model(name, **options):
+            created.append((name, options))
+            return SimpleNamespace(name=name)
+
+        fake_module = SimpleNamespace(WhisperModel=whisper_model)
+        with (
+            patch.dict("sys.modules", {"faster_whisper": fake_module}),
+            patch("videomasa.transcription._cuda_available", return_value=False),
+            patch("videomasa.transcription.os.cpu_count", return_value=8),
+            patch.dict("videomasa.transcription._WHISPER_MODELS", clear=True),
+        ):
+            self.assertFalse(whisper_model_loaded("base"))
+            first = load_whisper_model("base", num_workers=2)
+            second = load_whisper_model("base", num_workers=2)
+            load_whisper_model("large-v3", compute_type="int8_float32")
+            requantized = load_whisper_model("base", compute_type="int8_float32")
+            self.assertTrue(whisper_model_loaded("base"))
+            self.assertFalse(whisper_model_loaded("large-v3"))
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, requantized)
+        self.assertEqual(created[0], ("base", {"device": "cpu", "compute_type": "int8", "num_workers": 2, "cpu_threads": 4}))
+        self.assertEqual(created[1][1]["compute_type"], "int8_float32")
+        self.assertEqual(len(created), 3)
+
+    def test_cuda_compute_type_falls_back_to_what_the_gpu_supports(self) -> None:
+        cases = (
+            ({"float32", "int8_float16", "float16", "int8"}, "int8_float16"),
+            ({"float32", "float16"}, "float16"),
+            ({"float32"}, "float32"),
+        )
+        for supported, expected in cases:
+            ctranslate2 = SimpleNamespace(get_supported_compute_types=lambda _device, types=supported: types)
+            transcription._cuda_compute_type.cache_clear()
+            with patch.dict("sys.modules", {"ctranslate2": ctranslate2}):
+                self.assertEqual(transcription._cuda_compute_type(), expected)
+        transcription._cuda_compute_type.cache_clear()
+
+    def test_scheduler_runs_each_model_in_order_on_its_own_thread(self) -> None:
+        scheduler = TranscriptionScheduler()
+        order = []
+
+        def work(label):
+            order.append((label, threading.current_thread().name))
+            return label
+
+        futures = [scheduler.submit("base", work, label) for label in ("first", "second")]
+        other = scheduler.submit("small", work, "other")
+        failed = scheduler.submit("base", int, "not a number")
+
+        self.assertEqual([future.result(timeout=5) for future in futures], ["first", "second"])
+        self.assertEqual(other.result(timeout=5), "other")
+        with self.assertRaises(ValueError):
+            failed.result(timeout=5)
+        base_runs = [entry for entry in order if entry[0] != "other"]
+        self.assertEqual(base_runs, [("first", "transcribe-base"), ("second", "transcribe-base")])
+        self.assertIn(("other", "transcribe-small"), order)
+
+    def test_scheduler_runs_waiting_short_media_before_long_media(self) -> None:
+        scheduler = TranscriptionScheduler()
+        release = threading.Event()
+        order = []
+
+        blocker = scheduler.submit("base", release.wait, 5)
+        futures = [
+            scheduler.submit("base", order.append, label, priority=duration_bucket(seconds))
+            for label, seconds in (("unknown", None), ("long", 3600), ("clip", 12), ("medium", 300))
+        ]
+        release.set()
+
+        self.assertTrue(blocker.result(timeout=5))
+        for future in futures:
+            future.result(timeout=5)
+        self.assertEqual(order, ["clip", "medium", "unknown", "long"])
+        self.assertEqual(duration_bucket(29.9), 0)
+        self.assertEqual(duration_bucket(30), 1)
+
+    def test_distil_mapping_is_opt_in_and_preserves_model_choices(self) -> None:
+        self.assertEqual(resolve_whisper_model("base"), "base")
+        self.assertEqual(resolve_whisper_model("base", distil=True), "distil-small.en")
+        self.assertEqual(resolve_whisper_model("medium", distil=True), "distil-large-v2")
+        self.assertEqual(resolve_whisper_model("large-v3", distil=True), "distil-large-v3")
+
+    def test_in_process_transcription_enforces_wall_clock_limit_between_segments(self) -> None:
+        class FakeModel:
+            def transcribe(self, _source, **_options):
+                segment = SimpleNamespace(id=0, start=0.0, end=1.0, text=" late")
+                return iter([segment]), SimpleNamespace(language="en")
+
+        with patch("videomasa.transcription.time.monotonic", side_effect=[100.0, 131.0]):
+            with self.assertRaises(TranscriptionTimeout) as caught:
+                transcribe_in_process("podcast.mp4", "base", 30, model_loader=lambda _model: FakeModel())
+
+        self.assertEqual(caught.exception.timeout_seconds, 30)
+        self.assertEqual(caught.exception.command[0], "faster-whisper")
+
+    def test_chunk_sidecar_cleanup_keeps_chunks_and_completed_results(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary:
+            checkpoint = Path(temporary)
+            names = (
+                "chunk-00000.wav", "chunk-00000.json", "chunk-00000.srt", "chunk-00000.wav.json",
+                "chunk-00001.wav", "chunk-00001.json", "manifest.json",
+            )
+            for name in names:
+                (checkpoint / name).write_text("x")
+            chunks = [
+                {"file": "chunk-00000.wav", "status": "completed", "result_file": "chunk-00000.json"},
+                {"file": "chunk-00001.wav", "status": "pending"},
+            ]
+
+            with patch("videomasa.transcription.os.scandir", wraps=os.scandir) as scandir:
+                transcription._cleanup_chunk_sidecars(checkpoint, chunks)
+
+            scandir.assert_called_once_with(checkpoint)
+            self.assertEqual(
+                sorted(path.name for path in checkpoint.iterdir()),
+                ["chunk-00000.json", "chunk-00000.wav", "chunk-00001.wav", "manifest.json"],
+            )
+
     def test_long_form_retry_skips_checkpointed_chunks_and_merges_offsets(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             root = Path(temp_dir)
@@ -3,10 +3,14 @@ import json
 import os
 import stat
 import subprocess
+import sys
 import tempfile
+import threading
 import unittest
+from concurrent.futures import Future
 from pathlib import Path
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 
 TEST_ROOT = tempfile.TemporaryDirectory()
@@ -16,8 +20,12 @@ os.environ["VIDEOMASA_PORT"] = "18765"
 os.environ["VIDEOMASA_WORK_DIR"] = str(STATE_ROOT / "downloads")
 os.environ["VIDEOMASA_COOKIES_DIR"] = str(STATE_ROOT / "cookies")
 os.environ["VIDEOMASA_SKIP_HEALTH_CHECKS"] = "1"
+os.environ["VIDEOMASA_WHISPER_BACKEND"] = "cli"
+os.environ["VIDEOMASA_TRANSCRIPT_CACHE_BYTES"] = "0"
+os.environ["VIDEOMASA_CACHE_DIR"] = str(STATE_ROOT / "cache")
 
 import app as videomasa
+from videomasa.transcript_cache import TranscriptCache, media_cache_key
 from videomasa.transcription import (
     LongFormResult,
     LongFormTranscriptionFailure,
@@ -81,6 +89,117 @@ class StabilizationTests(unittest.TestCase):
         self.assertTrue(external.exists())
         self.assertEqual(videomasa._cookie_args("cookie:../secret"), [])
 
+    def test_library_cookie_options_mirror_cli_flags(self) -> None:
+        self.assertEqual(videomasa._cookie_options("none"), {})
+        self.assertEqual(videomasa._cookie_options("firefox"), {"cookiesfrombrowser": ("firefox",)})
+        self.assertEqual(videomasa._cookie_options("cookie:../secret"), {})
+
+    def test_format_probe_writes_the_thumbnail_in_the_same_extraction(self) -> None:
+        thumb_path = videomasa.WORK_DIR / "probe_thumb.jpg"
+        youtube_dl = MagicMock()
+        ydl = youtube_dl.return_value.__enter__.return_value
+        ydl.extract_info.return_value = {"formats": [{"height": 720, "vcodec": "avc1"}]}
+        with patch.dict(sys.modules, {"yt_dlp": SimpleNamespace(YoutubeDL=youtube_dl)}):
+            formats = videomasa._probe_formats("https://example.com/watch", "none", thumb_path)
+
+        options = youtube_dl.call_args.args[0]
+        self.assertEqual(formats, {"video": [720], "audio": []})
+        self.assertTrue(options["writethumbnail"])
+        self.assertEqual(options["outtmpl"], {"default": str(videomasa.WORK_DIR / "probe_thumb")})
+        self.assertEqual(options["postprocessors"][0]["format"], "jpg")
+        ydl.extract_info.assert_called_once_with("https://example.com/watch", download=True)
+
+    def test_cleanup_swaps_out_the_work_dir_and_removes_it_later(self) -> None:
+        (videomasa.WORK_DIR / "leftover.mp4").write_bytes(b"media")
+        (videomasa.WORK_DIR / ".checkpoints").mkdir(exist_ok=True)
+
+        with patch("app.threading.Thread") as thread:
+            videomasa.cleanup_downloads_dir(background=True)
+
+        self.assertEqual(list(videomasa.WORK_DIR.iterdir()), [])
+        trash = list(videomasa.WORK_DIR.parent.glob(videomasa._TRASH_PREFIX + "*"))
+        self.assertEqual(len(trash), 1)
+        self.assertTrue((trash[0] / "leftover.mp4").exists())
+        thread.return_value.start.assert_called_once_with()
+
+        videomasa._remove_trash()
+        self.assertFalse(trash[0].exists())
+
+    def test_shutdown_cleanup_deletes_media_before_returning_and_runs_once(self) -> None:
+        for index in range(20):
+            (videomasa.WORK_DIR / f"saved-{index}.mp4").write_bytes(b"media")
+
+        with (
+            patch("app._shutdown_cleaned", False),
+            patch("app.cleanup_downloads_dir", wraps=videomasa.cleanup_downloads_dir) as cleanup,
+        ):
+            videomasa._cleanup_at_shutdown()
+            videomasa._cleanup_at_shutdown()
+
+        cleanup.assert_called_once_with()
+        self.assertTrue(videomasa.WORK_DIR.is_dir())
+        self.assertEqual(list(videomasa.WORK_DIR.iterdir()), [])
+        self.assertEqual(list(videomasa.WORK_DIR.parent.glob(videomasa._TRASH_PREFIX + "*")), [])
+
+    def test_startup_preloads_configured_in_process_models(self) -> None:
+        with (
+            patch("app.USE_IN_PROCESS_WHISPER", True),
+            patch("app.WHISPER_PRELOAD_MODELS", ("base", "medium")),
+            patch("app._load_shared_whisper_model") as loader,
+        ):
+            futures = videomasa._preload_whisper_models()
+            for future in futures:
+                future.result(timeout=5)
+
+        self.assertEqual(sorted(call.args[0] for call in loader.call_args_list), ["base", "medium"])
+        with patch("app.USE_IN_PROCESS_WHISPER", False):
+            self.assertEqual(videomasa._preload_whisper_models(), [])
+
+    def test_model_warm_up_uses_its_own_thread_and_skips_loaded_models(self) -> None:
+        with (
+            patch("app.USE_IN_PROCESS_WHISPER", True),
+            patch("app.whisper_model_loaded", side_effect=lambda model, _compute_type: model == "base"),
+            patch("app._load_shared_whisper_model", side_effect=lambda _model: threading.current_thread().name),
+            patch("app.io_executor") as io_pool,
+        ):
+            self.assertIsNone(videomasa._warm_whisper_model("base"))
+            thread_name = videomasa._warm_whisper_model("small").result(timeout=5)
+
+        self.assertTrue(thread_name.startswith("videomasa-model"))
+        io_pool.submit.assert_not_called()
+
+    def test_process_warms_the_chosen_model_while_the_job_downloads(self) -> None:
+        self.bootstrap()
+        warmed = []
+        with (
+            patch("app._submit_job", return_value=True),
+            patch("app._warm_whisper_model", side_effect=warmed.append),
+        ):
+            for transcribe in (True, False):
+                response = self.client.post(
+                    "/process",
+                    base_url=BASE_URL,
+                    json={"url": "https://example.com/video", "model": "small", "transcribe": transcribe, "download": True},
+                )
+                self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(warmed, ["small"])
+
+    def test_download_path_comes_from_yt_dlp_output_inside_work_dir(self) -> None:
+        media = videomasa.WORK_DIR / "abc123.mp4"
+        media.write_bytes(b"media")
+        stray = STATE_ROOT / "x.mp4"
+        stray.write_bytes(b"media")
+        printed = subprocess.CompletedProcess(["yt-dlp"], 0, f'"Clip: a/b"\n{media}\n', "")
+        outside = subprocess.CompletedProcess(["yt-dlp"], 0, f"{stray}\n", "")
+
+        self.assertEqual(videomasa._downloaded_media(printed), (media, "Clip: a/b"))
+        self.assertEqual(videomasa._media_filename("Clip: a/b", media), "Clip: a_b.mp4")
+        self.assertEqual(videomasa._downloaded_media(outside), (None, ""))
+        self.assertEqual(videomasa._downloaded_media(subprocess.CompletedProcess(["yt-dlp"], 0, "", "")), (None, ""))
+        media.unlink()
+        stray.unlink()
+
     def test_cookie_upload_is_strictly_named_and_private(self) -> None:
         self.bootstrap()
         invalid = self.client.post(
@@ -115,6 +234,284 @@ class StabilizationTests(unittest.TestCase):
         self.assertNotIn("_file_path", response.get_json())
         self.assertNotIn("_subtitle_tracks", response.get_json())
 
+    def test_thumbnail_is_served_from_the_recorded_path_with_cache_validators(self) -> None:
+        self.bootstrap()
+        thumb_path = videomasa.WORK_DIR / "pictured_thumb.jpg"
+        thumb_path.write_bytes(b"jpeg")
+        (videomasa.WORK_DIR / "unrecorded_thumb.jpg").write_bytes(b"jpeg")
+        with videomasa.jobs_lock:
+            videomasa.jobs["pictured"] = {"status": "done", "_thumb_path": str(thumb_path)}
+            videomasa.jobs["unrecorded"] = {"status": "done"}
+
+        response = self.client.get("/thumb/pictured", base_url=BASE_URL)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, b"jpeg")
+        self.assertIn("max-age=3600", response.headers["Cache-Control"])
+        self.assertIn("immutable", response.headers["Cache-Control"])
+        self.assertIn("private", response.headers["Cache-Control"])
+        self.assertNotIn("public", response.headers["Cache-Control"])
+        etag = response.headers["ETag"]
+        response.close()
+        revalidated = self.client.get(
+            "/thumb/pictured",
+            base_url=BASE_URL,
+            headers={"If-None-Match": etag},
+        )
+        self.assertEqual(revalidated.status_code, 304)
+        revalidated.close()
+        self.assertEqual(self.client.get("/thumb/unrecorded", base_url=BASE_URL).status_code, 404)
+        thumb_path.unlink()
+        self.assertEqual(self.client.get("/thumb/pictured", base_url=BASE_URL).status_code, 404)
+        (videomasa.WORK_DIR / "unrecorded_thumb.jpg").unlink()
+
+    def test_media_download_supports_range_requests_for_resume(self) -> None:
+        self.bootstrap()
+        media = videomasa.WORK_DIR / "ranged_Clip.mp4"
+        media.write_bytes(b"0123456789")
+        with videomasa.jobs_lock:
+            videomasa.jobs["ranged"] = {
+                "status": "done",
+                "download_path": str(media),
+                "filename": "Clip.mp4",
+            }
+
+        response = self.client.get("/download/ranged", base_url=BASE_URL, headers={"Range": "bytes=4-"})
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.data, b"456789")
+        self.assertEqual(response.headers["Content-Range"], "bytes 4-9/10")
+        self.assertIn("ETag", response.headers)
+        response.close()
+        media.unlink()
+        self.assertEqual(self.client.get("/download/ranged", base_url=BASE_URL).status_code, 404)
+
+    def test_media_download_can_be_handed_to_nginx_with_x_accel_redirect(self) -> None:
+        self.bootstrap()
+        media = videomasa.WORK_DIR / "proxied.mp4"
+        media.write_bytes(b"0123456789")
+        with videomasa.jobs_lock:
+            videomasa.jobs["proxied"] = {"status": "done", "download_path": str(media), "filename": "Clip.mp4"}
+
+        with (
+            patch("app.XACCEL_PREFIX", "/_protected"),
+            patch.dict(videomasa.app.config, {"USE_X_SENDFILE": True}),
+        ):
+            response = self.client.get("/download/proxied", base_url=BASE_URL)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["X-Accel-Redirect"], "/_protected/proxied.mp4")
+        self.assertNotIn("X-Sendfile", response.headers)
+        self.assertIn("Clip.mp4", response.headers["Content-Disposition"])
+        self.assertEqual(response.data, b"")
+        response.close()
+        media.unlink()
+
+    def test_mp3_conversion_runs_once_and_publishes_atomically(self) -> None:
+        self.bootstrap()
+        media = videomasa.WORK_DIR / "song_Track.m4a"
+        media.write_bytes(b"aac")
+        with videomasa.jobs_lock:
+            videomasa.jobs["song"] = {"status": "done", "_file_path": str(media), "filename": "Track.m4a"}
+        commands = []
+
+        def fake_ffmpeg(command, **_kwargs):
+            commands.append(command)
+            Path(command[-1]).write_bytes(b"mp3")
+            return subprocess.CompletedProcess(command, 0, b"", b"")
+
+        with patch("app.run_with_tail", side_effect=fake_ffmpeg):
+            first = self.client.get("/download-mp3/song", base_url=BASE_URL)
+            second = self.client.get("/download-mp3/song", base_url=BASE_URL)
+
+        self.assertEqual((first.status_code, second.status_code), (200, 200))
+        self.assertEqual(second.data, b"mp3")
+        self.assertEqual(len(commands), 1)
+        self.assertTrue(commands[0][-1].endswith(".mp3.part"))
+        self.assertFalse(media.with_name("song_Track.mp3.part").exists())
+        first.close()
+        second.close()
+        media.with_suffix(".mp3").unlink()
+        media.unlink()
+
+    def test_m4a_export_copies_an_aac_stream_instead_of_reencoding(self) -> None:
+        self.bootstrap()
+        media = videomasa.WORK_DIR / "clip_Talk.mp4"
+        media.write_bytes(b"mp4")
+        with videomasa.jobs_lock:
+            videomasa.jobs["clip"] = {"status": "done", "_file_path": str(media), "filename": "Talk.mp4"}
+        commands = []
+
+        def fake_ffmpeg(command, **_kwargs):
+            commands.append(command)
+            Path(command[-1]).write_bytes(b"m4a")
+            return subprocess.CompletedProcess(command, 0, b"", b"")
+
+        with (
+            patch("app.probe_audio_codec", return_value="aac"),
+            patch("app.run_with_tail", side_effect=fake_ffmpeg),
+        ):
+            response = self.client.get("/download-mp3/clip?format=m4a", base_url=BASE_URL)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Talk.m4a", response.headers["Content-Disposition"])
+        self.assertEqual(commands[0][commands[0].index("-c:a") + 1], "copy")
+        response.close()
+        self.assertEqual(self.client.get("/download-mp3/clip?format=wav", base_url=BASE_URL).status_code, 400)
+        media.with_suffix(".m4a").unlink()
+        media.unlink()
+
+    def test_status_fields_omit_transcript_text_until_fetched_separately(self) -> None:
+        self.bootstrap()
+        with videomasa.jobs_lock:
+            videomasa.jobs["lean"] = {
+                "status": "done",
+                "message": "Complete",
+                "transcript": "Long text",
+                "transcripts": {"base": {"transcript": "Long text", "timestamped": "[00:00]", "status": "done"}},
+                "_file_path": "/private/source.mp4",
+            }
+
+        lean = self.client.get(
+            "/status/lean?fields=status,transcript_status,_file_path",
+            base_url=BASE_URL,
+        ).get_json()
+        entry = self.client.get("/transcript/lean/base", base_url=BASE_URL)
+
+        self.assertEqual(lean, {"status": "done", "transcript_status": {"base": "done"}})
+        self.assertEqual(entry.status_code, 200)
+        self.assertEqual(entry.get_json()["transcript"], "Long text")
+        self.assertEqual(self.client.get("/transcript/lean/small", base_url=BASE_URL).status_code, 404)
+        self.assertIn("transcripts", self.client.get("/status/lean", base_url=BASE_URL).get_json())
+
+    def test_status_streams_live_segments_after_the_requested_index(self) -> None:
+        self.bootstrap()
+        with videomasa.jobs_lock:
+            videomasa.jobs["live"] = {"status": "transcribing", "transcripts": {}}
+        videomasa._append_live_segment("live", {"start": 0.0, "end": 1.0, "text": " First "})
+        videomasa._append_live_segment("live", {"start": 1.0, "end": 2.5, "text": "Second"})
+
+        response = self.client.get("/status/live?since=1", base_url=BASE_URL)
+
+        data = response.get_json()
+        self.assertEqual(data["version"], 2)
+        self.assertEqual(data["seg_version"], 2)
+        self.assertEqual(data["new_starts"], [1.0])
+        self.assertEqual(data["new_ends"], [2.5])
+        self.assertEqual(data["new_texts"], ["Second"])
+        self.assertNotIn("_seg_text", data)
+        self.assertNotIn("new_texts", self.client.get("/status/live", base_url=BASE_URL).get_json())
+
+    def test_unchanged_status_is_answered_not_modified(self) -> None:
+        self.bootstrap()
+        with videomasa.jobs_lock:
+            videomasa.jobs["steady"] = {"status": "downloading", "message": "Downloading video..."}
+
+        first = self.client.get("/status/steady?fields=status,message", base_url=BASE_URL)
+        repeat = self.client.get(
+            "/status/steady?fields=status,message",
+            base_url=BASE_URL,
+            headers={"If-None-Match": first.headers["ETag"]},
+        )
+        videomasa.jobs.update_job("steady", message="Transcribing audio...")
+        changed = self.client.get(
+            "/status/steady?fields=status,message",
+            base_url=BASE_URL,
+            headers={"If-None-Match": first.headers["ETag"]},
+        )
+
+        self.assertEqual(repeat.status_code, 304)
+        self.assertEqual(changed.status_code, 200)
+        self.assertEqual(changed.get_json()["message"], "Transcribing audio...")
+
+    def test_event_stream_pushes_only_changed_keys_and_live_segments(self) -> None:
+        self.bootstrap()
+        with videomasa.jobs_lock:
+            videomasa.jobs["pushed"] = {"status": "transcribing", "message": "Transcribing audio...", "transcripts": {}}
+
+        def finish() -> None:
+            videomasa._append_live_segment("pushed", {"start": 0.0, "end": 1.0, "text": "Hello"})
+            videomasa.jobs.update_job("pushed", status="done", message="Complete")
+
+        response = self.client.get("/events/pushed?fields=status,message", base_url=BASE_URL)
+        worker = threading.Timer(0.05, finish)
+        worker.start()
+        body = b"".join(response.response).decode("utf-8")
+        worker.join()
+        response.close()
+
+        events = [block for block in body.split("\n\n") if block and not block.startswith(":")]
+        payloads = [json.loads(block[len("data: "):]) for block in events if block.startswith("data: ")]
+        self.assertEqual(response.mimetype, "text/event-stream")
+        self.assertEqual(payloads[0], {"status": "transcribing", "message": "Transcribing audio...", "version": 0})
+        self.assertEqual([text for payload in payloads for text in payload.get("new_texts", [])], ["Hello"])
+        self.assertEqual(
+            {key: payloads[-1][key] for key in ("status", "message", "version")},
+            {"status": "done", "message": "Complete", "version": 1},
+        )
+        self.assertEqual(events[-1], "event: end\ndata: {}")
+        self.assertEqual(self.client.get("/events/missing", base_url=BASE_URL).status_code, 404)
+
+    def test_multiplexed_event_stream_tags_each_job_and_ends_per_job(self) -> None:
+        self.bootstrap()
+        with videomasa.jobs_lock:
+            videomasa.jobs["first"] = {"status": "transcribing", "message": "Transcribing audio...", "transcripts": {}}
+            videomasa.jobs["second"] = {"status": "done", "message": "Complete", "transcripts": {}}
+
+        def finish() -> None:
+            videomasa._append_live_segment("first", {"start": 0.0, "end": 1.0, "text": "Hello"})
+            videomasa.jobs.update_job("first", status="done", message="Complete")
+
+        response = self.client.get("/events?fields=status&jobs=first:0,second:0,missing:0", base_url=BASE_URL)
+        worker = threading.Timer(0.05, finish)
+        worker.start()
+        body = b"".join(response.response).decode("utf-8")
+        worker.join()
+        response.close()
+
+        events = [block for block in body.split("\n\n") if block and not block.startswith(":")]
+        payloads = [json.loads(block[len("data: "):]) for block in events if block.startswith("data: ")]
+        ended = [json.loads(block.split("data: ", 1)[1])["job"] for block in events if block.startswith("event: end")]
+        self.assertEqual(ended, ["second", "first"])
+        self.assertEqual(payloads[0], {"job": "first", "status": "transcribing", "version": 0})
+        self.assertEqual(payloads[1], {"job": "second", "status": "done", "version": 0})
+        self.assertEqual(
+            [text for payload in payloads if payload["job"] == "first" for text in payload.get("new_texts", [])],
+            ["Hello"],
+        )
+        self.assertEqual(payloads[-1]["status"], "done")
+        self.assertEqual(self.client.get("/events?jobs=missing:0", base_url=BASE_URL).status_code, 404)
+
+    def test_event_stream_rebuilds_only_jobs_that_changed(self) -> None:
+        videomasa.jobs["busy"] = {"status": "downloading", "transcripts": {}}
+        videomasa.jobs["quiet"] = {"status": "downloading", "transcripts": {}}
+        events = videomasa._status_events({"quiet": 0, "busy": 0}, "status", tagged=True)
+        self.assertEqual([json.loads(next(events)[len("data: "):])["job"] for _ in range(2)], ["quiet", "busy"])
+
+        videomasa.jobs.update_job("busy", status="transcribing")
+        with (
+            patch("app.EVENT_POLL_SECONDS", 5),
+            patch("app._public_status", wraps=videomasa._public_status) as build,
+        ):
+            payload = json.loads(next(events)[len("data: "):])
+
+        self.assertEqual(payload, {"job": "busy", "status": "transcribing", "version": 0})
+        self.assertEqual([call.args[0] for call in build.call_args_list], ["busy"])
+        events.close()
+
+    def test_unread_event_stream_releases_its_slot_on_close(self) -> None:
+        videomasa.jobs["unread"] = {"status": "transcribing", "message": "Transcribing audio...", "transcripts": {}}
+        slots = threading.BoundedSemaphore(1)
+
+        with patch("app._event_stream_slots", slots), videomasa.app.test_request_context():
+            for tagged in (False, True):
+                response = videomasa._event_stream_response({"unread": 0}, None, tagged=tagged)
+                self.assertEqual(response.status_code, 200)
+                self.assertFalse(slots.acquire(blocking=False))
+                response.close()
+                response.close()
+                self.assertTrue(slots.acquire(blocking=False))
+                slots.release()
+
     def test_srt_download_is_model_specific_utf8_and_media_independent(self) -> None:
         self.bootstrap()
         with videomasa.jobs_lock:
@@ -179,6 +576,115 @@ class StabilizationTests(unittest.TestCase):
         finally:
             videomasa.MAX_PENDING_JOBS = old_limit
 
+    def test_yt_dlp_progress_lines_update_the_download_message(self) -> None:
+        videomasa.jobs["dl"] = {"status": "downloading", "message": "Downloading video..."}
+
+        self.assertTrue(videomasa._record_download_progress("dl", b"[progress] 512/2048.0\n"))
+        self.assertEqual(videomasa.jobs["dl"]["message"], "Downloading video... 25%")
+        self.assertTrue(videomasa._record_download_progress("dl", b"[progress] 512/NA\n"))
+        self.assertEqual(videomasa.jobs["dl"]["message"], "Downloading video... 25%")
+        self.assertFalse(videomasa._record_download_progress("dl", b"ERROR: unavailable\n"))
+
+        videomasa.jobs["dl"]["status"] = "transcribing"
+        self.assertTrue(videomasa._record_download_progress("dl", b"[progress] 2048/2048\n"))
+        self.assertEqual(videomasa.jobs["dl"]["message"], "Downloading video... 25%")
+        self.assertTrue(videomasa._record_download_progress("removed", b"[progress] 1/2\n"))
+
+        videomasa.jobs["dl"].update(status="downloading", message="Transcribing audio while the video downloads...")
+        self.assertTrue(videomasa._record_download_progress("dl", b"[progress] 1024/2048\n"))
+        self.assertEqual(videomasa.jobs["dl"]["message"], "Transcribing audio while the video downloads...")
+
+    def test_transcription_transitions_notify_event_streams(self) -> None:
+        videomasa.jobs["notified"] = {"status": "downloading", "transcripts": {}}
+        version = videomasa.jobs.version("notified")
+
+        videomasa._begin_transcription("notified", "base")
+        self.assertEqual(videomasa.jobs["notified"]["status"], "transcribing")
+        self.assertGreater(videomasa.jobs.version("notified"), version)
+
+        version = videomasa.jobs.version("notified")
+        videomasa._record_transcription_failure("notified", "base", "Failed", "process_error", 2)
+        self.assertEqual(videomasa.jobs["notified"]["status"], "error")
+        self.assertGreater(videomasa.jobs.version("notified"), version)
+
+        version = videomasa.jobs.version("notified")
+        probe = Future()
+        probe.set_result({"video": [1080, 720]})
+        videomasa._record_probe_formats("notified", probe, 0)
+        self.assertEqual(videomasa.jobs["notified"]["downloaded_quality"], "1080p")
+        self.assertGreater(videomasa.jobs.version("notified"), version)
+
+        version = videomasa.jobs.version("notified")
+        source = videomasa.WORK_DIR / "notified.wav"
+        source.write_bytes(b"cached audio")
+        cache = MagicMock()
+        cache.get.return_value = {"text": "Hi", "segments": [{"id": 0, "start": 0.0, "end": 1.0, "text": "Hi"}]}
+        with patch("app.TRANSCRIPT_CACHE", cache):
+            self.assertTrue(videomasa._transcribe_existing_file("notified", source, "base"))
+        self.assertEqual(videomasa.jobs["notified"]["transcripts"]["base"]["status"], "done")
+        self.assertEqual(videomasa.jobs["notified"]["stage"], "finalizing")
+        self.assertGreater(videomasa.jobs.version("notified"), version + 1)
+        source.unlink(missing_ok=True)
+
+    def test_finished_download_waits_for_a_free_transcription_slot(self) -> None:
+        slots = threading.BoundedSemaphore(1)
+        slots.acquire()
+        videomasa.jobs["slotted"] = job = {"message": "Transcribing audio..."}
+        entered = threading.Event()
+
+        def transcribe():
+            with videomasa._transcription_slot("slotted"):
+                entered.set()
+
+        with patch("app.transcription_slots", slots):
+            worker = threading.Thread(target=transcribe)
+            worker.start()
+            self.assertFalse(entered.wait(0.2))
+            self.assertEqual(job["message"], "Waiting for a free transcription worker...")
+            slots.release()
+            worker.join(5)
+
+        self.assertTrue(entered.is_set())
+        self.assertTrue(job["message"].startswith("Transcribing audio..."))
+        self.assertIn("stage_started_at", job)
+        self.assertTrue(slots.acquire(blocking=False))
+
+    def test_process_reports_queue_position_when_workers_are_busy(self) -> None:
+        self.bootstrap()
+        with videomasa.jobs_lock:
+            for index in range(videomasa.JOB_WORKERS):
+                videomasa.jobs[f"running-{index}"] = {"status": "transcribing"}
+
+        with patch("app._submit_job", return_value=True):
+            response = self.client.post(
+                "/process",
+                base_url=BASE_URL,
+                json={"url": "https://example.com/video", "transcribe": True},
+            )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual(data["queue_position"], 1)
+        self.assertEqual(videomasa.jobs[data["job_id"]]["message"], "Queued (1 ahead)...")
+
+    def test_upload_is_spooled_into_work_dir_and_saved_by_rename(self) -> None:
+        self.bootstrap()
+        payload = b"synthetic audio" * 4096
+        with patch("app._submit_job", return_value=True):
+            response = self.client.post(
+                "/upload",
+                base_url=BASE_URL,
+                data={"file": (io.BytesIO(payload), "clip.wav"), "transcribe": "true"},
+                content_type="multipart/form-data",
+            )
+
+        self.assertEqual(response.status_code, 200)
+        job_id = response.get_json()["job_id"]
+        saved = videomasa.WORK_DIR / f"{job_id}_clip.wav"
+        self.assertEqual(saved.read_bytes(), payload)
+        self.assertEqual(list(videomasa.WORK_DIR.glob(".upload-*")), [])
+        saved.unlink()
+
     def test_transcription_timeout_is_specific_consistent_and_retryable(self) -> None:
         source = videomasa.WORK_DIR / "timeout-podcast.wav"
         source.write_bytes(b"synthetic audio")
@@ -223,6 +729,393 @@ class StabilizationTests(unittest.TestCase):
         self.assertEqual(job["file_status"], "present")
         source.unlink(missing_ok=True)
 
+    def test_file_job_thumbnail_overlaps_transcription(self) -> None:
+        source = videomasa.WORK_DIR / "overlap_clip.mp4"
+        source.write_bytes(b"synthetic video")
+        videomasa.jobs["overlap"] = {
+            "status": "queued",
+            "message": "Queued...",
+            "thumbnail": "",
+            "transcripts": {},
+            "file_status": "absent",
+            "stage": "queued",
+            "retryable": False,
+        }
+        transcribing = threading.Event()
+
+        def write_thumbnail(job_id, _file_path):
+            self.assertTrue(transcribing.wait(timeout=5))
+            thumb_path = videomasa.WORK_DIR / f"{job_id}_thumb.jpg"
+            thumb_path.write_bytes(b"jpeg")
+            return thumb_path
+
+        def transcribe(*_args, **_kwargs):
+            transcribing.set()
+            return True
+
+        with (
+            patch("app._write_video_thumbnail", side_effect=write_thumbnail),
+            patch("app._transcribe_existing_file", side_effect=transcribe),
+        ):
+            videomasa.run_file_job("overlap", source, "base", True, False)
+
+        job = videomasa.jobs["overlap"]
+        self.assertEqual(job["status"], "done")
+        self.assertEqual(job["thumbnail"], "/thumb/overlap")
+        (videomasa.WORK_DIR / "overlap_thumb.jpg").unlink(missing_ok=True)
+        source.unlink(missing_ok=True)
+
+    def test_url_job_transcribes_audio_track_while_video_downloads(self) -> None:
+        videomasa.jobs["piped"] = {
+            "status": "queued",
+            "message": "Queued...",
+            "thumbnail": "",
+            "transcripts": {},
+            "file_status": "absent",
+            "stage": "queued",
+            "retryable": False,
+            "do_download": True,
+            "do_transcribe": True,
+        }
+        audio = videomasa.WORK_DIR / "piped.audio.m4a"
+        video = videomasa.WORK_DIR / "piped.mp4"
+        transcribing = threading.Event()
+        transcribed = []
+
+        def fake_run(cmd, **_kwargs):
+            if "bestaudio" in cmd:
+                audio.write_bytes(b"audio")
+                return subprocess.CompletedProcess(cmd, 0, f"{audio}\n", "")
+            self.assertTrue(transcribing.wait(timeout=5))
+            video.write_bytes(b"video")
+            return subprocess.CompletedProcess(cmd, 0, f'"Talk"\n{video}\n', "")
+
+        def transcribe(_job_id, source_path, _model, **_kwargs):
+            transcribed.append(Path(source_path))
+            transcribing.set()
+            return True
+
+        with (
+            patch("app.run_with_tail", side_effect=fake_run),
+            patch("app._probe_formats", return_value=None),
+            patch("app._transcribe_existing_file", side_effect=transcribe),
+        ):
+            videomasa.run_job("piped", "https://example.com/watch", "base", True, True)
+
+        job = videomasa.jobs["piped"]
+        self.assertEqual(transcribed, [audio])
+        self.assertFalse(audio.exists())
+        self.assertEqual(job["status"], "done")
+        self.assertEqual(job["filename"], "Talk.mp4")
+        self.assertEqual(job["download_path"], str(video))
+        video.unlink(missing_ok=True)
+
+    def test_missing_audio_stream_transcribes_the_downloaded_video(self) -> None:
+        videomasa.jobs["muxed"] = {
+            "status": "queued",
+            "message": "Queued...",
+            "thumbnail": "",
+            "transcripts": {},
+            "file_status": "absent",
+            "stage": "queued",
+            "retryable": False,
+            "do_download": True,
+            "do_transcribe": True,
+        }
+        video = videomasa.WORK_DIR / "muxed.mp4"
+        commands = []
+
+        def fake_run(cmd, **_kwargs):
+            commands.append(cmd)
+            if "bestaudio" in cmd:
+                return subprocess.CompletedProcess(cmd, 1, "", "Requested format is not available")
+            video.write_bytes(b"video")
+            return subprocess.CompletedProcess(cmd, 0, f'"Talk"\n{video}\n', "")
+
+        with (
+            patch("app.run_with_tail", side_effect=fake_run),
+            patch("app._probe_formats", return_value=None),
+            patch("app._transcribe_existing_file", return_value=True) as transcribe,
+        ):
+            videomasa.run_job("muxed", "https://example.com/watch", "base", True, True)
+
+        self.assertEqual(len(commands), 2)
+        self.assertFalse(any("bestaudio/best" in cmd for cmd in commands))
+        transcribe.assert_called_once_with("muxed", video, "base")
+        self.assertEqual(videomasa.jobs["muxed"]["status"], "done")
+        video.unlink(missing_ok=True)
+
+    def test_download_without_a_file_hands_the_slot_to_the_queue(self) -> None:
+        videomasa.jobs["vanished"] = {
+            "status": "queued",
+            "message": "Queued...",
+            "thumbnail": "",
+            "transcripts": {},
+            "file_status": "absent",
+            "stage": "queued",
+            "retryable": False,
+            "do_download": True,
+            "do_transcribe": False,
+        }
+
+        with (
+            patch("app.run_with_tail", return_value=subprocess.CompletedProcess(["yt-dlp"], 0, "", "")),
+            patch("app._probe_formats", return_value=None),
+            patch("app.check_queue_and_cleanup") as next_job,
+        ):
+            videomasa.run_job("vanished", "https://example.com/watch", "base", False, True)
+
+        self.assertEqual(videomasa.jobs["vanished"]["status"], "error")
+        self.assertEqual(videomasa.jobs["vanished"]["message"], "Download completed but file not found.")
+        next_job.assert_called_once_with()
+
+    def test_early_audio_failure_waits_for_the_video_before_ending_the_job(self) -> None:
+        videomasa.jobs["early-fail"] = {
+            "status": "queued",
+            "message": "Queued...",
+            "thumbnail": "",
+            "transcripts": {},
+            "file_status": "absent",
+            "stage": "queued",
+            "retryable": False,
+            "do_download": True,
+            "do_transcribe": True,
+        }
+        audio = videomasa.WORK_DIR / "early-fail.audio.m4a"
+        video = videomasa.WORK_DIR / "early-fail.mp4"
+        failed = threading.Event()
+        states_during_download = []
+
+        def fake_run(cmd, **_kwargs):
+            if "bestaudio" in cmd:
+                audio.write_bytes(b"audio")
+                return subprocess.CompletedProcess(cmd, 0, f"{audio}\n", "")
+            self.assertTrue(failed.wait(timeout=5))
+            job = videomasa.jobs["early-fail"]
+            states_during_download.append((job["status"], videomasa.has_active_jobs([job])))
+            video.write_bytes(b"video")
+            return subprocess.CompletedProcess(cmd, 0, f'"Talk"\n{video}\n', "")
+
+        def transcribe(job_id, _source_path, model, affect_job_status=True, **_kwargs):
+            job = videomasa.jobs[job_id]
+            videomasa._begin_transcription(job_id, model, affect_job_status=affect_job_status)
+            videomasa._record_transcription_failure(
+                job_id, model, "Transcription failed", "process_error", 4, affect_job_status=affect_job_status,
+            )
+            failed.set()
+            return False
+
+        with (
+            patch("app.run_with_tail", side_effect=fake_run),
+            patch("app._probe_formats", return_value=None),
+            patch("app._transcribe_existing_file", side_effect=transcribe),
+        ):
+            videomasa.run_job("early-fail", "https://example.com/watch", "base", True, True)
+
+        job = videomasa.jobs["early-fail"]
+        self.assertEqual(states_during_download, [("downloading", True)])
+        self.assertEqual(job["status"], "error")
+        self.assertEqual(job["failure_code"], "process_error")
+        self.assertTrue(job["download_ready"])
+        self.assertTrue(job["retryable"])
+        video.unlink(missing_ok=True)
+
+    def test_early_audio_transcription_streams_live_segments(self) -> None:
+        videomasa.jobs["early-live"] = {
+            "status": "downloading",
+            "message": "Transcribing audio while the video downloads...",
+            "thumbnail": "",
+            "transcripts": {},
+            "file_status": "absent",
+            "stage": "download",
+            "retryable": False,
+        }
+        audio = videomasa.WORK_DIR / "early-live.audio.m4a"
+        audio.write_bytes(b"audio")
+        streamed = []
+
+        def decode(*_args, segment_callback=None, **_kwargs):
+            segment_callback({"start": 0.0, "end": 1.5, "text": " Hello"})
+            streamed.append(videomasa._public_status("early-live", since=0))
+            return {"text": "Hello", "segments": [{"id": 0, "start": 0.0, "end": 1.5, "text": "Hello"}]}, 1.0
+
+        with (
+            patch("app.TRANSCRIPT_CACHE", None),
+            patch("app.USE_IN_PROCESS_WHISPER", True),
+            patch("app._whisper_cpp_runner", return_value=None),
+            patch("app.probe_media_duration", return_value=1.5),
+            patch("app.transcribe_in_process", side_effect=decode),
+        ):
+            self.assertTrue(
+                videomasa._transcribe_existing_file(
+                    "early-live", audio, "base", affect_job_status=False, live_segments=True,
+                )
+            )
+
+        self.assertEqual(streamed[0]["new_texts"], ["Hello"])
+        self.assertEqual(streamed[0]["status"], "downloading")
+        self.assertEqual(videomasa.jobs["early-live"]["transcript"], "Hello")
+        audio.unlink(missing_ok=True)
+
+    def test_transcribe_only_url_job_downloads_just_the_audio_track(self) -> None:
+        videomasa.jobs["listen"] = {
+            "status": "queued",
+            "message": "Queued...",
+            "thumbnail": "",
+            "transcripts": {},
+            "file_status": "absent",
+            "stage": "queued",
+            "retryable": False,
+            "do_download": False,
+            "do_transcribe": True,
+        }
+        audio = videomasa.WORK_DIR / "listen.audio.webm"
+        commands = []
+
+        def fake_run(cmd, **_kwargs):
+            commands.append(cmd)
+            audio.write_bytes(b"audio")
+            return subprocess.CompletedProcess(cmd, 0, f'"Talk"\n{audio}\n', "")
+
+        with (
+            patch("app.run_with_tail", side_effect=fake_run),
+            patch("app._probe_formats", return_value=None),
+            patch("app._transcribe_existing_file", return_value=True) as transcribe,
+        ):
+            videomasa.run_job("listen", "https://example.com/watch", "base", True, False)
+
+        job = videomasa.jobs["listen"]
+        self.assertEqual(len(commands), 1)
+        self.assertIn("bestaudio/best", commands[0])
+        transcribe.assert_called_once_with("listen", audio, "base")
+        self.assertEqual(job["status"], "done")
+        self.assertEqual(job["filename"], "Talk.webm")
+        self.assertFalse(job.get("download_ready"))
+        audio.unlink(missing_ok=True)
+
+    def test_download_merged_into_audio_only_job_fetches_the_video(self) -> None:
+        videomasa.jobs["merged"] = {
+            "status": "queued",
+            "message": "Queued...",
+            "thumbnail": "",
+            "transcripts": {},
+            "file_status": "absent",
+            "stage": "queued",
+            "retryable": False,
+            "do_download": False,
+            "do_transcribe": True,
+        }
+        audio = videomasa.WORK_DIR / "merged.audio.webm"
+        video = videomasa.WORK_DIR / "merged.mp4"
+
+        def fake_run(cmd, **_kwargs):
+            if "bestaudio/best" in cmd:
+                audio.write_bytes(b"audio")
+                return subprocess.CompletedProcess(cmd, 0, f'"Talk"\n{audio}\n', "")
+            video.write_bytes(b"video")
+            return subprocess.CompletedProcess(cmd, 0, f'"Talk"\n{video}\n', "")
+
+        def transcribe(job_id, _source_path, _model):
+            videomasa.jobs[job_id]["do_download"] = True
+            return True
+
+        with (
+            patch("app.run_with_tail", side_effect=fake_run),
+            patch("app._probe_formats", return_value=None),
+            patch("app._transcribe_existing_file", side_effect=transcribe) as transcribe_mock,
+        ):
+            videomasa.run_job("merged", "https://example.com/watch", "base", True, False)
+
+        job = videomasa.jobs["merged"]
+        self.assertEqual(transcribe_mock.call_count, 1)
+        self.assertEqual(job["status"], "done")
+        self.assertEqual(job["download_path"], str(video))
+        self.assertEqual(job["filename"], "Talk.mp4")
+        self.assertFalse(audio.exists())
+        video.unlink(missing_ok=True)
+
+    def test_download_merged_while_waiting_on_the_probe_fetches_the_video(self) -> None:
+        videomasa.jobs["late-merge"] = {
+            "status": "queued",
+            "message": "Queued...",
+            "thumbnail": "",
+            "transcripts": {},
+            "file_status": "absent",
+            "stage": "queued",
+            "retryable": False,
+            "do_download": False,
+            "do_transcribe": True,
+        }
+        audio = videomasa.WORK_DIR / "late-merge.audio.webm"
+        video = videomasa.WORK_DIR / "late-merge.mp4"
+
+        def fake_run(cmd, **_kwargs):
+            if "bestaudio/best" in cmd:
+                audio.write_bytes(b"audio")
+                return subprocess.CompletedProcess(cmd, 0, f'"Talk"\n{audio}\n', "")
+            video.write_bytes(b"video")
+            return subprocess.CompletedProcess(cmd, 0, f'"Talk"\n{video}\n', "")
+
+        def merge_during_probe_wait(job_id, _probe_task, _timeout):
+            videomasa.jobs[job_id]["do_download"] = True
+
+        with (
+            patch("app.run_with_tail", side_effect=fake_run),
+            patch("app._probe_formats", return_value=None),
+            patch("app._record_probe_formats", side_effect=merge_during_probe_wait),
+            patch("app._transcribe_existing_file", return_value=True),
+        ):
+            videomasa.run_job("late-merge", "https://example.com/watch", "base", True, False)
+
+        job = videomasa.jobs["late-merge"]
+        self.assertEqual(job["status"], "done")
+        self.assertTrue(job["download_ready"])
+        self.assertEqual(job["download_path"], str(video))
+        self.assertFalse(audio.exists())
+        video.unlink(missing_ok=True)
+
+    def test_cached_transcript_skips_whisper_for_identical_media(self) -> None:
+        source = videomasa.WORK_DIR / "cached-talk.wav"
+        source.write_bytes(b"identical audio")
+        videomasa.jobs["cached"] = {
+            "status": "queued",
+            "message": "Queued...",
+            "thumbnail": "",
+            "transcripts": {},
+            "file_status": "absent",
+            "stage": "queued",
+            "retryable": False,
+        }
+        cache = TranscriptCache(STATE_ROOT / "cache-test" / "transcripts.sqlite3", 1024 * 1024)
+        cache.put(
+            media_cache_key(source, "whisper/base"),
+            {"text": "From cache", "segments": [{"id": 0, "start": 0.0, "end": 1.0, "text": "From cache"}]},
+        )
+        with (
+            patch("app.TRANSCRIPT_CACHE", cache),
+            patch("app.USE_IN_PROCESS_WHISPER", True),
+            patch("app.WHISPER_DISTIL", True),
+        ):
+            self.assertEqual(
+                videomasa._transcript_cache_key(source, "base"),
+                media_cache_key(source, "faster-whisper/distil-small.en"),
+            )
+
+        with (
+            patch("app.TRANSCRIPT_CACHE", cache),
+            patch("app.transcribe_with_whisper") as whisper,
+            patch("app.probe_media_duration") as probe,
+        ):
+            videomasa.run_file_job("cached", source, "base", True, False)
+
+        job = videomasa.jobs["cached"]
+        whisper.assert_not_called()
+        probe.assert_not_called()
+        self.assertEqual(job["status"], "done")
+        self.assertEqual(job["transcripts"]["base"]["transcript"], "From cache")
+        self.assertTrue(job["transcripts"]["base"]["srt_ready"])
+        source.unlink(missing_ok=True)
+
     def test_long_form_failure_exposes_checkpoint_progress_and_resume(self) -> None:
         source = videomasa.WORK_DIR / "checkpointed-podcast.wav"
         source.write_bytes(b"synthetic long audio")
@@ -406,8 +1299,8 @@ class StabilizationTests(unittest.TestCase):
             "retryable": False,
         }
 
-        def malformed_transcription(source_path, _model, _output_dir, _timeout):
-            Path(source_path).with_suffix(".json").write_text("{not valid json")
+        def malformed_transcription(source_path, _model, output_dir, _timeout):
+            (Path(output_dir) / f"{Path(source_path).stem}.json").write_text("{not valid json")
             return subprocess.CompletedProcess(["whisper"], 0, "", ""), 3.5
 
         with patch("app.transcribe_with_whisper", side_effect=malformed_transcription):
@@ -450,8 +1343,11 @@ class StabilizationTests(unittest.TestCase):
             "file_status": "present",
         }
 
-        def successful_transcription(source_path, _model, _output_dir, _timeout):
-            Path(source_path).with_suffix(".json").write_text(json.dumps({
+        scratch_dirs = []
+
+        def successful_transcription(source_path, _model, output_dir, _timeout):
+            scratch_dirs.append(Path(output_dir))
+            (Path(output_dir) / f"{Path(source_path).stem}.json").write_text(json.dumps({
                 "text": "Recovered podcast",
                 "segments": [{"start": 0.25, "end": 2.5, "text": "Recovered podcast"}],
             }))
@@ -475,6 +1371,8 @@ class StabilizationTests(unittest.TestCase):
         self.assertFalse(job["retryable"])
         self.assertEqual(job["file_status"], "cleaned")
         self.assertFalse(source.exists())
+        self.assertNotEqual(scratch_dirs[0], videomasa.WORK_DIR)
+        self.assertFalse(scratch_dirs[0].exists())
 
     def test_retry_rejects_jobs_without_retained_transcription_media(self) -> None:
         self.bootstrap()
@@ -510,6 +1408,29 @@ class StabilizationTests(unittest.TestCase):
         finally:
             videomasa._last_heartbeat = old_heartbeat
 
+    def test_janitor_expires_long_finished_jobs_and_their_files(self) -> None:
+        idle_source = videomasa.WORK_DIR / "idle-finished.mp4"
+        idle_source.write_bytes(b"idle")
+        videomasa.jobs["idle"] = {
+            "status": "done",
+            "file_status": "present",
+            "download_ready": True,
+            "_file_path": str(idle_source),
+            "transcripts": {},
+        }
+        videomasa.jobs["running"] = {"status": "transcribing", "transcripts": {}}
+        videomasa.jobs["fresh"] = {"status": "done", "transcripts": {}}
+
+        finished = {"idle": videomasa.JOB_TTL_SECONDS, "fresh": 0, "running": None}
+
+        with patch.object(videomasa.jobs, "finished_seconds", side_effect=finished.get):
+            videomasa._expire_finished_jobs()
+
+        self.assertNotIn("idle", videomasa.jobs)
+        self.assertFalse(idle_source.exists())
+        self.assertIn("running", videomasa.jobs)
+        self.assertIn("fresh", videomasa.jobs)
+
     def test_job_renderer_uses_dom_properties_without_inline_handlers(self) -> None:
         template = (Path(__file__).resolve().parents[1] / "templates" / "index.html").read_text()
         self.assertNotIn("cardBody.innerHTML", template)
@@ -1,5 +1,9 @@
 """Pure helpers for job lifecycle and user-facing timing state."""
 
+import threading
+import time
+from collections.abc import MutableMapping
+
 
 TERMINAL_JOB_STATUSES = frozenset({"done", "error"})
 
@@ -31,3 +35,119 @@ def format_duration(seconds) -> str:
     if remaining_minutes:
         return f"{hours}h {remaining_minutes}m"
     return f"{hours} hour{'s' if hours != 1 else ''}"
+
+
+class JobStore(MutableMapping):
+    """Job dicts keyed by id, each guarded by its own re-entrant lock.
+
+    ``lock`` guards membership (adding, pruning, and scanning jobs). Multi-step
+    changes to a single job hold ``job_lock(job_id)`` instead, so one job's
+    status poll never waits on another job's worker. Never acquire ``lock``
+    while holding a job lock.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self._jobs = {}
+        self._locks = {}
+        self._changed = threading.Condition()
+        self._versions = {}
+        self._finished_at = {}
+
+    def __getitem__(self, job_id):
+        return self._jobs[job_id]
+
+    def __setitem__(self, job_id, job):
+        with self.lock:
+            self._locks.setdefault(job_id, threading.RLock())
+            self._jobs[job_id] = job
+            self._note_finished(job_id, job)
+
+    def __delitem__(self, job_id):
+        with self.lock:
+            del self._jobs[job_id]
+            self._locks.pop(job_id, None)
+            self._finished_at.pop(job_id, None)
+        with self._changed:
+            self._versions.pop(job_id, None)
+            self._changed.notify_all()
+
+    def __iter__(self):
+        return iter(list(self._jobs))
+
+    def __len__(self):
+        return len(self._jobs)
+
+    def values(self):
+        with self.lock:
+            return list(self._jobs.values())
+
+    def items(self):
+        with self.lock:
+            return list(self._jobs.items())
+
+    def job_lock(self, job_id):
+        """Return the lock for one job; unknown ids get a throwaway lock."""
+        return self._locks.get(job_id) or threading.RLock()
+
+    def snapshot(self, job_id):
+        """Return a shallow copy of one job taken under its lock, or None."""
+        with self.job_lock(job_id):
+            job = self._jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+    def apply(self, job_id, change):
+        """Run ``change(job)`` under the job's lock and return its result."""
+        job = self._jobs[job_id]
+        with self.job_lock(job_id):
+            return change(job)
+
+    def update_job(self, job_id, **fields):
+        """Apply several field changes to one job atomically."""
+        job = self._jobs[job_id]
+        with self.job_lock(job_id):
+            job.update(fields)
+        self.touch(job_id)
+        return job
+
+    def touch(self, job_id):
+        """Record that a job changed and wake anything waiting on it.
+
+        Unknown ids are ignored, so a late touch after removal leaves nothing behind.
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        self._note_finished(job_id, job)
+        with self._changed:
+            self._versions[job_id] = self._versions.get(job_id, 0) + 1
+            self._changed.notify_all()
+
+    def version(self, job_id):
+        """Return how many times ``touch`` has been called for a job."""
+        return self._versions.get(job_id, 0)
+
+    def finished_seconds(self, job_id):
+        """Return how long ago a job last reached a terminal state, or None while it is active."""
+        finished_at = self._finished_at.get(job_id)
+        return None if finished_at is None else time.monotonic() - finished_at
+
+    def _note_finished(self, job_id, job):
+        # Later touches on a finished job (a late thumbnail, say) keep the
+        # original time; going active again, as a retry does, clears it.
+        if has_active_jobs([job]):
+            self._finished_at.pop(job_id, None)
+        else:
+            self._finished_at.setdefault(job_id, time.monotonic())
+
+    def wait_for_changes(self, versions, timeout):
+        """Wait up to ``timeout`` seconds for any job in a {job_id: version} map to move on.
+
+        Returns the jobs' current versions in the same shape.
+        """
+        with self._changed:
+            self._changed.wait_for(
+                lambda: any(self._versions.get(job_id, 0) != version for job_id, version in versions.items()),
+                timeout,
+            )
+            return {job_id: self._versions.get(job_id, 0) for job_id in versions}
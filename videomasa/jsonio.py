@@ -0,0 +1,28 @@
+"""JSON encoding and decoding that use orjson when it is installed."""
+
+import json
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data):
+    """Decode JSON from ``str`` or ``bytes``; errors are ``ValueError`` subclasses."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(value, default=None):
+    """Encode ``value`` as compact JSON text, calling ``default`` for unknown types."""
+    if orjson is not None:
+        return orjson.dumps(value, default=default, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(value, default=default, ensure_ascii=False, separators=(",", ":"))
+
+
+def read_json_file(path):
+    """Decode a JSON file from its raw bytes, skipping a text-decoding pass."""
+    return loads(Path(path).read_bytes())
@@ -0,0 +1,147 @@
+"""Subprocess execution with bounded output capture."""
+
+import heapq
+import itertools
+import subprocess
+import threading
+import time
+
+
+TAIL_BYTES = 4096
+_READ_BYTES = 64 * 1024
+
+
+def _drain_tail(stream, tail_bytes, outputs, name):
+    tail = bytearray()
+    with stream:
+        for block in iter(lambda: stream.read1(_READ_BYTES), b""):
+            tail += block
+            if len(tail) > tail_bytes:
+                del tail[:-tail_bytes]
+    outputs[name] = bytes(tail)
+
+
+def _drain_lines(stream, tail_bytes, outputs, name, on_line):
+    tail = bytearray()
+    with stream:
+        for line in stream:
+            try:
+                consumed = on_line(line)
+            except Exception as error:
+                # A failing callback must not stop the drain, or the child
+                # blocks on a full pipe until its deadline kills it.
+                print(f"[process output] line callback failed: {error}", flush=True)
+                consumed = False
+            if consumed:
+                continue
+            tail += line
+            if len(tail) > tail_bytes:
+                del tail[:-tail_bytes]
+    outputs[name] = bytes(tail)
+
+
+class _DeadlineWatcher:
+    """One thread that kills children outliving their timeout.
+
+    ``Popen.wait(timeout=...)`` polls ``waitpid`` on a backoff timer, waking
+    each waiting thread up to 20 times a second for the life of the child.
+    Callers here block in a plain ``wait()`` instead and register a deadline;
+    this thread sleeps on a condition until the earliest one is due.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._deadlines = []
+        self._order = itertools.count()
+        self._thread = None
+
+    def add(self, process, timeout):
+        """Kill ``process`` after ``timeout`` seconds; return a cancellable entry."""
+        entry = [time.monotonic() + timeout, next(self._order), process, False]
+        with self._condition:
+            heapq.heappush(self._deadlines, entry)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="videomasa-deadlines", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return entry
+
+    def cancel(self, entry):
+        """Drop ``entry``; return True when its process was already killed for timing out."""
+        with self._condition:
+            expired = entry[3]
+            entry[2] = None
+        return expired
+
+    def _run(self):
+        with self._condition:
+            while True:
+                while self._deadlines and self._deadlines[0][2] is None:
+                    heapq.heappop(self._deadlines)
+                if not self._deadlines:
+                    self._condition.wait()
+                    continue
+                remaining = self._deadlines[0][0] - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                entry = heapq.heappop(self._deadlines)
+                entry[3] = True
+                try:
+                    entry[2].kill()
+                except OSError:
+                    pass
+
+
+_deadlines = _DeadlineWatcher()
+
+
+def run_with_tail(args, timeout=None, tail_bytes=TAIL_BYTES, text=True, capture_output=True, line_filter=None):
+    """Run ``args`` like ``subprocess.run`` but keep only the output's tail.
+
+    stdout and stderr are drained as they are produced and only their last
+    ``tail_bytes`` are held, so a chatty child (Whisper's verbose transcript,
+    yt-dlp progress) never accumulates in memory. The returned
+    ``CompletedProcess`` carries those tails, decoded when ``text`` is true.
+    When given, ``line_filter`` is called with each raw output line as it
+    arrives on either stream; lines it returns true for are left out of the
+    tails.
+    On timeout the child is killed and ``subprocess.TimeoutExpired`` raised.
+    """
+    target = subprocess.PIPE if capture_output else subprocess.DEVNULL
+    process = subprocess.Popen(args, stdin=subprocess.DEVNULL, stdout=target, stderr=target)
+    outputs = {"stdout": b"", "stderr": b""}
+    readers = []
+    if capture_output:
+        for name in ("stdout", "stderr"):
+            if line_filter is not None:
+                target, extra = _drain_lines, (line_filter,)
+            else:
+                target, extra = _drain_tail, ()
+            reader = threading.Thread(
+                target=target,
+                args=(getattr(process, name), tail_bytes, outputs, name, *extra),
+                daemon=True,
+            )
+            reader.start()
+            readers.append(reader)
+    deadline = _deadlines.add(process, timeout) if timeout is not None else None
+    try:
+        returncode = process.wait()
+    except BaseException:
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        expired = deadline is not None and _deadlines.cancel(deadline)
+    if expired:
+        # Like subprocess.run on POSIX: don't wait for grandchildren that may
+        # still hold the pipes open; the daemon readers exit with them.
+        raise subprocess.TimeoutExpired(args, timeout)
+    for reader in readers:
+        reader.join()
+    stdout, stderr = outputs["stdout"], outputs["stderr"]
+    if text:
+        stdout = stdout.decode("utf-8", errors="replace")
+        stderr = stderr.decode("utf-8", errors="replace")
+    return subprocess.CompletedProcess(args, returncode, stdout, stderr)
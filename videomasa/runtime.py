@@ -33,6 +33,24 @@ def find_ffmpeg(source_file: str | Path) -> str:
     return "ffmpeg"
 
 
+def find_whisper_cpp(source_file: str | Path) -> str | None:
+    """Find a whisper.cpp CLI shipped beside ffmpeg in the app bundle."""
+    candidate = Path(source_file).resolve().parent.parent / "Resources" / "whisper-cli"
+    if candidate.is_file() and os.access(candidate, os.X_OK):
+        return str(candidate)
+    return None
+
+
+def find_ggml_model(source_file: str | Path, model: str) -> str | None:
+    """Find bundled quantized ggml weights for one Whisper model size."""
+    resources = Path(source_file).resolve().parent.parent / "Resources"
+    for name in (f"ggml-{model}-q5_0.bin", f"ggml-{model}-q5_1.bin", f"ggml-{model}.bin"):
+        candidate = resources / name
+        if candidate.is_file():
+            return str(candidate)
+    return None
+
+
 def prepend_executable_directory(executable: str) -> None:
     """Expose a discovered executable to subprocesses without duplicating PATH."""
     executable_dir = str(Path(executable).parent)
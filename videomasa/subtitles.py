@@ -27,19 +27,36 @@ def sanitize_segments(raw_segments):
     return clean
 
 
+# Two-digit fields by value; minutes index it too, so labels stay table
+# lookups for recordings up to 60 hours.
+_PAD = tuple(f"{value:02d}" for value in range(3600))
+
+
+def _clock(total):
+    minutes, seconds = divmod(total, 60)
+    if 0 <= minutes < 3600:
+        return f"{_PAD[minutes]}:{_PAD[seconds]}"
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+def format_timestamped(starts, ends, texts):
+    """Render parallel start/end/text sequences as ``[mm:ss → mm:ss]  text`` lines."""
+    return "\n".join(
+        f"[{_clock(start)} → {_clock(end)}]  {text}"
+        for start, end, text in zip(map(int, starts), map(int, ends), texts)
+    )
+
+
 def parse_whisper_result(data):
     """Extract the plain transcript, display timestamps, and subtitle segments."""
     transcript = str(data.get("text") or "").strip()
     segments = sanitize_segments(data.get("segments", []))
-    timestamped_lines = []
-    for segment in segments:
-        start_minutes, start_seconds = divmod(int(segment["start"]), 60)
-        end_minutes, end_seconds = divmod(int(segment["end"]), 60)
-        timestamped_lines.append(
-            f"[{start_minutes:02d}:{start_seconds:02d} → "
-            f"{end_minutes:02d}:{end_seconds:02d}]  {segment['text']}"
-        )
-    return transcript, "\n".join(timestamped_lines), segments
+    timestamped = format_timestamped(
+        [segment["start"] for segment in segments],
+        [segment["end"] for segment in segments],
+        [segment["text"] for segment in segments],
+    )
+    return transcript, timestamped, segments
 
 
 def format_srt_timestamp(seconds):
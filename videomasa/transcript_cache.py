@@ -0,0 +1,103 @@
+"""Content-addressed SQLite cache of finished Whisper results."""
+
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+
+from videomasa import jsonio
+
+
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def media_cache_key(source_path, model) -> str:
+    """Return ``sha256(file bytes):model``, hashing in 1 MiB reads."""
+    digest = hashlib.sha256()
+    with open(source_path, "rb") as media:
+        for block in iter(lambda: media.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(block)
+    return f"{digest.hexdigest()}:{model}"
+
+
+class TranscriptCache:
+    """Whisper JSON keyed by media hash and model, evicted least-recently-used.
+
+    The cache is an optimization only: SQLite errors are swallowed so a locked
+    or corrupt database never fails a transcription. A database that cannot
+    be opened at all leaves the cache disabled for the process.
+    """
+
+    def __init__(self, path, max_bytes):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._connect() as connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS transcripts ("
+                    "key TEXT PRIMARY KEY, data TEXT NOT NULL, "
+                    "size INTEGER NOT NULL, last_used REAL NOT NULL)"
+                )
+            self.enabled = True
+        except (sqlite3.Error, OSError):
+            self.enabled = False
+
+    def _connect(self):
+        return closing(sqlite3.connect(self.path, timeout=5, isolation_level=None))
+
+    def get(self, key):
+        """Return the cached Whisper data for ``key`` and mark it used, or None."""
+        if not self.enabled:
+            return None
+        try:
+            with self._connect() as connection:
+                row = connection.execute("SELECT data FROM transcripts WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                connection.execute("UPDATE transcripts SET last_used = ? WHERE key = ?", (time.time(), key))
+            return jsonio.loads(row[0])
+        except (sqlite3.Error, ValueError):
+            return None
+
+    def put(self, key, whisper_data):
+        """Store one result's timed text, then evict the oldest entries beyond ``max_bytes``.
+
+        Token ids and decoder statistics from the CLI's JSON are dropped; the
+        transcript and SRT builders only read segment times and text.
+        """
+        if not self.enabled:
+            return
+        compact = {
+            "text": whisper_data.get("text", ""),
+            "segments": [
+                {field: segment.get(field) for field in ("id", "start", "end", "text")}
+                for segment in whisper_data.get("segments", [])
+            ],
+        }
+        if whisper_data.get("language"):
+            compact["language"] = whisper_data["language"]
+        data = json.dumps(compact, ensure_ascii=False)
+        size = len(data.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        try:
+            with self._connect() as connection:
+                connection.execute("BEGIN IMMEDIATE")
+                connection.execute(
+                    "INSERT OR REPLACE INTO transcripts (key, data, size, last_used) VALUES (?, ?, ?, ?)",
+                    (key, data, size, time.time()),
+                )
+                total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM transcripts").fetchone()[0]
+                for old_key, old_size in connection.execute(
+                    "SELECT key, size FROM transcripts ORDER BY last_used ASC"
+                ).fetchall():
+                    if total <= self.max_bytes:
+                        break
+                    connection.execute("DELETE FROM transcripts WHERE key = ?", (old_key,))
+                    total -= old_size
+                connection.execute("COMMIT")
+        except sqlite3.Error:
+            pass
@@ -1,21 +1,58 @@
 """Whisper execution and checkpointed long-form transcription."""
 
+from bisect import bisect_right
+from concurrent.futures import Future
 from dataclasses import dataclass
+from functools import lru_cache
+import importlib.util
+import itertools
 import json
 import os
+import queue
 import re
 import shutil
 import subprocess
+import threading
 import time
 import wave
 from pathlib import Path
 
+from videomasa.jsonio import read_json_file
+from videomasa.processes import run_with_tail
+
 
 CHECKPOINT_SCHEMA_VERSION = 1
+WHISPER_BEAM_SIZE = 5
+# Distilled checkpoints keep the UI model contract but are English-only.
+DISTIL_WHISPER_MODELS = {
+    "tiny": "distil-small.en",
+    "base": "distil-small.en",
+    "small": "distil-medium.en",
+    "medium": "distil-large-v2",
+    "large-v3": "distil-large-v3",
+}
+# Loaded models by (size, device, compute type), each with its own load lock
+# so a multi-gigabyte load never blocks jobs on another, already loaded size.
+_WHISPER_MODELS = {}
+_WHISPER_MODEL_LOCKS = {}
+_BATCHED_PIPELINES = {}
+_WHISPER_MODELS_LOCK = threading.Lock()
+# Caption credits Whisper learned from subtitle data and emits over music or
+# noise; no speaker says them.
+_HALLUCINATED_LINES = frozenset({
+    "subtitles by the amara.org community",
+    "subtitles made by the community of amara.org",
+    "transcription by castingwords",
+})
+# A line repeated more often than this back to back is a decoding loop.
+_MAX_REPEATED_LINES = 2
+# Upper bounds (seconds) of the duration classes queued jobs are ordered by.
+_DURATION_BUCKETS = (30, 120, 600, 1800)
 _DURATION_PATTERN = re.compile(
     r"Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)",
     re.IGNORECASE,
 )
+_AUDIO_CODEC_PATTERN = re.compile(r"Stream #\d+:\d+\S*: Audio: (\w+)")
 
 
 class TranscriptionTimeout(RuntimeError):
@@ -74,20 +111,352 @@ def transcribe_with_whisper(source_path, model, output_dir, timeout_seconds):
     ]
     started_at = time.monotonic()
     try:
-        result = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            timeout=timeout_seconds,
-        )
+        # Whisper prints every segment to stdout; only the tail is kept.
+        result = run_with_tail(command, timeout=timeout_seconds)
     except subprocess.TimeoutExpired as error:
         elapsed = max(0.0, time.monotonic() - started_at)
         raise TranscriptionTimeout(elapsed, timeout_seconds, command) from error
     return result, max(0.0, time.monotonic() - started_at)
 
 
-def probe_media_duration(source_path, ffmpeg_bin, timeout_seconds=30, runner=subprocess.run):
-    """Read duration from ffmpeg's metadata output without decoding the media."""
+def whisper_cpp_to_whisper_json(data):
+    """Convert whisper.cpp ``-oj`` output to the openai-whisper JSON schema."""
+    segments = []
+    for index, item in enumerate(data.get("transcription", [])):
+        offsets = item.get("offsets", {})
+        segments.append({
+            "id": index,
+            "start": offsets.get("from", 0) / 1000,
+            "end": offsets.get("to", 0) / 1000,
+            "text": item.get("text", ""),
+        })
+    result = {"text": "".join(segment["text"] for segment in segments).strip(), "segments": segments}
+    language = data.get("result", {}).get("language")
+    if language:
+        result["language"] = language
+    return result
+
+
+def transcribe_with_whisper_cpp(
+    source_path,
+    model,
+    output_dir,
+    timeout_seconds,
+    whisper_cli,
+    model_path,
+    ffmpeg_bin="ffmpeg",
+    runner=run_with_tail,
+):
+    """Run a bundled whisper.cpp CLI as a drop-in for ``transcribe_with_whisper``.
+
+    whisper.cpp only decodes 16 kHz WAV, so other media is converted first and
+    both steps share one wall-clock limit. Its JSON is rewritten to
+    ``{stem}.json`` in the Whisper schema so callers read it unchanged.
+    """
+    source = Path(source_path)
+    output_dir = Path(output_dir)
+    output_stem = output_dir / f"{source.stem}.whisper-cpp"
+    raw_output = Path(f"{output_stem}.json")
+    audio = source
+    command = [str(whisper_cli), "-m", str(model_path), "-f", str(audio), "-oj", "-of", str(output_stem)]
+    started_at = time.monotonic()
+    try:
+        if source.suffix.lower() != ".wav":
+            audio = Path(f"{output_stem}.wav")
+            conversion = runner(
+                [
+                    str(ffmpeg_bin), "-nostdin", "-y", "-hide_banner", "-loglevel", "error",
+                    "-i", str(source), "-vn", "-ac", "1", "-ar", "16000", str(audio),
+                ],
+                capture_output=True,
+                text=True,
+                timeout=timeout_seconds,
+            )
+            if conversion.returncode != 0:
+                return conversion, max(0.0, time.monotonic() - started_at)
+            command[4] = str(audio)
+        remaining = timeout_seconds - (time.monotonic() - started_at)
+        result = runner(command, capture_output=True, text=True, timeout=max(1, remaining))
+    except subprocess.TimeoutExpired as error:
+        elapsed = max(0.0, time.monotonic() - started_at)
+        raise TranscriptionTimeout(elapsed, timeout_seconds, command) from error
+    finally:
+        if audio != source:
+            audio.unlink(missing_ok=True)
+
+    try:
+        if result.returncode == 0:
+            data = read_json_file(raw_output)
+            _write_json_atomic(output_dir / f"{source.stem}.json", whisper_cpp_to_whisper_json(data))
+    except (OSError, ValueError):
+        pass  # the caller reports the missing Whisper JSON
+    finally:
+        raw_output.unlink(missing_ok=True)
+    return result, max(0.0, time.monotonic() - started_at)
+
+
+def faster_whisper_available():
+    """Return whether the optional in-process CTranslate2 backend is installed."""
+    return importlib.util.find_spec("faster_whisper") is not None
+
+
+@lru_cache(maxsize=1)
+def _cuda_available():
+    try:
+        import ctranslate2
+
+        return ctranslate2.get_cuda_device_count() > 0
+    except (ImportError, RuntimeError):
+        return False
+
+
+# Fastest first: INT8 weights with FP16 activations, then plain FP16 for GPUs
+# without INT8 kernels (pre-Turing), then FP32 for those without FP16 either.
+_CUDA_COMPUTE_TYPES = ("int8_float16", "float16", "float32")
+
+
+@lru_cache(maxsize=1)
+def _cuda_compute_type():
+    """Return the fastest CUDA compute type the installed GPU supports."""
+    try:
+        import ctranslate2
+
+        supported = ctranslate2.get_supported_compute_types("cuda")
+    except (ImportError, RuntimeError):
+        return _CUDA_COMPUTE_TYPES[0]
+    return next((name for name in _CUDA_COMPUTE_TYPES if name in supported), "float32")
+
+
+def _whisper_model_key(model, compute_type=None):
+    cuda = _cuda_available()
+    return (
+        model,
+        "cuda" if cuda else "cpu",
+        compute_type or (_cuda_compute_type() if cuda else "int8"),
+    )
+
+
+def whisper_model_loaded(model, compute_type=None):
+    """Return whether ``load_whisper_model`` already holds this model."""
+    return _whisper_model_key(model, compute_type) in _WHISPER_MODELS
+
+
+def load_whisper_model(model, num_workers=1, compute_type=None):
+    """Return the process-wide faster-whisper model for one model size.
+
+    Concurrent jobs that pick the same size share this instance. CTranslate2
+    cannot batch separate files into one forward pass, but with
+    ``num_workers`` above one their calls run in parallel instead of queuing
+    behind a single worker. ``compute_type`` overrides the default: INT8 on
+    CPU, and on CUDA the fastest of INT8/FP16, FP16 or FP32 the GPU supports.
+    """
+    key = _whisper_model_key(model, compute_type)
+    device = key[1]
+    cuda = device == "cuda"
+    instance = _WHISPER_MODELS.get(key)
+    if instance is not None:
+        return instance
+    with _WHISPER_MODELS_LOCK:
+        load_lock = _WHISPER_MODEL_LOCKS.setdefault(key, threading.Lock())
+    with load_lock:
+        instance = _WHISPER_MODELS.get(key)
+        if instance is None:
+            from faster_whisper import WhisperModel
+
+            options = {}
+            if not cuda:
+                # INT8 picks up VNNI/AVX-512 dot products; half the logical CPUs
+                # approximates the physical cores on SMT laptops.
+                options["cpu_threads"] = max(1, (os.cpu_count() or 2) // 2)
+            instance = WhisperModel(
+                model,
+                device=device,
+                compute_type=key[2],
+                num_workers=max(1, num_workers),
+                **options,
+            )
+            _WHISPER_MODELS[key] = instance
+        return instance
+
+
+def _batched_pipeline(model, whisper_model):
+    """Return the cached batched FP16 pipeline that wraps one loaded model."""
+    with _WHISPER_MODELS_LOCK:
+        pipeline = _BATCHED_PIPELINES.get(model)
+        if pipeline is None or pipeline.model is not whisper_model:
+            from faster_whisper import BatchedInferencePipeline
+
+            pipeline = BatchedInferencePipeline(model=whisper_model)
+            _BATCHED_PIPELINES[model] = pipeline
+        return pipeline
+
+
+def resolve_whisper_model(model, distil=False):
+    """Map a UI model size to the faster-whisper checkpoint that serves it."""
+    return DISTIL_WHISPER_MODELS.get(model, model) if distil else model
+
+
+def duration_bucket(seconds):
+    """Return the scheduling class for media of ``seconds``; unknown ranks as longest."""
+    if seconds is None:
+        return len(_DURATION_BUCKETS)
+    return bisect_right(_DURATION_BUCKETS, seconds)
+
+
+class TranscriptionScheduler:
+    """Run submitted work for each model on that model's own worker thread.
+
+    Batched GPU decoding already fills the device with one file's speech
+    windows, so concurrent jobs on one model queue here instead of contending
+    for the same device memory and kernels. Waiting work runs lowest
+    ``priority`` first and in submission order within a priority, so a short
+    clip queued behind an hour-long file does not wait for all of it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._queues = {}
+        self._order = itertools.count()
+
+    def submit(self, model, function, *args, priority=0, **kwargs):
+        """Queue ``function(*args, **kwargs)`` on the model's lane; return its Future."""
+        with self._lock:
+            lane = self._queues.get(model)
+            if lane is None:
+                lane = queue.PriorityQueue()
+                self._queues[model] = lane
+                threading.Thread(
+                    target=self._work,
+                    args=(lane,),
+                    name=f"transcribe-{model}",
+                    daemon=True,
+                ).start()
+        future = Future()
+        lane.put((priority, next(self._order), future, function, args, kwargs))
+        return future
+
+    @staticmethod
+    def _work(lane):
+        while True:
+            _priority, _order, future, function, args, kwargs = lane.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(function(*args, **kwargs))
+            except BaseException as error:
+                future.set_exception(error)
+
+
+_GPU_SCHEDULER = TranscriptionScheduler()
+
+
+def transcribe_in_process(
+    source_path,
+    model,
+    timeout_seconds,
+    model_loader=load_whisper_model,
+    gpu_batch_size=0,
+    distil=False,
+    segment_callback=None,
+    duration=None,
+):
+    """Transcribe with a cached model and return Whisper JSON-shaped data.
+
+    On CUDA, a positive ``gpu_batch_size`` decodes VAD-split 30-second windows
+    in batches, one file at a time per model through the GPU scheduler, which
+    takes shorter media (by ``duration`` in seconds) first. The audio is
+    decoded to 16 kHz PCM on the calling thread before queueing, so that CPU
+    work overlaps the file ahead of it on the GPU instead of stalling the lane.
+    Segments are decoded lazily, so ``segment_callback`` sees each one as soon
+    as it exists and the wall-clock limit is enforced between segments rather
+    than by terminating a process. Time spent queued does not count.
+    """
+    model_name = resolve_whisper_model(model, distil)
+    if gpu_batch_size > 1 and _cuda_available():
+        from faster_whisper import decode_audio
+
+        return _GPU_SCHEDULER.submit(
+            model_name,
+            _decode_in_process,
+            source_path,
+            model_name,
+            timeout_seconds,
+            model_loader,
+            gpu_batch_size,
+            segment_callback,
+            audio=decode_audio(str(source_path)),
+            priority=duration_bucket(duration),
+        ).result()
+    return _decode_in_process(source_path, model_name, timeout_seconds, model_loader, 0, segment_callback)
+
+
+def _decode_in_process(source_path, model_name, timeout_seconds, model_loader, batch_size, segment_callback, audio=None):
+    source = Path(source_path)
+    command = ("faster-whisper", str(source), "--model", model_name)
+    started_at = time.monotonic()
+    whisper_model = model_loader(model_name)
+    options = {"beam_size": WHISPER_BEAM_SIZE, "vad_filter": True}
+    if batch_size > 1:
+        whisper_model = _batched_pipeline(model_name, whisper_model)
+        options["batch_size"] = batch_size
+    else:
+        # Batched windows are already decoded independently; sequential decoding
+        # would otherwise feed one hallucinated line into every later window.
+        options["condition_on_previous_text"] = False
+    segments, info = whisper_model.transcribe(str(source) if audio is None else audio, **options)
+    text_parts = []
+    result_segments = []
+    previous_line = None
+    repeats = 0
+    for segment in segments:
+        elapsed = max(0.0, time.monotonic() - started_at)
+        if elapsed > timeout_seconds:
+            raise TranscriptionTimeout(elapsed, timeout_seconds, command)
+        line = " ".join(segment.text.lower().split()).rstrip(".!")
+        repeats = repeats + 1 if line == previous_line else 0
+        previous_line = line
+        if line in _HALLUCINATED_LINES or repeats >= _MAX_REPEATED_LINES:
+            continue
+        text_parts.append(segment.text)
+        result_segment = {
+            "id": segment.id,
+            "start": segment.start,
+            "end": segment.end,
+            "text": segment.text,
+        }
+        result_segments.append(result_segment)
+        if segment_callback:
+            segment_callback(result_segment)
+    result = {"text": "".join(text_parts).strip(), "segments": result_segments}
+    if getattr(info, "language", None):
+        result["language"] = info.language
+    return result, max(0.0, time.monotonic() - started_at)
+
+
+def transcribe_chunk_in_process(
+    chunk_path,
+    model,
+    output_dir,
+    timeout_seconds,
+    model_loader=load_whisper_model,
+    gpu_batch_size=0,
+    distil=False,
+):
+    """Long-form runner that checkpoints in-process results as Whisper JSON."""
+    data, elapsed = transcribe_in_process(
+        chunk_path,
+        model,
+        timeout_seconds,
+        model_loader=model_loader,
+        gpu_batch_size=gpu_batch_size,
+        distil=distil,
+    )
+    _write_json_atomic(Path(output_dir) / f"{Path(chunk_path).stem}.json", data)
+    return subprocess.CompletedProcess(["faster-whisper", str(chunk_path)], 0, "", ""), elapsed
+
+
+def _read_media_metadata(source_path, ffmpeg_bin, timeout_seconds, runner):
+    """Return ffmpeg's stream summary for a file, or None if it cannot run."""
     command = [
         str(ffmpeg_bin),
         "-nostdin",
@@ -104,14 +473,26 @@ def probe_media_duration(source_path, ffmpeg_bin, timeout_seconds=30, runner=sub
         )
     except (OSError, subprocess.TimeoutExpired):
         return None
-    output = f"{result.stderr or ''}\n{result.stdout or ''}"
-    match = _DURATION_PATTERN.search(output)
+    return f"{result.stderr or ''}\n{result.stdout or ''}"
+
+
+def probe_media_duration(source_path, ffmpeg_bin, timeout_seconds=30, runner=subprocess.run):
+    """Read duration from ffmpeg's metadata output without decoding the media."""
+    output = _read_media_metadata(source_path, ffmpeg_bin, timeout_seconds, runner)
+    match = _DURATION_PATTERN.search(output or "")
     if not match:
         return None
     hours, minutes, seconds = match.groups()
     return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
 
 
+def probe_audio_codec(source_path, ffmpeg_bin, timeout_seconds=30, runner=subprocess.run):
+    """Return the first audio stream's codec name (e.g. ``aac``), or None."""
+    output = _read_media_metadata(source_path, ffmpeg_bin, timeout_seconds, runner)
+    match = _AUDIO_CODEC_PATTERN.search(output or "")
+    return match.group(1) if match else None
+
+
 def checkpoint_directory(work_dir, job_id, model):
     """Return the isolated checkpoint directory for one job/model pair."""
     if not re.fullmatch(r"[A-Za-z0-9_-]+", str(job_id)):
@@ -144,18 +525,17 @@ def _source_identity(source):
     }
 
 
-def _write_manifest(path, manifest):
+def _write_json_atomic(path, value):
     temporary = path.with_suffix(".tmp")
     with temporary.open("w", encoding="utf-8") as output:
-        json.dump(manifest, output, indent=2, sort_keys=True)
+        json.dump(value, output, indent=2, sort_keys=True)
         output.flush()
         os.fsync(output.fileno())
     os.replace(temporary, path)
 
 
 def _read_json(path):
-    with Path(path).open(encoding="utf-8") as input_file:
-        value = json.load(input_file)
+    value = read_json_file(path)
     if not isinstance(value, dict):
         raise ValueError("Whisper output must be a JSON object")
     return value
@@ -221,7 +601,7 @@ def _prepare_chunks(
             chunk_seconds,
             checkpoint_dir,
         ):
-            _write_manifest(manifest_path, manifest)
+            _write_json_atomic(manifest_path, manifest)
             return manifest
 
     cleanup_checkpoint(checkpoint_dir)
@@ -320,7 +700,7 @@ def _prepare_chunks(
         "duration_seconds": offset,
         "chunks": chunks,
     }
-    _write_manifest(manifest_path, manifest)
+    _write_json_atomic(manifest_path, manifest)
     return manifest
 
 
@@ -332,15 +712,30 @@ def _find_chunk_result(chunk_path):
     return next((candidate for candidate in candidates if candidate.is_file()), None)
 
 
-def _cleanup_chunk_sidecars(chunk_path, keep_json=None):
-    candidates = [
-        chunk_path.with_suffix(extension)
-        for extension in (".json", ".srt", ".vtt", ".txt", ".tsv")
-    ]
-    candidates.append(chunk_path.parent / f"{chunk_path.name}.json")
-    for candidate in candidates:
-        if keep_json is None or candidate != keep_json:
-            candidate.unlink(missing_ok=True)
+def _cleanup_chunk_sidecars(checkpoint_dir, chunks):
+    """Delete the chunks' Whisper output in one pass over the checkpoint directory.
+
+    Completed chunks keep the result file the manifest points at; anything
+    else a run left beside a chunk is removed, so a retried chunk never
+    picks up stale output.
+    """
+    names = set()
+    for chunk in chunks:
+        chunk_path = checkpoint_dir / chunk["file"]
+        names.update(f"{chunk_path.stem}{extension}" for extension in (".json", ".srt", ".vtt", ".txt", ".tsv"))
+        names.add(f"{chunk_path.name}.json")
+    names.difference_update(chunk["file"] for chunk in chunks)
+    names.difference_update(chunk.get("result_file") for chunk in chunks if chunk.get("status") == "completed")
+    try:
+        with os.scandir(checkpoint_dir) as entries:
+            stale = [entry.path for entry in entries if entry.name in names]
+    except FileNotFoundError:
+        return
+    for path in stale:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
 
 
 def _merge_checkpoint_results(manifest, checkpoint_dir):
@@ -425,89 +820,93 @@ def transcribe_long_form(
     resumed = completed
     report("transcribing", completed, total, completed + 1 if completed < total else None, resumed)
 
-    for chunk in chunks:
-        if chunk.get("status") == "completed":
-            continue
-        chunk_number = int(chunk["index"]) + 1
-        chunk_path = checkpoint_dir / chunk["file"]
-        _cleanup_chunk_sidecars(chunk_path)
-        report("transcribing", completed, total, chunk_number, resumed)
-        try:
-            process, elapsed = whisper_runner(
-                chunk_path,
-                model,
-                checkpoint_dir,
-                chunk_timeout,
-            )
-        except TranscriptionTimeout as error:
-            total_elapsed = sum(
-                float(item.get("elapsed_seconds", 0))
-                for item in chunks
-                if item.get("status") == "completed"
-            ) + error.elapsed_seconds
-            raise LongFormTranscriptionFailure(
-                "timeout",
-                "A long-form transcription chunk timed out.",
-                elapsed_seconds=total_elapsed,
-                completed_chunks=completed,
-                total_chunks=total,
-                chunk_number=chunk_number,
-                timeout_seconds=error.timeout_seconds,
-            ) from error
-        except Exception as error:
-            raise LongFormTranscriptionFailure(
-                "exception",
-                "A long-form transcription chunk could not start.",
-                completed_chunks=completed,
-                total_chunks=total,
-                chunk_number=chunk_number,
-                technical_detail=str(error),
-            ) from error
-
-        if process.returncode != 0:
-            detail = process.stderr or process.stdout or "unknown Whisper error"
-            raise LongFormTranscriptionFailure(
-                "process_error",
-                "A long-form transcription chunk failed.",
-                elapsed_seconds=sum(
+    # Sidecars are cleared once before and once after the chunk loop rather
+    # than per chunk, which would rescan the directory for every chunk.
+    _cleanup_chunk_sidecars(checkpoint_dir, chunks)
+    try:
+        for chunk in chunks:
+            if chunk.get("status") == "completed":
+                continue
+            chunk_number = int(chunk["index"]) + 1
+            chunk_path = checkpoint_dir / chunk["file"]
+            report("transcribing", completed, total, chunk_number, resumed)
+            try:
+                process, elapsed = whisper_runner(
+                    chunk_path,
+                    model,
+                    checkpoint_dir,
+                    chunk_timeout,
+                )
+            except TranscriptionTimeout as error:
+                total_elapsed = sum(
                     float(item.get("elapsed_seconds", 0))
                     for item in chunks
                     if item.get("status") == "completed"
-                ) + elapsed,
-                completed_chunks=completed,
-                total_chunks=total,
-                chunk_number=chunk_number,
-                technical_detail=detail,
-            )
-
-        result_path = _find_chunk_result(chunk_path)
-        if not result_path:
-            raise LongFormTranscriptionFailure(
-                "output_missing",
-                "A long-form transcription chunk produced no output.",
-                completed_chunks=completed,
-                total_chunks=total,
-                chunk_number=chunk_number,
-            )
-        try:
-            _read_json(result_path)
-        except (OSError, ValueError, json.JSONDecodeError) as error:
-            raise LongFormTranscriptionFailure(
-                "output_invalid",
-                "A long-form transcription chunk produced invalid output.",
-                completed_chunks=completed,
-                total_chunks=total,
-                chunk_number=chunk_number,
-                technical_detail=str(error),
-            ) from error
-
-        chunk["status"] = "completed"
-        chunk["result_file"] = result_path.name
-        chunk["elapsed_seconds"] = max(0.0, float(elapsed))
-        completed += 1
-        _cleanup_chunk_sidecars(chunk_path, keep_json=result_path)
-        _write_manifest(manifest_path, manifest)
-        report("checkpointed", completed, total, None, resumed)
+                ) + error.elapsed_seconds
+                raise LongFormTranscriptionFailure(
+                    "timeout",
+                    "A long-form transcription chunk timed out.",
+                    elapsed_seconds=total_elapsed,
+                    completed_chunks=completed,
+                    total_chunks=total,
+                    chunk_number=chunk_number,
+                    timeout_seconds=error.timeout_seconds,
+                ) from error
+            except Exception as error:
+                raise LongFormTranscriptionFailure(
+                    "exception",
+                    "A long-form transcription chunk could not start.",
+                    completed_chunks=completed,
+                    total_chunks=total,
+                    chunk_number=chunk_number,
+                    technical_detail=str(error),
+                ) from error
+
+            if process.returncode != 0:
+                detail = process.stderr or process.stdout or "unknown Whisper error"
+                raise LongFormTranscriptionFailure(
+                    "process_error",
+                    "A long-form transcription chunk failed.",
+                    elapsed_seconds=sum(
+                        float(item.get("elapsed_seconds", 0))
+                        for item in chunks
+                        if item.get("status") == "completed"
+                    ) + elapsed,
+                    completed_chunks=completed,
+                    total_chunks=total,
+                    chunk_number=chunk_number,
+                    technical_detail=detail,
+                )
+
+            result_path = _find_chunk_result(chunk_path)
+            if not result_path:
+                raise LongFormTranscriptionFailure(
+                    "output_missing",
+                    "A long-form transcription chunk produced no output.",
+                    completed_chunks=completed,
+                    total_chunks=total,
+                    chunk_number=chunk_number,
+                )
+            try:
+                _read_json(result_path)
+            except (OSError, ValueError, json.JSONDecodeError) as error:
+                raise LongFormTranscriptionFailure(
+                    "output_invalid",
+                    "A long-form transcription chunk produced invalid output.",
+                    completed_chunks=completed,
+                    total_chunks=total,
+                    chunk_number=chunk_number,
+                    technical_detail=str(error),
+                ) from error
+
+            chunk["status"] = "completed"
+            chunk["result_file"] = result_path.name
+            chunk["elapsed_seconds"] = max(0.0, float(elapsed))
+            completed += 1
+            _write_json_atomic(manifest_path, manifest)
+            report("checkpointed", completed, total, None, resumed)
+    finally:
+        _cleanup_chunk_sidecars(checkpoint_dir, chunks)
 
     report("finalizing", total, total, None, resumed)
     try: